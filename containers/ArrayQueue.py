@@ -0,0 +1,330 @@
+"""Container: Array Queue"""
+
+from array import array
+from collections.abc import Iterable, Sized
+
+from sorting.timsort import timsort
+
+# the buffer never shrinks below this many slots; as it only ever doubles or
+# halves, its capacity stays a power of two
+MIN_CAPACITY = 8
+
+
+class ArrayQueue(Iterable, Sized):
+    """A FIFO (First In First Out) data structure implemented as a ring
+    buffer: a circular list, with the front of the queue at a moving head
+    index, that doubles in size when full and halves when a quarter full.
+    Each element costs one slot (one reference, or a single machine value
+    with typed storage) rather than a node object, and enqueue and dequeue
+    take O(1) amortized time."""
+
+    def __init__(self, typecode=None):
+        """ArrayQueue constructor
+
+        :param typecode: If given, elements are stored unboxed in an
+            array.array of this type code (e.g. 'i' or 'd') rather than a list
+        :type typecode: str
+        """
+
+        self._typecode = typecode
+        self._buf = self._allocate(MIN_CAPACITY)
+        self._blank = self._allocate(1)[0]
+        self._head = 0
+        self._cursor = None
+        self._n = 0
+
+    def __len__(self):
+        """Reports number of elements in the queue
+
+        :return: Length of queue
+        :rtype: int
+        """
+
+        return self._n
+
+    def __bool__(self):
+        """Reports if queue contains any elements
+
+        :return: False if empty, True otherwise
+        :rtype: bool
+        """
+
+        return self._n > 0
+
+    def enqueue(self, value):
+        """Adds an element to the end of the queue
+
+        :param value: Any data value (of the array type, with typed storage)
+        """
+
+        buf = self._buf
+        if self._n == len(buf):
+            self._resize(2 * len(buf))
+            buf = self._buf
+        buf[(self._head + self._n) & (len(buf) - 1)] = value
+        self._n += 1
+
+    def extend(self, values):
+        """Adds several elements to the end of the queue, in order, growing
+        the buffer at most once.
+
+        :param values: Iterable of data values
+        :type values: iterable
+        """
+
+        if self._typecode is None:
+            values = values if isinstance(values, list) else [*values]
+        else:
+            values = array(self._typecode, values)
+        k = len(values)
+        capacity = len(self._buf)
+        while capacity < self._n + k:
+            capacity *= 2
+        if capacity > len(self._buf):
+            self._resize(capacity)
+        tail = (self._head + self._n) % capacity
+        first = min(k, capacity - tail)
+        self._buf[tail:tail+first] = values[:first]
+        self._buf[:k-first] = values[first:]
+        self._n += k
+
+    def dequeue(self):
+        """Removes the first element in the queue and returns it
+
+        :return: Value of element at the front of the queue
+        :raises: Exception
+        """
+
+        if self._n == 0:
+            raise Exception("Queue is empty.")
+        buf, head = self._buf, self._head
+        value = buf[head]
+        buf[head] = self._blank
+        self._head = (head + 1) & (len(buf) - 1)
+        self._n -= 1
+        if self._n <= len(buf) >> 2:
+            self._shrink()
+        return value
+
+    def drain(self, k=None):
+        """Removes the first k elements in the queue (or all of them, if there
+        are fewer or k is None) and returns them in order
+
+        :param k: The number of elements to remove
+        :type k: int
+        :return: Values of the removed elements, front first, in an
+            array.array with typed storage
+        :rtype: list
+        :raises: ValueError
+        """
+
+        if k is None or k > self._n:
+            k = self._n
+        elif k < 0:
+            raise ValueError("Cannot drain a negative number of elements.")
+        capacity = len(self._buf)
+        first = min(k, capacity - self._head)
+        values = self._buf[self._head:self._head+first] + \
+            self._buf[:k-first]
+        if self._typecode is None:
+            self._buf[self._head:self._head+first] = [None] * first
+            self._buf[:k-first] = [None] * (k - first)
+        self._head = (self._head + k) % capacity
+        self._n -= k
+        self._shrink()
+        return values
+
+    def peek(self):
+        """Reports the value of the first element in the queue without removing
+        it.
+
+        :return: Value of element at the front of the queue
+        :raises: Exception
+        """
+
+        if not bool(self):
+            raise Exception("Queue is empty.")
+        return self._buf[self._head]
+
+    def sort(self, key=None, reverse=False):
+        """Sorts the queue in place, front-to-back, with timsort
+
+        :param key: Function computing the comparison key of an element
+        :type key: function
+        :param reverse: Sort in descending order
+        :type reverse: bool
+        """
+
+        self._resize(len(self._buf))
+        values = self._buf[:self._n]
+        self._buf[:self._n] = timsort(values, True, key, reverse)
+
+    def __iter__(self):
+        """Iterates over the queue, front-to-back
+
+        :return: Queue
+        """
+
+        self._cursor = 0
+        return self
+
+    def __next__(self):
+        """Helps __iter__() to iterate
+
+        :raises: StopIteration
+        """
+
+        if self._cursor >= self._n:
+            raise StopIteration
+        value = self._buf[(self._head + self._cursor) % len(self._buf)]
+        self._cursor += 1
+        return value
+
+    def _allocate(self, capacity):
+        """Creates an empty buffer
+
+        :param capacity: The number of slots
+        :type capacity: int
+        :return: A list of None, or a zeroed array.array with typed storage
+        :rtype: list
+        """
+
+        if self._typecode is None:
+            return [None] * capacity
+        return array(self._typecode,
+                     bytes(array(self._typecode).itemsize * capacity))
+
+    def _resize(self, capacity):
+        """Moves the elements to a new buffer, front first
+
+        :param capacity: The number of slots, at least the length
+        :type capacity: int
+        """
+
+        buf = self._allocate(capacity)
+        first = min(self._n, len(self._buf) - self._head)
+        buf[:first] = self._buf[self._head:self._head+first]
+        buf[first:self._n] = self._buf[:self._n-first]
+        self._buf = buf
+        self._head = 0
+
+    def _shrink(self):
+        """Halves the buffer while it is at most a quarter full"""
+
+        capacity = len(self._buf)
+        while capacity > MIN_CAPACITY and self._n <= capacity // 4:
+            capacity //= 2
+        if capacity < len(self._buf):
+            self._resize(capacity)
+
+
+if __name__ == "__main__":
+
+    import sys
+    import unittest
+
+    from containers.Queue import Queue
+
+
+    class TestArrayQueue(unittest.TestCase):
+
+        def setUp(self):
+            self.queue = ArrayQueue()
+            self.queue.enqueue("m")
+            self.queue.enqueue("c")
+            self.queue.enqueue("s")
+            self.queue.enqueue("t")
+            self.queue.enqueue("b")
+            self.queue.enqueue("y")
+
+        def test_len(self):
+            self.assertEqual(6, len(self.queue))
+            self.assertEqual(0, len(ArrayQueue()))
+
+        def test_bool(self):
+            self.assertTrue(bool(self.queue))
+            self.assertFalse(bool(ArrayQueue()))
+
+        def test_enqueue(self):
+            self.queue.enqueue("a")
+            self.assertEqual(7, len(self.queue))
+
+        def test_dequeue(self):
+            for i, letter in enumerate("mcstby"):
+                self.assertEqual(letter, self.queue.dequeue())
+                self.assertEqual(5 - i, len(self.queue))
+            self.assertRaises(Exception, self.queue.dequeue)
+            self.assertRaises(Exception, ArrayQueue().dequeue)
+
+        def test_peek(self):
+            self.assertEqual('m', self.queue.peek())
+            self.assertRaises(Exception, ArrayQueue().peek)
+
+        def test_wrap_resize(self):
+            expected = [*"mcstby"]
+            for i in range(1000):
+                self.queue.enqueue(i)
+                expected.append(i)
+                if i % 3 == 0:
+                    self.assertEqual(expected.pop(0), self.queue.dequeue())
+            self.assertEqual(expected, list(self.queue))
+            self.assertEqual(1024, len(self.queue._buf))
+            self.assertEqual(expected[:600], self.queue.drain(600))
+            self.assertEqual(expected[600:], list(self.queue))
+            self.assertEqual(256, len(self.queue._buf))
+            self.assertEqual(expected[600:], self.queue.drain())
+            self.assertEqual(MIN_CAPACITY, len(self.queue._buf))
+            self.assertEqual([], self.queue.drain(1))
+            self.assertRaises(ValueError, self.queue.drain, -1)
+
+        def test_extend(self):
+            self.queue.dequeue()
+            self.queue.extend("abc")
+            self.queue.extend(x for x in "de")
+            self.queue.extend([*range(20)])
+            self.assertEqual([*"cstbyabcde", *range(20)], list(self.queue))
+            self.assertEqual([*"cstbyab"], self.queue.drain(7))
+            self.assertEqual(23, len(self.queue))
+
+        def test_typed(self):
+            queue = ArrayQueue('d')
+            queue.extend(range(100))
+            queue.enqueue(0.5)
+            self.assertEqual(0.0, queue.dequeue())
+            self.assertEqual(array('d', range(1, 50)), queue.drain(49))
+            self.assertEqual([*range(50, 100), 0.5], list(queue))
+            self.assertRaises(TypeError, queue.enqueue, "a")
+            queue.sort()
+            self.assertEqual([0.5, *range(50, 100)], list(queue))
+
+            ints = ArrayQueue('i')
+            ints.extend(range(10**5))
+            nodes = 10**5 * sys.getsizeof(Queue._Node(0))
+            self.assertLess(sys.getsizeof(ints._buf), nodes // 4)
+
+        def test_sort(self):
+            self.queue.sort()
+            self.assertEqual(['b', 'c', 'm', 's', 't', 'y'], list(self.queue))
+            self.queue.enqueue("a")
+            self.assertEqual("b", self.queue.dequeue())
+            self.queue.sort(reverse=True)
+            self.assertEqual(['y', 't', 's', 'm', 'c', 'a'], list(self.queue))
+            self.queue.sort(key=lambda x: x in "aeiou")
+            self.assertEqual(['y', 't', 's', 'm', 'c', 'a'], list(self.queue))
+            self.assertEqual(6, len(self.queue))
+
+            queue = ArrayQueue()
+            queue.sort()
+            queue.enqueue("a")
+            self.assertEqual(["a"], list(queue))
+
+        def test_iter(self):
+            letters = ['m', 'c', 's', 't', 'b', 'y']
+            self.assertEqual(letters, list(self.queue))
+            self.assertEqual(letters, [x for x in self.queue])
+            self.assertEqual(letters, [*self.queue])
+
+            self.assertEqual([], list(ArrayQueue()))
+
+
+    unittest.main()
@@ -0,0 +1,309 @@
+"""Container: Array Stack"""
+
+from array import array
+from collections.abc import Iterable, Sized
+
+from sorting.timsort import timsort
+
+# the buffer never shrinks below this many slots
+MIN_CAPACITY = 8
+
+
+class ArrayStack(Iterable, Sized):
+    """A LIFO (Last In First Out) data structure implemented as a dynamic
+    array: a list with the top of the stack at its end, that doubles in size
+    when full and halves when a quarter full. Each element costs one slot
+    (one reference, or a single machine value with typed storage) rather than
+    a node object, and push and pop take O(1) amortized time."""
+
+    def __init__(self, typecode=None):
+        """ArrayStack constructor
+
+        :param typecode: If given, elements are stored unboxed in an
+            array.array of this type code (e.g. 'i' or 'd') rather than a list
+        :type typecode: str
+        """
+
+        self._typecode = typecode
+        self._buf = self._allocate(MIN_CAPACITY)
+        self._blank = self._allocate(1)[0]
+        self._cursor = None
+        self._n = 0
+
+    def __len__(self):
+        """Reports number of elements on the stack
+
+        :return: Length of stack
+        :rtype: int
+        """
+
+        return self._n
+
+    def __bool__(self):
+        """Reports if stack contains any elements
+
+        :return: False if empty, True otherwise
+        :rtype: bool
+        """
+
+        return self._n > 0
+
+    def push(self, value):
+        """Adds an element to the top of the stack
+
+        :param value: Any data value (of the array type, with typed storage)
+        """
+
+        if self._n == len(self._buf):
+            self._resize(2 * len(self._buf))
+        self._buf[self._n] = value
+        self._n += 1
+
+    def extend(self, values):
+        """Pushes several elements onto the stack, in order, so the last ends
+        up on top, growing the buffer at most once.
+
+        :param values: Iterable of data values
+        :type values: iterable
+        """
+
+        if self._typecode is None:
+            values = values if isinstance(values, list) else [*values]
+        else:
+            values = array(self._typecode, values)
+        k = len(values)
+        capacity = len(self._buf)
+        while capacity < self._n + k:
+            capacity *= 2
+        if capacity > len(self._buf):
+            self._resize(capacity)
+        self._buf[self._n:self._n+k] = values
+        self._n += k
+
+    def pop(self):
+        """Removes the top element from the stack and returns it
+
+        :return: Value of element on top of the stack
+        :raises: Exception
+        """
+
+        if self._n == 0:
+            raise Exception("Stack is empty.")
+        buf = self._buf
+        self._n = n = self._n - 1
+        value = buf[n]
+        buf[n] = self._blank
+        if n <= len(buf) >> 2:
+            self._shrink()
+        return value
+
+    def drain(self, k=None):
+        """Removes the top k elements from the stack (or all of them, if there
+        are fewer or k is None) and returns them in the order they would be
+        popped
+
+        :param k: The number of elements to remove
+        :type k: int
+        :return: Values of the removed elements, top first, in an array.array
+            with typed storage
+        :rtype: list
+        :raises: ValueError
+        """
+
+        if k is None or k > self._n:
+            k = self._n
+        elif k < 0:
+            raise ValueError("Cannot drain a negative number of elements.")
+        self._n -= k
+        values = self._buf[self._n:self._n+k]
+        values.reverse()
+        if self._typecode is None:
+            self._buf[self._n:self._n+k] = [None] * k
+        self._shrink()
+        return values
+
+    def peek(self):
+        """Reports the value of the top element on the stack without removing
+        it.
+
+        :return: Value of element on top of the stack
+        :raises: Exception
+        """
+
+        if not bool(self):
+            raise Exception("Stack is empty.")
+        return self._buf[self._n-1]
+
+    def sort(self, key=None, reverse=False):
+        """Sorts the stack in place, top-to-bottom, with timsort
+
+        :param key: Function computing the comparison key of an element
+        :type key: function
+        :param reverse: Sort in descending order
+        :type reverse: bool
+        """
+
+        values = self._buf[:self._n]
+        values.reverse()
+        timsort(values, True, key, reverse)
+        values.reverse()
+        self._buf[:self._n] = values
+
+    def __iter__(self):
+        """Iterates over the stack, top-to-bottom"""
+
+        self._cursor = self._n
+        return self
+
+    def __next__(self):
+        """Helps __iter__() to iterate
+
+        :raises: StopIteration
+        """
+
+        if self._cursor <= 0:
+            raise StopIteration
+        self._cursor -= 1
+        return self._buf[self._cursor]
+
+    def _allocate(self, capacity):
+        """Creates an empty buffer
+
+        :param capacity: The number of slots
+        :type capacity: int
+        :return: A list of None, or a zeroed array.array with typed storage
+        :rtype: list
+        """
+
+        if self._typecode is None:
+            return [None] * capacity
+        return array(self._typecode,
+                     bytes(array(self._typecode).itemsize * capacity))
+
+    def _resize(self, capacity):
+        """Moves the elements to a new buffer, bottom first
+
+        :param capacity: The number of slots, at least the length
+        :type capacity: int
+        """
+
+        buf = self._allocate(capacity)
+        buf[:self._n] = self._buf[:self._n]
+        self._buf = buf
+
+    def _shrink(self):
+        """Halves the buffer while it is at most a quarter full"""
+
+        capacity = len(self._buf)
+        while capacity > MIN_CAPACITY and self._n <= capacity // 4:
+            capacity //= 2
+        if capacity < len(self._buf):
+            self._resize(capacity)
+
+
+if __name__ == "__main__":
+
+    import sys
+    import unittest
+
+    from containers.Stack import Stack
+
+
+    class TestArrayStack(unittest.TestCase):
+
+        def setUp(self):
+            self.stack = ArrayStack()
+            self.stack.push("m")
+            self.stack.push("c")
+            self.stack.push("s")
+            self.stack.push("t")
+            self.stack.push("b")
+            self.stack.push("y")
+
+        def test_len(self):
+            self.assertEqual(6, len(self.stack))
+            self.assertEqual(0, len(ArrayStack()))
+
+        def test_bool(self):
+            self.assertTrue(bool(self.stack))
+            self.assertFalse(bool(ArrayStack()))
+
+        def test_push(self):
+            self.stack.push("a")
+            self.assertEqual(7, len(self.stack))
+
+        def test_pop(self):
+            for i, letter in enumerate("ybtscm"):
+                self.assertEqual(letter, self.stack.pop())
+                self.assertEqual(5 - i, len(self.stack))
+            self.assertRaises(Exception, self.stack.pop)
+            self.assertRaises(Exception, ArrayStack().pop)
+
+        def test_peek(self):
+            self.assertEqual('y', self.stack.peek())
+            self.assertRaises(Exception, ArrayStack().peek)
+
+        def test_resize(self):
+            expected = [*"mcstby"]
+            for i in range(1000):
+                self.stack.push(i)
+                expected.append(i)
+                if i % 3 == 0:
+                    self.assertEqual(expected.pop(), self.stack.pop())
+            self.assertEqual(expected[::-1], list(self.stack))
+            self.assertEqual(1024, len(self.stack._buf))
+            self.assertEqual(expected[:-601:-1], self.stack.drain(600))
+            self.assertEqual(expected[-601::-1], list(self.stack))
+            self.assertEqual(256, len(self.stack._buf))
+            self.assertEqual(expected[-601::-1], self.stack.drain())
+            self.assertEqual(MIN_CAPACITY, len(self.stack._buf))
+            self.assertEqual([], self.stack.drain(1))
+            self.assertRaises(ValueError, self.stack.drain, -1)
+
+        def test_extend(self):
+            self.stack.pop()
+            self.stack.extend("abc")
+            self.stack.extend(x for x in "de")
+            self.stack.extend([*range(20)])
+            self.assertEqual([*range(19, -1, -1), *"edcbabtscm"],
+                             list(self.stack))
+            self.assertEqual([19, 18, 17], self.stack.drain(3))
+            self.assertEqual(27, len(self.stack))
+
+        def test_typed(self):
+            stack = ArrayStack('d')
+            stack.extend(range(100))
+            stack.push(0.5)
+            self.assertEqual(0.5, stack.pop())
+            self.assertEqual(array('d', range(99, 50, -1)), stack.drain(49))
+            self.assertEqual([*range(50, -1, -1)], list(stack))
+            self.assertRaises(TypeError, stack.push, "a")
+            stack.sort()
+            self.assertEqual([*range(51)], list(stack))
+
+            ints = ArrayStack('i')
+            ints.extend(range(10**5))
+            nodes = 10**5 * sys.getsizeof(Stack._Node(0, None))
+            self.assertLess(sys.getsizeof(ints._buf), nodes // 4)
+
+        def test_sort(self):
+            self.stack.sort()
+            self.assertEqual(['b', 'c', 'm', 's', 't', 'y'], list(self.stack))
+            self.assertEqual("b", self.stack.pop())
+            self.stack.sort(reverse=True)
+            self.assertEqual(['y', 't', 's', 'm', 'c'], list(self.stack))
+            self.assertEqual(5, len(self.stack))
+            self.stack.sort(key=lambda x: x in "aeiou")
+            self.assertEqual(['y', 't', 's', 'm', 'c'], list(self.stack))
+            ArrayStack().sort()
+
+        def test_iter(self):
+            letters = ['y', 'b', 't', 's', 'c', 'm']
+            self.assertEqual(letters, list(self.stack))
+            self.assertEqual(letters, [x for x in self.stack])
+            self.assertEqual(letters, [*self.stack])
+
+            self.assertEqual([], list(ArrayStack()))
+
+
+    unittest.main()
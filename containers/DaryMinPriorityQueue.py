@@ -0,0 +1,436 @@
+"""Container: d-ary Minimum Priority Queue"""
+
+
+class DaryMinPriorityQueue:
+    """A minimum priority queue using a heap-ordered list in which every node
+    has d children (4 by default), which makes the heap half as deep as a
+    binary one. Each priority is kept with its value in a single entry, so
+    re-ordering the heap moves one reference per level instead of swapping
+    two lists in lockstep, and the heap position of every value is tracked
+    so that finding one takes O(1) time. Each value may be queued at most
+    once."""
+
+    def __init__(self, arity=4):
+        """DaryMinPriorityQueue constructor.
+
+        :param arity: Number of children of each heap node
+        :type arity: int
+        :raises: ValueError
+        """
+
+        if arity < 2:
+            raise ValueError("The heap arity must be at least 2.")
+        self._d = arity
+        self._heap = []
+        self._index = {}
+
+    @classmethod
+    def from_iterable(cls, pairs, arity=4):
+        """Builds a priority queue from (value, priority) pairs all at once,
+        heap ordering them bottom-up in O(n) time.
+
+        :param pairs: Iterable of (value, priority) pairs
+        :type pairs: iterable
+        :param arity: Number of children of each heap node
+        :type arity: int
+        :return: The new priority queue
+        :rtype: DaryMinPriorityQueue
+        """
+
+        pq = cls(arity)
+        pq.enqueue_many(pairs)
+        return pq
+
+    def __len__(self):
+        """Reports number of elements in the priority queue
+
+        :return: Length of priority queue
+        :rtype: int
+        """
+
+        return len(self._heap)
+
+    def __bool__(self):
+        """Reports if priority queue contains any elements
+
+        :return: False if empty, True otherwise
+        :rtype: bool
+        """
+
+        return len(self._heap) > 0
+
+    def enqueue(self, value, i):
+        """Adds an element to the priority queue, re-ordering the heap as
+        necessary.
+
+        :param value: Any hashable data value not already queued
+        :param i: The priority of the item
+        :type i: numeric
+        :raises: ValueError
+        """
+
+        if value in self._index:
+            raise ValueError(
+                "Value `{}` is already in the priority queue.".format(value))
+        self._heap.append([i, value])
+        self._swim(len(self._heap) - 1)
+
+    def enqueue_many(self, pairs):
+        """Adds several elements to the priority queue. When they are at least
+        as many as the elements already queued, the whole heap is re-ordered
+        bottom-up in one O(n) pass; otherwise each is swum into place. If any
+        value is already queued, or given twice, none is added.
+
+        :param pairs: Iterable of (value, priority) pairs
+        :type pairs: iterable
+        :raises: ValueError
+        """
+
+        pairs = [*pairs]
+        _check_distinct(self._index, pairs)
+        n = len(self._heap)
+        for value, i in pairs:
+            self._index[value] = len(self._heap)
+            self._heap.append([i, value])
+        if len(self._heap) - n >= n:
+            for k in range((len(self._heap) - 2) // self._d, -1, -1):
+                self._sink(k)
+        else:
+            for k in range(n, len(self._heap)):
+                self._swim(k)
+
+    def dequeue(self):
+        """Removes the first element in the priority queue and returns it,
+        re-ordering the heap as necessary.
+
+        :return: Value of element at the front of the queue
+        :raises: Exception
+        """
+
+        if not bool(self):
+            raise Exception("{} is empty.".format(type(self).__name__))
+        return self._remove(0)
+
+    def dequeue_many(self, k):
+        """Removes the first k elements in the priority queue (or all of them,
+        if there are fewer) and returns them in order.
+
+        :param k: The number of elements to remove
+        :type k: int
+        :return: Values of the removed elements, front first
+        :rtype: list
+        """
+
+        return [self._remove(0) for _ in range(min(k, len(self._heap)))]
+
+    def pushpop(self, value, i):
+        """Adds an element, then removes the first element and returns it, with
+        at most one pass down the heap.
+
+        :param value: Any hashable data value not already queued
+        :param i: The priority of the item
+        :type i: numeric
+        :return: Value of element at the front of the queue
+        """
+
+        if not bool(self) or not self._heap[0][0] < i:
+            return value
+        return self.replace(value, i)
+
+    def replace(self, value, i):
+        """Removes the first element, then adds an element, with a single pass
+        down the heap, and returns the removed element's value.
+
+        :param value: Any hashable data value not already queued
+        :param i: The priority of the item
+        :type i: numeric
+        :return: Value of element at the front of the queue
+        :raises: Exception
+        """
+
+        if not bool(self):
+            raise Exception("{} is empty.".format(type(self).__name__))
+        if value in self._index:
+            raise ValueError(
+                "Value `{}` is already in the priority queue.".format(value))
+        front = self._heap[0][1]
+        del self._index[front]
+        self._heap[0] = [i, value]
+        self._sink(0)
+        return front
+
+    def peek(self):
+        """Reports the value of the first element in the priority queue without
+        removing it.
+
+        :return: Value of element at the front of the queue
+        :raises: Exception
+        """
+
+        if not bool(self):
+            raise Exception("{} is empty.".format(type(self).__name__))
+        return self._heap[0][1]
+
+    def priority(self, value):
+        """Reports the priority associated with given value.
+
+        :param value: Value of element to look up
+        :return: Its priority
+        :raises: ValueError
+        """
+
+        return self._heap[self._position(value)][0]
+
+    def update_priority(self, value, i):
+        """Modifies the priority associated with given value.
+
+        :param value: Value of element to change priority of
+        :param i: New priority
+        :type i: numeric
+        :raises: ValueError
+        """
+
+        k = self._position(value)
+        self._heap[k][0] = i
+        self._swim(k)
+        self._sink(self._index[value])
+
+    def decrease_key(self, value, i):
+        """Lowers the priority associated with given value.
+
+        :param value: Value of element to change priority of
+        :param i: New priority, no greater than the current one
+        :type i: numeric
+        :raises: ValueError
+        """
+
+        k = self._position(value)
+        entry = self._heap[k]
+        if entry[0] < i:
+            raise ValueError(
+                "Priority `{}` is greater than `{}`.".format(i, entry[0]))
+        entry[0] = i
+        self._swim(k)
+
+    def delete(self, value):
+        """Removes given value from the priority queue.
+
+        :param value: Value of element to remove
+        :raises: ValueError
+        """
+
+        self._remove(self._position(value))
+
+    def __contains__(self, value):
+        """Determines if a value is in the priority queue.
+
+        :param value: Value of element to search for
+        :return: True if value is in priority queue, otherwise False
+        :rtype: bool
+        """
+
+        return value in self._index
+
+    def _position(self, value):
+        """Finds the heap index of a value.
+
+        :param value: Value of element to search for
+        :return: Its heap index
+        :rtype: int
+        :raises: ValueError
+        """
+
+        if value not in self._index:
+            raise ValueError(
+                "Value `{}` is not in the priority queue.".format(value))
+        return self._index[value]
+
+    def _remove(self, k):
+        """Removes the element at a heap index, re-ordering the heap as
+        necessary.
+
+        :param k: The heap index to remove
+        :type k: int
+        :return: Value of the removed element
+        """
+
+        value = self._heap[k][1]
+        del self._index[value]
+        last = self._heap.pop()
+        if k < len(self._heap):
+            self._heap[k] = last
+            self._swim(k)
+            self._sink(self._index[last[1]])
+        return value
+
+    def _swim(self, k):
+        """Re-orders the heap from the bottom up, moving the entry at k up
+        until its parent has no greater priority.
+
+        :param k: The heap index to start re-ordering from
+        :type k: int
+        """
+
+        heap, index, d = self._heap, self._index, self._d
+        entry = heap[k]
+        i = entry[0]
+        while k > 0:
+            parent = (k - 1) // d
+            if not i < heap[parent][0]:
+                break
+            heap[k] = heap[parent]
+            index[heap[k][1]] = k
+            k = parent
+        heap[k] = entry
+        index[entry[1]] = k
+
+    def _sink(self, k):
+        """Re-orders the heap from the top down, moving the entry at k down
+        until none of its children has a lower priority.
+
+        :param k: The heap index to start re-ordering from
+        :type k: int
+        """
+
+        heap, index, d = self._heap, self._index, self._d
+        n = len(heap)
+        entry = heap[k]
+        i = entry[0]
+        while True:
+            first = k * d + 1
+            if first >= n:
+                break
+            child, lowest = first, heap[first][0]
+            for c in range(first + 1, min(first + d, n)):
+                if heap[c][0] < lowest:
+                    child, lowest = c, heap[c][0]
+            if not lowest < i:
+                break
+            heap[k] = heap[child]
+            index[heap[k][1]] = k
+            k = child
+        heap[k] = entry
+        index[entry[1]] = k
+
+
+def _check_distinct(queued, pairs):
+    """Checks the values of a batch are distinct and not already queued.
+
+    :param queued: The values already queued
+    :type queued: dict
+    :param pairs: The (value, priority) pairs to add
+    :type pairs: list
+    :raises: ValueError
+    """
+
+    seen = set()
+    for value, _ in pairs:
+        if value in queued or value in seen:
+            raise ValueError(
+                "Value `{}` is already in the priority queue.".format(value))
+        seen.add(value)
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from random import randrange, shuffle
+
+
+    class TestDaryMinPriorityQueue(unittest.TestCase):
+
+        def setUp(self):
+            self.pq = DaryMinPriorityQueue()
+            self.pq.enqueue('c', 3)
+            self.pq.enqueue('d', 4)
+            self.pq.enqueue('b', 2)
+            self.pq.enqueue('g', 7)
+            self.pq.enqueue('f', 6)
+
+        def test_len(self):
+            self.assertEqual(5, len(self.pq))
+            self.assertEqual(0, len(DaryMinPriorityQueue()))
+            self.assertRaises(ValueError, DaryMinPriorityQueue, 1)
+
+        def test_bool(self):
+            self.assertTrue(bool(self.pq))
+            self.assertFalse(bool(DaryMinPriorityQueue()))
+
+        def test_enqueue(self):
+            self.pq.enqueue('a', 1)
+            self.assertEqual(6, len(self.pq))
+            self.assertEqual("a", self.pq.peek())
+            self.assertRaises(ValueError, self.pq.enqueue, 'a', 0)
+
+        def test_dequeue(self):
+            for letter in "bcdfg":
+                self.assertEqual(letter, self.pq.dequeue())
+            self.assertEqual(0, len(self.pq))
+            self.assertRaises(Exception, self.pq.dequeue)
+
+        def test_peek(self):
+            self.assertEqual("b", self.pq.peek())
+            self.assertRaises(Exception, DaryMinPriorityQueue().peek)
+
+        def test_update_priority(self):
+            self.pq.update_priority('d', 1)
+            self.assertEqual("d", self.pq.peek())
+            self.pq.update_priority('d', 5)
+            self.assertEqual(5, self.pq.priority('d'))
+            self.assertEqual(['b', 'c', 'd', 'f', 'g'],
+                             self.pq.dequeue_many(5))
+            self.assertRaises(ValueError, self.pq.update_priority, 'z', 3)
+
+        def test_decrease_key_delete(self):
+            self.pq.decrease_key('g', 0)
+            self.assertEqual("g", self.pq.peek())
+            self.assertRaises(ValueError, self.pq.decrease_key, 'f', 9)
+            self.pq.delete('c')
+            self.assertFalse('c' in self.pq)
+            self.assertEqual(['g', 'b', 'd', 'f'], self.pq.dequeue_many(9))
+            self.assertRaises(ValueError, self.pq.delete, 'c')
+
+        def test_batch(self):
+            pairs = [(x, x % 97) for x in range(1000)]
+            shuffle(pairs)
+            for arity in (2, 3, 4, 8):
+                pq = DaryMinPriorityQueue.from_iterable(pairs, arity)
+                self.assertEqual(sorted(x % 97 for x in range(1000)),
+                                 [x % 97 for x in pq.dequeue_many(1000)])
+            self.pq.enqueue_many([('a', 1), ('e', 5)])
+            self.assertEqual('a', self.pq.pushpop('z', 9))
+            self.assertEqual('y', self.pq.pushpop('y', 0))
+            self.assertEqual('b', self.pq.replace('h', 8))
+            self.assertEqual([*"cdefghz"], self.pq.dequeue_many(9))
+
+        def test_enqueue_many_duplicate(self):
+            self.pq.enqueue('a', 5)
+            self.assertRaises(ValueError, self.pq.enqueue_many,
+                              [('x', 1), ('a', 0)])
+            self.assertRaises(ValueError, self.pq.enqueue_many,
+                              [('h', 1), ('h', 0)])
+            self.assertEqual(6, len(self.pq))
+            self.assertFalse('x' in self.pq or 'h' in self.pq)
+            self.assertEqual([*"bcdafg"], self.pq.dequeue_many(9))
+
+        def test_random(self):
+            pq = DaryMinPriorityQueue()
+            priorities = {}
+            for _ in range(2000):
+                v = randrange(200)
+                if v not in pq:
+                    priorities[v] = randrange(1000)
+                    pq.enqueue(v, priorities[v])
+                elif randrange(3):
+                    priorities[v] = randrange(1000)
+                    pq.update_priority(v, priorities[v])
+                else:
+                    pq.delete(v)
+                    del priorities[v]
+            result = []
+            while pq:
+                result.append(priorities[pq.dequeue()])
+            self.assertEqual(sorted(priorities.values()), result)
+
+
+    unittest.main()
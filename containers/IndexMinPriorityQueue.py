@@ -0,0 +1,332 @@
+"""Container: Indexed Minimum Priority Queue"""
+
+
+class IndexMinPriorityQueue:
+    """A minimum priority queue using a heap-ordered list, which also keeps
+    the heap position of every value. Finding a value therefore takes O(1)
+    time, so changing its priority or deleting it takes O(logn) rather than a
+    linear scan. Each value may be queued at most once."""
+
+    def __init__(self, capacity=None):
+        """IndexMinPriorityQueue constructor.
+
+        :param capacity: If given, values must be integers in
+            range(capacity), whose positions are then kept in a list rather
+            than a dict
+        :type capacity: int
+        """
+
+        self._pq = [None]
+        self._values = [None]
+        self._n = 0
+        self._dense = capacity is not None
+        self._index = [None] * capacity if self._dense else {}
+
+    def __len__(self):
+        """Reports number of elements in the priority queue
+
+        :return: Length of priority queue
+        :rtype: int
+        """
+
+        return self._n
+
+    def __bool__(self):
+        """Reports if priority queue contains any elements
+
+        :return: False if empty, True otherwise
+        :rtype: bool
+        """
+
+        return self._n > 0
+
+    def enqueue(self, value, i):
+        """Adds an element to the priority queue, re-ordering the heap as
+        necessary.
+
+        :param value: Any hashable data value not already queued
+        :param i: The priority of the item
+        :type i: numeric
+        :raises: ValueError
+        """
+
+        if self._dense and not 0 <= value < len(self._index):
+            raise ValueError("Value `{}` is not in range({})."
+                             .format(value, len(self._index)))
+        if value in self:
+            raise ValueError(
+                "Value `{}` is already in the priority queue.".format(value))
+        self._pq.append(i)
+        self._values.append(value)
+        self._n += 1
+        self._index[value] = self._n
+        self._swim(self._n)
+
+    def dequeue(self):
+        """Removes the first element in the priority queue and returns it,
+        re-ordering the heap as necessary.
+
+        :return: Value of element at the front of the queue
+        :raises: Exception
+        """
+
+        if not bool(self):
+            raise Exception("{} is empty.".format(type(self).__name__))
+        value = self._values[1]
+        self._remove(1)
+        return value
+
+    def peek(self):
+        """Reports the value of the first element in the priority queue without
+        removing it.
+
+        :return: Value of element at the front of the queue
+        :raises: Exception
+        """
+
+        if not bool(self):
+            raise Exception("{} is empty.".format(type(self).__name__))
+        return self._values[1]
+
+    def priority(self, value):
+        """Reports the priority associated with given value.
+
+        :param value: Value of element to look up
+        :return: Its priority
+        :raises: ValueError
+        """
+
+        return self._pq[self._position(value)]
+
+    def update_priority(self, value, i):
+        """Modifies the priority associated with given value.
+
+        :param value: Value of element to change priority of
+        :param i: New priority
+        :type i: numeric
+        :raises: ValueError
+        """
+
+        k = self._position(value)
+        self._pq[k] = i
+        self._swim(k)
+        self._sink(self._index[value])
+
+    def decrease_key(self, value, i):
+        """Lowers the priority associated with given value.
+
+        :param value: Value of element to change priority of
+        :param i: New priority, no greater than the current one
+        :type i: numeric
+        :raises: ValueError
+        """
+
+        k = self._position(value)
+        if self._pq[k] < i:
+            raise ValueError("Priority `{}` is greater than `{}`."
+                             .format(i, self._pq[k]))
+        self._pq[k] = i
+        self._swim(k)
+
+    def delete(self, value):
+        """Removes given value from the priority queue.
+
+        :param value: Value of element to remove
+        :raises: ValueError
+        """
+
+        self._remove(self._position(value))
+
+    def __contains__(self, value):
+        """Determines if a value is in the priority queue.
+
+        :param value: Value of element to search for
+        :return: True if value is in priority queue, otherwise False
+        :rtype: bool
+        """
+
+        if self._dense:
+            return 0 <= value < len(self._index) and \
+                self._index[value] is not None
+        return value in self._index
+
+    def _position(self, value):
+        """Finds the heap index of a value.
+
+        :param value: Value of element to search for
+        :return: Its heap index
+        :rtype: int
+        :raises: ValueError
+        """
+
+        if value not in self:
+            raise ValueError(
+                "Value `{}` is not in the priority queue.".format(value))
+        return self._index[value]
+
+    def _remove(self, k):
+        """Removes the element at a heap index, re-ordering the heap as
+        necessary.
+
+        :param k: The heap index to remove
+        :type k: int
+        """
+
+        self._swap(k, self._n)
+        value = self._values.pop()
+        self._pq.pop()
+        self._n -= 1
+        if self._dense:
+            self._index[value] = None
+        else:
+            del self._index[value]
+        if k <= self._n:
+            moved = self._values[k]
+            self._swim(k)
+            self._sink(self._index[moved])
+
+    def _swap(self, j, k):
+        """Exchanges two heap elements, keeping track of their positions.
+
+        :param j: A heap index
+        :type j: int
+        :param k: Another heap index
+        :type k: int
+        """
+
+        self._pq[j], self._pq[k] = self._pq[k], self._pq[j]
+        self._values[j], self._values[k] = self._values[k], self._values[j]
+        self._index[self._values[j]] = j
+        self._index[self._values[k]] = k
+
+    def _swim(self, k):
+        """Re-orders the heap from the bottom up.
+
+        :param k: The heap index to start re-ordering from
+        :type k: int
+        """
+
+        while k > 1 and self._pq[k//2] > self._pq[k]:
+            self._swap(k//2, k)
+            k //= 2
+
+    def _sink(self, k):
+        """Re-orders the heap from the top down.
+
+        :param k: The heap index to start re-ordering from
+        :type k: int
+        """
+
+        while k * 2 <= self._n:
+            j = k * 2
+            if j < self._n and self._pq[j] > self._pq[j+1]:
+                j += 1
+            if not self._pq[k] > self._pq[j]:
+                break
+            self._swap(k, j)
+            k = j
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from random import randrange, shuffle
+
+
+    class TestIndexMinPriorityQueue(unittest.TestCase):
+
+        def setUp(self):
+            self.pq = IndexMinPriorityQueue()
+            self.pq.enqueue('c', 3)
+            self.pq.enqueue('d', 4)
+            self.pq.enqueue('b', 2)
+            self.pq.enqueue('g', 7)
+            self.pq.enqueue('f', 6)
+
+        def test_len(self):
+            self.assertEqual(5, len(self.pq))
+            self.assertEqual(0, len(IndexMinPriorityQueue()))
+
+        def test_bool(self):
+            self.assertTrue(bool(self.pq))
+            self.assertFalse(bool(IndexMinPriorityQueue()))
+
+        def test_enqueue(self):
+            self.pq.enqueue('a', 1)
+            self.assertEqual(6, len(self.pq))
+            self.assertEqual("a", self.pq.peek())
+            self.assertRaises(ValueError, self.pq.enqueue, 'a', 0)
+
+        def test_dequeue(self):
+            for letter in "bcdfg":
+                self.assertEqual(letter, self.pq.dequeue())
+            self.assertEqual(0, len(self.pq))
+            self.assertFalse('b' in self.pq)
+            self.assertRaises(Exception, self.pq.dequeue)
+
+        def test_peek(self):
+            self.assertEqual("b", self.pq.peek())
+            self.assertRaises(Exception, IndexMinPriorityQueue().peek)
+
+        def test_update_priority(self):
+            self.pq.update_priority('d', 1)
+            self.assertEqual("d", self.pq.peek())
+            self.pq.update_priority('d', 5)
+            self.assertEqual("b", self.pq.peek())
+            self.assertEqual(5, self.pq.priority('d'))
+            self.assertEqual(['b', 'c', 'd', 'f', 'g'],
+                             [self.pq.dequeue() for _ in range(5)])
+            self.assertRaises(ValueError, self.pq.update_priority, 'z', 3)
+
+        def test_decrease_key(self):
+            self.pq.decrease_key('g', 0)
+            self.assertEqual("g", self.pq.peek())
+            self.assertRaises(ValueError, self.pq.decrease_key, 'f', 9)
+            self.assertRaises(ValueError, self.pq.decrease_key, 'z', 1)
+
+        def test_delete(self):
+            self.pq.delete('b')
+            self.pq.delete('f')
+            self.assertEqual(['c', 'd', 'g'],
+                             [self.pq.dequeue() for _ in range(3)])
+            self.assertRaises(ValueError, self.pq.delete, 'b')
+
+        def test_contains(self):
+            self.assertTrue('b' in self.pq)
+            self.assertFalse('z' in self.pq)
+
+        def test_dense(self):
+            pq = IndexMinPriorityQueue(100)
+            priorities = [randrange(50) for _ in range(100)]
+            values = [*range(100)]
+            shuffle(values)
+            for v in values:
+                pq.enqueue(v, priorities[v])
+            for v in range(0, 100, 3):
+                pq.update_priority(v, priorities[v] - 25)
+                priorities[v] -= 25
+            for v in range(1, 100, 7):
+                pq.delete(v)
+                priorities[v] = None
+            self.assertFalse(1 in pq)
+            self.assertFalse(100 in pq)
+            self.assertFalse(-1 in pq)
+            result = []
+            while pq:
+                result.append(priorities[pq.dequeue()])
+            self.assertEqual(sorted(p for p in priorities if p is not None),
+                             result)
+
+        def test_dense_range(self):
+            pq = IndexMinPriorityQueue(5)
+            self.assertRaises(ValueError, pq.enqueue, -1, 3)
+            self.assertRaises(ValueError, pq.enqueue, 5, 3)
+            self.assertRaises(ValueError, pq.enqueue, 7, 3)
+            self.assertEqual(0, len(pq))
+            pq.enqueue(4, 2)
+            pq.enqueue(0, 1)
+            self.assertEqual(2, len(pq))
+            self.assertEqual([0, 4], [pq.dequeue(), pq.dequeue()])
+
+
+    unittest.main()
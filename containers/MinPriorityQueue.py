@@ -11,6 +11,22 @@ class MinPriorityQueue:
         self._values = [None]
         self._n = 0
 
+    @classmethod
+    def from_iterable(cls, pairs):
+        """Builds a priority queue from (value, priority) pairs all at once,
+        heap ordering them bottom-up in O(n) time rather than the O(nlogn) of
+        enqueueing them one by one.
+
+        :param pairs: Iterable of (value, priority) pairs
+        :type pairs: iterable
+        :return: The new priority queue
+        :rtype: MinPriorityQueue
+        """
+
+        pq = cls()
+        pq.enqueue_many(pairs)
+        return pq
+
     def __len__(self):
         """Reports number of elements in the priority queue
 
@@ -43,6 +59,30 @@ class MinPriorityQueue:
         self._n += 1
         self._swim(self._n)
 
+    def enqueue_many(self, pairs):
+        """Adds several elements to the priority queue. When they are at least
+        as many as the elements already queued, the whole heap is re-ordered
+        bottom-up in one O(n) pass; otherwise each is swum into place. If any
+        pair is malformed, none is added.
+
+        :param pairs: Iterable of (value, priority) pairs
+        :type pairs: iterable
+        :raises: ValueError
+        """
+
+        pairs = [(value, i) for value, i in pairs]
+        n = self._n
+        for value, i in pairs:
+            self._pq.append(i)
+            self._values.append(value)
+        self._n = len(self._pq) - 1
+        if self._n - n >= n:
+            for k in range(self._n // 2, 0, -1):
+                self._sink(k)
+        else:
+            for k in range(n + 1, self._n + 1):
+                self._swim(k)
+
     def dequeue(self):
         """Removes the first element in the priority queue and returns it,
         re-ordering the heap as necessary.
@@ -64,6 +104,63 @@ class MinPriorityQueue:
         self._sink(1)
         return value
 
+    def dequeue_many(self, k):
+        """Removes the first k elements in the priority queue (or all of them,
+        if there are fewer) and returns them in order.
+
+        :param k: The number of elements to remove
+        :type k: int
+        :return: Values of the removed elements, front first
+        :rtype: list
+        """
+
+        values = []
+        for _ in range(min(k, self._n)):
+            values.append(self._values[1])
+            self._pq[1] = self._pq[self._n]
+            self._values[1] = self._values[self._n]
+            del self._pq[self._n]
+            del self._values[self._n]
+            self._n -= 1
+            self._sink(1)
+        return values
+
+    def pushpop(self, value, i):
+        """Adds an element, then removes the first element and returns it, with
+        at most one pass down the heap. If the new element would come first,
+        the heap is not touched at all.
+
+        :param value: Any data value
+        :param i: The priority of the item
+        :type i: numeric
+        :return: Value of element at the front of the queue
+        """
+
+        if not bool(self) or not self._pq[1] < i:
+            return value
+        front = self._values[1]
+        self._pq[1], self._values[1] = i, value
+        self._sink(1)
+        return front
+
+    def replace(self, value, i):
+        """Removes the first element, then adds an element, with a single pass
+        down the heap, and returns the removed element's value.
+
+        :param value: Any data value
+        :param i: The priority of the item
+        :type i: numeric
+        :return: Value of element at the front of the queue
+        :raises: Exception
+        """
+
+        if not bool(self):
+            raise Exception("{} is empty.".format(type(self).__name__))
+        front = self._values[1]
+        self._pq[1], self._values[1] = i, value
+        self._sink(1)
+        return front
+
     def peek(self):
         """Reports the value of the first element in the priority queue without
         removing it.
@@ -203,6 +300,50 @@ if __name__ == "__main__":
 
             self.assertRaises(ValueError, self.pq.update_priority, 'z', 3)
 
+        def test_from_iterable(self):
+            pairs = [(x, x % 97) for x in range(1000)]
+            pq = MinPriorityQueue.from_iterable(iter(pairs))
+            self.assertEqual(1000, len(pq))
+            result = [pq.dequeue() % 97 for _ in range(1000)]
+            self.assertEqual(sorted(x % 97 for x in range(1000)), result)
+            self.assertEqual(0, len(MinPriorityQueue.from_iterable([])))
+
+        def test_enqueue_many(self):
+            self.pq.enqueue_many([('a', 1), ('e', 5)])
+            self.assertEqual(7, len(self.pq))
+            self.pq.enqueue_many((c, ord(c) - 96) for c in "hijklmnop")
+            self.assertEqual([*"abcdefghijklmnop"],
+                             [self.pq.dequeue() for _ in range(16)])
+
+        def test_enqueue_many_malformed(self):
+            self.assertRaises(ValueError, self.pq.enqueue_many,
+                              [('a', 0), ('z',)])
+            self.assertEqual(5, len(self.pq))
+            self.pq.enqueue('e', 5)
+            self.assertEqual([*"bcdefg"], self.pq.dequeue_many(10))
+
+        def test_dequeue_many(self):
+            self.assertEqual(['b', 'c'], self.pq.dequeue_many(2))
+            self.assertEqual(3, len(self.pq))
+            self.assertEqual(['d', 'f', 'g'], self.pq.dequeue_many(5))
+            self.assertEqual([], self.pq.dequeue_many(1))
+
+        def test_pushpop(self):
+            self.assertEqual('a', self.pq.pushpop('a', 1))
+            self.assertEqual(5, len(self.pq))
+            self.assertEqual('b', self.pq.pushpop('e', 5))
+            self.assertEqual(5, len(self.pq))
+            self.assertEqual(['c', 'd', 'e', 'f', 'g'],
+                             self.pq.dequeue_many(5))
+            self.assertEqual('z', MinPriorityQueue().pushpop('z', 0))
+
+        def test_replace(self):
+            self.assertEqual('b', self.pq.replace('h', 8))
+            self.assertEqual(5, len(self.pq))
+            self.assertEqual(['c', 'd', 'f', 'g', 'h'],
+                             self.pq.dequeue_many(5))
+            self.assertRaises(Exception, self.pq.replace, 'a', 1)
+
         def test_contains(self):
             self.assertTrue('b' in self.pq)
             self.assertFalse('z' in self.pq)
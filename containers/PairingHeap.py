@@ -0,0 +1,453 @@
+"""Container: Pairing Heap"""
+
+from containers.DaryMinPriorityQueue import _check_distinct
+
+
+class PairingHeap:
+    """A minimum priority queue using a pairing heap: a tree in which every
+    node ranks no lower than its parent, each node linking to its first child
+    and next sibling. Adding an element or melding two heaps just links two
+    roots in O(1) time, and lowering a priority cuts the element's subtree
+    off and links it back to the root, also in O(1), leaving all the
+    restructuring to dequeue, which pairs up the root's children in two
+    passes in O(logn) amortized time. The node of every value is tracked, so
+    each value may be queued at most once."""
+
+    class _Node:
+        """A data node in a pairing heap, linked to its first child, its next
+        sibling and its previous sibling (or parent, if it is a first child)"""
+
+        __slots__ = 'value', 'priority', 'child', 'sibling', 'prev'
+
+        def __init__(self, value, priority):
+            self.value = value
+            self.priority = priority
+            self.child = self.sibling = self.prev = None
+
+    def __init__(self):
+        """PairingHeap constructor."""
+
+        self._root = None
+        self._nodes = {}
+
+    @classmethod
+    def from_iterable(cls, pairs):
+        """Builds a priority queue from (value, priority) pairs, in O(n) time.
+
+        :param pairs: Iterable of (value, priority) pairs
+        :type pairs: iterable
+        :return: The new priority queue
+        :rtype: PairingHeap
+        """
+
+        pq = cls()
+        pq.enqueue_many(pairs)
+        return pq
+
+    def __len__(self):
+        """Reports number of elements in the priority queue
+
+        :return: Length of priority queue
+        :rtype: int
+        """
+
+        return len(self._nodes)
+
+    def __bool__(self):
+        """Reports if priority queue contains any elements
+
+        :return: False if empty, True otherwise
+        :rtype: bool
+        """
+
+        return self._root is not None
+
+    def enqueue(self, value, i):
+        """Adds an element to the priority queue, linking it to the root.
+
+        :param value: Any hashable data value not already queued
+        :param i: The priority of the item
+        :type i: numeric
+        :raises: ValueError
+        """
+
+        if value in self._nodes:
+            raise ValueError(
+                "Value `{}` is already in the priority queue.".format(value))
+        node = self._Node(value, i)
+        self._nodes[value] = node
+        self._root = self._link(self._root, node)
+
+    def enqueue_many(self, pairs):
+        """Adds several elements to the priority queue. If any value is
+        already queued, or given twice, none is added.
+
+        :param pairs: Iterable of (value, priority) pairs
+        :type pairs: iterable
+        :raises: ValueError
+        """
+
+        pairs = [*pairs]
+        _check_distinct(self._nodes, pairs)
+        for value, i in pairs:
+            self.enqueue(value, i)
+
+    def meld(self, other):
+        """Moves every element of another pairing heap into this one, in O(1)
+        time besides merging their value lookups, leaving the other empty.
+
+        :param other: A pairing heap sharing no value with this one
+        :type other: PairingHeap
+        :raises: ValueError
+        """
+
+        if other is self:
+            return
+        if not self._nodes.keys().isdisjoint(other._nodes):
+            raise ValueError("The priority queues share values.")
+        if len(self._nodes) < len(other._nodes):
+            self._nodes, other._nodes = other._nodes, self._nodes
+        self._nodes.update(other._nodes)
+        self._root = self._link(self._root, other._root)
+        other._root = None
+        other._nodes = {}
+
+    def dequeue(self):
+        """Removes the first element in the priority queue and returns it,
+        pairing up the root's children into the new root.
+
+        :return: Value of element at the front of the queue
+        :raises: Exception
+        """
+
+        if not bool(self):
+            raise Exception("{} is empty.".format(type(self).__name__))
+        root = self._root
+        del self._nodes[root.value]
+        self._root = self._merge_pairs(root.child)
+        return root.value
+
+    def dequeue_many(self, k):
+        """Removes the first k elements in the priority queue (or all of them,
+        if there are fewer) and returns them in order.
+
+        :param k: The number of elements to remove
+        :type k: int
+        :return: Values of the removed elements, front first
+        :rtype: list
+        """
+
+        return [self.dequeue() for _ in range(min(k, len(self._nodes)))]
+
+    def pushpop(self, value, i):
+        """Adds an element, then removes the first element and returns it,
+        skipping the heap altogether when the new element would come first.
+
+        :param value: Any hashable data value not already queued
+        :param i: The priority of the item
+        :type i: numeric
+        :return: Value of element at the front of the queue
+        """
+
+        if not bool(self) or not self._root.priority < i:
+            return value
+        return self.replace(value, i)
+
+    def replace(self, value, i):
+        """Removes the first element, then adds an element, and returns the
+        removed element's value.
+
+        :param value: Any hashable data value not already queued
+        :param i: The priority of the item
+        :type i: numeric
+        :return: Value of element at the front of the queue
+        :raises: Exception
+        """
+
+        if not bool(self):
+            raise Exception("{} is empty.".format(type(self).__name__))
+        if value in self._nodes:
+            raise ValueError(
+                "Value `{}` is already in the priority queue.".format(value))
+        front = self.dequeue()
+        self.enqueue(value, i)
+        return front
+
+    def peek(self):
+        """Reports the value of the first element in the priority queue without
+        removing it.
+
+        :return: Value of element at the front of the queue
+        :raises: Exception
+        """
+
+        if not bool(self):
+            raise Exception("{} is empty.".format(type(self).__name__))
+        return self._root.value
+
+    def priority(self, value):
+        """Reports the priority associated with given value.
+
+        :param value: Value of element to look up
+        :return: Its priority
+        :raises: ValueError
+        """
+
+        return self._node(value).priority
+
+    def update_priority(self, value, i):
+        """Modifies the priority associated with given value: a lower priority
+        is a decrease_key(), a higher one re-queues the value.
+
+        :param value: Value of element to change priority of
+        :param i: New priority
+        :type i: numeric
+        :raises: ValueError
+        """
+
+        node = self._node(value)
+        if not node.priority < i:
+            self.decrease_key(value, i)
+        else:
+            self.delete(value)
+            self.enqueue(value, i)
+
+    def decrease_key(self, value, i):
+        """Lowers the priority associated with given value, cutting its
+        subtree off and linking it to the root.
+
+        :param value: Value of element to change priority of
+        :param i: New priority, no greater than the current one
+        :type i: numeric
+        :raises: ValueError
+        """
+
+        node = self._node(value)
+        if node.priority < i:
+            raise ValueError(
+                "Priority `{}` is greater than `{}`.".format(i, node.priority))
+        node.priority = i
+        if node is not self._root:
+            self._cut(node)
+            self._root = self._link(self._root, node)
+
+    def delete(self, value):
+        """Removes given value from the priority queue.
+
+        :param value: Value of element to remove
+        :raises: ValueError
+        """
+
+        node = self._node(value)
+        if node is self._root:
+            self.dequeue()
+            return
+        self._cut(node)
+        del self._nodes[value]
+        self._root = self._link(self._root, self._merge_pairs(node.child))
+
+    def __contains__(self, value):
+        """Determines if a value is in the priority queue.
+
+        :param value: Value of element to search for
+        :return: True if value is in priority queue, otherwise False
+        :rtype: bool
+        """
+
+        return value in self._nodes
+
+    def _node(self, value):
+        """Finds the node of a value.
+
+        :param value: Value of element to search for
+        :return: Its node
+        :rtype: _Node
+        :raises: ValueError
+        """
+
+        if value not in self._nodes:
+            raise ValueError(
+                "Value `{}` is not in the priority queue.".format(value))
+        return self._nodes[value]
+
+    @staticmethod
+    def _link(a, b):
+        """Links two trees, making the root ranked lower the first child of
+        the other; a wins ties.
+
+        :param a: The root of a tree, or None
+        :type a: _Node
+        :param b: The root of another tree, or None
+        :type b: _Node
+        :return: The root of the linked tree
+        :rtype: _Node
+        """
+
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.priority < a.priority:
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        return a
+
+    @staticmethod
+    def _cut(node):
+        """Detaches a node, with its subtree, from its parent and siblings.
+
+        :param node: A node other than the root
+        :type node: _Node
+        """
+
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.prev = node.sibling = None
+
+    def _merge_pairs(self, first):
+        """Links a list of sibling trees into one: pairs them up left to
+        right, then links the pairs right to left.
+
+        :param first: The first of the siblings, or None
+        :type first: _Node
+        :return: The root of the linked tree, or None
+        :rtype: _Node
+        """
+
+        pairs = []
+        while first is not None:
+            a, b = first, first.sibling
+            first = None if b is None else b.sibling
+            a.prev = a.sibling = None
+            if b is not None:
+                b.prev = b.sibling = None
+            pairs.append(self._link(a, b))
+        root = None
+        for tree in reversed(pairs):
+            root = self._link(tree, root)
+        return root
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from random import randrange, shuffle
+
+
+    class TestPairingHeap(unittest.TestCase):
+
+        def setUp(self):
+            self.pq = PairingHeap()
+            self.pq.enqueue('c', 3)
+            self.pq.enqueue('d', 4)
+            self.pq.enqueue('b', 2)
+            self.pq.enqueue('g', 7)
+            self.pq.enqueue('f', 6)
+
+        def test_len(self):
+            self.assertEqual(5, len(self.pq))
+            self.assertEqual(0, len(PairingHeap()))
+
+        def test_bool(self):
+            self.assertTrue(bool(self.pq))
+            self.assertFalse(bool(PairingHeap()))
+
+        def test_enqueue(self):
+            self.pq.enqueue('a', 1)
+            self.assertEqual(6, len(self.pq))
+            self.assertEqual("a", self.pq.peek())
+            self.assertRaises(ValueError, self.pq.enqueue, 'a', 0)
+
+        def test_dequeue(self):
+            for letter in "bcdfg":
+                self.assertEqual(letter, self.pq.dequeue())
+            self.assertEqual(0, len(self.pq))
+            self.assertFalse('b' in self.pq)
+            self.assertRaises(Exception, self.pq.dequeue)
+
+        def test_peek(self):
+            self.assertEqual("b", self.pq.peek())
+            self.assertRaises(Exception, PairingHeap().peek)
+
+        def test_update_priority(self):
+            self.pq.update_priority('d', 1)
+            self.assertEqual("d", self.pq.peek())
+            self.pq.update_priority('d', 5)
+            self.assertEqual(5, self.pq.priority('d'))
+            self.assertEqual(['b', 'c', 'd', 'f', 'g'],
+                             self.pq.dequeue_many(5))
+            self.assertRaises(ValueError, self.pq.update_priority, 'z', 3)
+
+        def test_decrease_key_delete(self):
+            self.pq.decrease_key('g', 0)
+            self.assertEqual("g", self.pq.peek())
+            self.assertRaises(ValueError, self.pq.decrease_key, 'f', 9)
+            self.pq.delete('c')
+            self.pq.delete('g')
+            self.assertFalse('c' in self.pq)
+            self.assertEqual(['b', 'd', 'f'], self.pq.dequeue_many(9))
+            self.assertRaises(ValueError, self.pq.delete, 'c')
+
+        def test_meld(self):
+            other = PairingHeap.from_iterable([('a', 5), ('e', 1)])
+            self.pq.meld(other)
+            self.assertEqual(7, len(self.pq))
+            self.assertFalse(other)
+            self.assertEqual([*"ebcdafg"], self.pq.dequeue_many(9))
+            self.pq.enqueue('z', 2)
+            self.assertRaises(ValueError, self.pq.meld,
+                              PairingHeap.from_iterable([('z', 1)]))
+
+        def test_batch(self):
+            pairs = [(x, x % 97) for x in range(1000)]
+            shuffle(pairs)
+            pq = PairingHeap.from_iterable(pairs)
+            self.assertEqual(sorted(x % 97 for x in range(1000)),
+                             [x % 97 for x in pq.dequeue_many(1000)])
+            self.pq.enqueue_many([('a', 1), ('e', 5)])
+            self.assertEqual('a', self.pq.pushpop('z', 9))
+            self.assertEqual('y', self.pq.pushpop('y', 0))
+            self.assertEqual('b', self.pq.replace('h', 8))
+            self.assertEqual([*"cdefghz"], self.pq.dequeue_many(9))
+
+        def test_enqueue_many_duplicate(self):
+            self.pq.enqueue('a', 5)
+            self.assertRaises(ValueError, self.pq.enqueue_many,
+                              [('x', 1), ('a', 0)])
+            self.assertRaises(ValueError, self.pq.enqueue_many,
+                              [('h', 1), ('h', 0)])
+            self.assertEqual(6, len(self.pq))
+            self.assertFalse('x' in self.pq or 'h' in self.pq)
+            self.assertEqual([*"bcdafg"], self.pq.dequeue_many(9))
+
+        def test_random(self):
+            pq = PairingHeap()
+            priorities = {}
+            for _ in range(2000):
+                v = randrange(200)
+                if v not in pq:
+                    priorities[v] = randrange(1000)
+                    pq.enqueue(v, priorities[v])
+                elif randrange(2):
+                    priorities[v] = randrange(1000)
+                    pq.update_priority(v, priorities[v])
+                elif randrange(2):
+                    pq.delete(v)
+                    del priorities[v]
+                else:
+                    del priorities[pq.dequeue()]
+            result = []
+            while pq:
+                result.append(priorities[pq.dequeue()])
+            self.assertEqual(sorted(priorities.values()), result)
+
+
+    unittest.main()
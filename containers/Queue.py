@@ -2,6 +2,8 @@
 
 from collections.abc import Iterable, Sized
 
+from sorting.linked_list_sort import linked_list_sort
+
 
 class Queue(Iterable, Sized):
     """A FIFO (First In First Out) data structure implemented as a singly
@@ -62,6 +64,16 @@ class Queue(Iterable, Sized):
         self._tail = new_tail
         self._n += 1
 
+    def extend(self, values):
+        """Adds several elements to the end of the queue, in order
+
+        :param values: Iterable of data values
+        :type values: iterable
+        """
+
+        for value in values:
+            self.enqueue(value)
+
     def dequeue(self):
         """Removes the first element in the queue and returns it
 
@@ -79,6 +91,23 @@ class Queue(Iterable, Sized):
             self._tail = None
         return prev_head.value
 
+    def drain(self, k=None):
+        """Removes the first k elements in the queue (or all of them, if there
+        are fewer or k is None) and returns them in order
+
+        :param k: The number of elements to remove
+        :type k: int
+        :return: Values of the removed elements, front first
+        :rtype: list
+        :raises: ValueError
+        """
+
+        if k is None or k > self._n:
+            k = self._n
+        elif k < 0:
+            raise ValueError("Cannot drain a negative number of elements.")
+        return [self.dequeue() for _ in range(k)]
+
     def peek(self):
         """Reports the value of the first element in the queue without removing
         it.
@@ -91,6 +120,17 @@ class Queue(Iterable, Sized):
             raise Exception("Queue is empty.")
         return self._head.value
 
+    def sort(self, key=None, reverse=False):
+        """Sorts the queue in place, front-to-back, by relinking its nodes
+
+        :param key: Function computing the comparison key of an element
+        :type key: function
+        :param reverse: Sort in descending order
+        :type reverse: bool
+        """
+
+        self._head, self._tail = linked_list_sort(self._head, key, reverse)
+
     def __iter__(self):
         """Iterates over the queue, front-to-back
 
@@ -167,6 +207,30 @@ if __name__ == "__main__":
             self.assertEqual('m', self.queue.peek())
             self.assertRaises(Exception, Queue().peek)
 
+        def test_extend_drain(self):
+            self.queue.extend("ab")
+            self.queue.extend(x for x in "cd")
+            self.assertEqual([*"mcs"], self.queue.drain(3))
+            self.assertEqual([*"tbyabcd"], self.queue.drain())
+            self.assertEqual([], self.queue.drain(1))
+            self.assertRaises(ValueError, self.queue.drain, -1)
+
+        def test_sort(self):
+            self.queue.sort()
+            self.assertEqual(['b', 'c', 'm', 's', 't', 'y'], list(self.queue))
+            self.queue.enqueue("a")
+            self.assertEqual("b", self.queue.dequeue())
+            self.queue.sort(reverse=True)
+            self.assertEqual(['y', 't', 's', 'm', 'c', 'a'], list(self.queue))
+            self.queue.sort(key=lambda x: x in "aeiou")
+            self.assertEqual(['y', 't', 's', 'm', 'c', 'a'], list(self.queue))
+            self.assertEqual(6, len(self.queue))
+
+            queue = Queue()
+            queue.sort()
+            queue.enqueue("a")
+            self.assertEqual(["a"], list(queue))
+
         def test_iter(self):
             letters = ['m', 'c', 's', 't', 'b', 'y']
             self.assertEqual(letters, list(self.queue))
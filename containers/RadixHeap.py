@@ -0,0 +1,321 @@
+"""Container: Radix Heap"""
+
+
+class RadixHeap:
+    """A monotone minimum priority queue for non-negative integer priorities,
+    such as the distances of Dijkstra's algorithm on a graph with integer
+    edge weights. An element with priority k waits in the bucket numbered by
+    the highest bit in which k differs from the last priority dequeued, so
+    nothing is ever compared on the way in. When the lowest bucket runs dry,
+    the next non-empty bucket is scanned for its lowest priority, which
+    becomes the new last priority, and its elements are spread over the lower
+    buckets. Each element moves down at most once per bit, so enqueue takes
+    O(1) time and dequeue O(logC) amortized, C being the largest priority.
+
+    A priority may never be lower than the last priority dequeued; peek()
+    counts as dequeuing here, as it moves the last priority up to the lowest
+    queued. Each value may be queued at most once."""
+
+    def __init__(self):
+        """RadixHeap constructor."""
+
+        self._buckets = [{}]
+        self._keys = {}
+        self._last = 0
+
+    @classmethod
+    def from_iterable(cls, pairs):
+        """Builds a priority queue from (value, priority) pairs, in O(n) time.
+
+        :param pairs: Iterable of (value, priority) pairs
+        :type pairs: iterable
+        :return: The new priority queue
+        :rtype: RadixHeap
+        """
+
+        pq = cls()
+        pq.enqueue_many(pairs)
+        return pq
+
+    def __len__(self):
+        """Reports number of elements in the priority queue
+
+        :return: Length of priority queue
+        :rtype: int
+        """
+
+        return len(self._keys)
+
+    def __bool__(self):
+        """Reports if priority queue contains any elements
+
+        :return: False if empty, True otherwise
+        :rtype: bool
+        """
+
+        return len(self._keys) > 0
+
+    def enqueue(self, value, i):
+        """Adds an element to the priority queue.
+
+        :param value: Any hashable data value not already queued
+        :param i: The priority of the item, an integer (or integral float) no
+            lower than the last priority dequeued
+        :type i: int
+        :raises: ValueError
+        """
+
+        if value in self._keys:
+            raise ValueError(
+                "Value `{}` is already in the priority queue.".format(value))
+        self._insert(value, self._key(i))
+
+    def enqueue_many(self, pairs):
+        """Adds several elements to the priority queue.
+
+        :param pairs: Iterable of (value, priority) pairs
+        :type pairs: iterable
+        :raises: ValueError
+        """
+
+        for value, i in pairs:
+            self.enqueue(value, i)
+
+    def dequeue(self):
+        """Removes the first element in the priority queue and returns it.
+        Elements of equal priority leave in the order they were queued.
+
+        :return: Value of element at the front of the queue
+        :raises: Exception
+        """
+
+        if not bool(self):
+            raise Exception("{} is empty.".format(type(self).__name__))
+        bucket = self._settle()
+        value = next(iter(bucket))
+        del bucket[value]
+        del self._keys[value]
+        return value
+
+    def dequeue_many(self, k):
+        """Removes the first k elements in the priority queue (or all of them,
+        if there are fewer) and returns them in order.
+
+        :param k: The number of elements to remove
+        :type k: int
+        :return: Values of the removed elements, front first
+        :rtype: list
+        """
+
+        return [self.dequeue() for _ in range(min(k, len(self._keys)))]
+
+    def peek(self):
+        """Reports the value of the first element in the priority queue without
+        removing it.
+
+        :return: Value of element at the front of the queue
+        :raises: Exception
+        """
+
+        if not bool(self):
+            raise Exception("{} is empty.".format(type(self).__name__))
+        return next(iter(self._settle()))
+
+    def priority(self, value):
+        """Reports the priority associated with given value.
+
+        :param value: Value of element to look up
+        :return: Its priority
+        :rtype: int
+        :raises: ValueError
+        """
+
+        if value not in self._keys:
+            raise ValueError(
+                "Value `{}` is not in the priority queue.".format(value))
+        return self._keys[value]
+
+    def update_priority(self, value, i):
+        """Modifies the priority associated with given value.
+
+        :param value: Value of element to change priority of
+        :param i: New priority, no lower than the last priority dequeued
+        :type i: int
+        :raises: ValueError
+        """
+
+        k = self._key(i)
+        self.delete(value)
+        self._insert(value, k)
+
+    def decrease_key(self, value, i):
+        """Lowers the priority associated with given value.
+
+        :param value: Value of element to change priority of
+        :param i: New priority, no greater than the current one and no lower
+            than the last priority dequeued
+        :type i: int
+        :raises: ValueError
+        """
+
+        if self.priority(value) < i:
+            raise ValueError("Priority `{}` is greater than `{}`."
+                             .format(i, self._keys[value]))
+        self.update_priority(value, i)
+
+    def delete(self, value):
+        """Removes given value from the priority queue.
+
+        :param value: Value of element to remove
+        :raises: ValueError
+        """
+
+        k = self.priority(value)
+        del self._buckets[(k ^ self._last).bit_length()][value]
+        del self._keys[value]
+
+    def __contains__(self, value):
+        """Determines if a value is in the priority queue.
+
+        :param value: Value of element to search for
+        :return: True if value is in priority queue, otherwise False
+        :rtype: bool
+        """
+
+        return value in self._keys
+
+    def _key(self, i):
+        """Checks a priority is an integer no lower than the last priority
+        dequeued.
+
+        :param i: The priority to check
+        :type i: int
+        :return: The priority as an int
+        :rtype: int
+        :raises: ValueError
+        """
+
+        k = int(i)
+        if k != i or k < self._last:
+            raise ValueError("Priority `{}` is not an integer no lower than "
+                             "`{}`.".format(i, self._last))
+        return k
+
+    def _insert(self, value, k):
+        """Puts a value into the bucket for its priority.
+
+        :param value: The value, not already queued
+        :param k: Its priority, an int no lower than the last priority
+        :type k: int
+        """
+
+        b = (k ^ self._last).bit_length()
+        while b >= len(self._buckets):
+            self._buckets.append({})
+        self._buckets[b][value] = None
+        self._keys[value] = k
+
+    def _settle(self):
+        """Makes sure the lowest bucket holds the elements of lowest priority,
+        spreading out the next non-empty bucket if it is empty.
+
+        :return: The lowest bucket, which must not end up empty
+        :rtype: dict
+        """
+
+        buckets = self._buckets
+        if not buckets[0]:
+            b = 1
+            while not buckets[b]:
+                b += 1
+            bucket, buckets[b] = buckets[b], {}
+            keys = self._keys
+            self._last = last = min(map(keys.__getitem__, bucket))
+            for value in bucket:
+                buckets[(keys[value] ^ last).bit_length()][value] = None
+        return buckets[0]
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from random import randrange
+
+
+    class TestRadixHeap(unittest.TestCase):
+
+        def setUp(self):
+            self.pq = RadixHeap()
+            self.pq.enqueue('c', 3)
+            self.pq.enqueue('d', 4)
+            self.pq.enqueue('b', 2)
+            self.pq.enqueue('g', 7)
+            self.pq.enqueue('f', 6)
+
+        def test_len(self):
+            self.assertEqual(5, len(self.pq))
+            self.assertEqual(0, len(RadixHeap()))
+
+        def test_bool(self):
+            self.assertTrue(bool(self.pq))
+            self.assertFalse(bool(RadixHeap()))
+
+        def test_enqueue(self):
+            self.pq.enqueue('a', 1.0)
+            self.assertEqual(6, len(self.pq))
+            self.assertEqual("a", self.pq.peek())
+            self.assertRaises(ValueError, self.pq.enqueue, 'a', 0)
+            self.assertRaises(ValueError, self.pq.enqueue, 'h', 1.5)
+            self.assertRaises(ValueError, self.pq.enqueue, 'h', -1)
+
+        def test_dequeue(self):
+            for letter in "bcdfg":
+                self.assertEqual(letter, self.pq.dequeue())
+            self.assertEqual(0, len(self.pq))
+            self.assertFalse('b' in self.pq)
+            self.assertRaises(Exception, self.pq.dequeue)
+            self.assertRaises(ValueError, self.pq.enqueue, 'a', 6)
+
+        def test_peek(self):
+            self.assertEqual("b", self.pq.peek())
+            self.assertRaises(Exception, RadixHeap().peek)
+
+        def test_update_priority(self):
+            self.pq.update_priority('d', 1)
+            self.assertEqual("d", self.pq.peek())
+            self.pq.update_priority('d', 5)
+            self.assertEqual(5, self.pq.priority('d'))
+            self.assertEqual(['b', 'c', 'd', 'f', 'g'],
+                             self.pq.dequeue_many(5))
+            self.assertRaises(ValueError, self.pq.update_priority, 'z', 3)
+
+        def test_decrease_key_delete(self):
+            self.pq.decrease_key('g', 0)
+            self.assertEqual("g", self.pq.dequeue())
+            self.assertRaises(ValueError, self.pq.decrease_key, 'f', 9)
+            self.pq.delete('c')
+            self.assertFalse('c' in self.pq)
+            self.assertEqual(['b', 'd', 'f'], self.pq.dequeue_many(9))
+            self.assertRaises(ValueError, self.pq.delete, 'c')
+
+        def test_monotone(self):
+            pq = RadixHeap()
+            priorities = {}
+            result = []
+            for _ in range(5000):
+                last = result[-1] if result else 0
+                v = randrange(300)
+                if v not in pq:
+                    priorities[v] = last + randrange(1000)
+                    pq.enqueue(v, priorities[v])
+                elif randrange(2):
+                    priorities[v] = last + randrange(priorities[v] - last + 1)
+                    pq.decrease_key(v, priorities[v])
+                else:
+                    result.append(priorities[pq.dequeue()])
+            while pq:
+                result.append(priorities[pq.dequeue()])
+            self.assertEqual(sorted(result), result)
+
+
+    unittest.main()
@@ -2,6 +2,8 @@
 
 from collections.abc import Iterable, Sized
 
+from sorting.linked_list_sort import linked_list_sort
+
 
 class Stack(Iterable, Sized):
     """A LIFO (Last In First Out) data structure implemented as a singly
@@ -57,6 +59,17 @@ class Stack(Iterable, Sized):
         self._head = self._Node(value, self._head)
         self._n += 1
 
+    def extend(self, values):
+        """Pushes several elements onto the stack, in order, so the last ends
+        up on top
+
+        :param values: Iterable of data values
+        :type values: iterable
+        """
+
+        for value in values:
+            self.push(value)
+
     def pop(self):
         """Removes the top element from the stack and returns it
 
@@ -72,6 +85,24 @@ class Stack(Iterable, Sized):
         self._n -= 1
         return prev_head.value
 
+    def drain(self, k=None):
+        """Removes the top k elements from the stack (or all of them, if there
+        are fewer or k is None) and returns them in the order they would be
+        popped
+
+        :param k: The number of elements to remove
+        :type k: int
+        :return: Values of the removed elements, top first
+        :rtype: list
+        :raises: ValueError
+        """
+
+        if k is None or k > self._n:
+            k = self._n
+        elif k < 0:
+            raise ValueError("Cannot drain a negative number of elements.")
+        return [self.pop() for _ in range(k)]
+
     def peek(self):
         """Reports the value of the top element on the stack without removing
         it.
@@ -84,6 +115,17 @@ class Stack(Iterable, Sized):
             raise Exception("Stack is empty.")
         return self._head.value
 
+    def sort(self, key=None, reverse=False):
+        """Sorts the stack in place, top-to-bottom, by relinking its nodes
+
+        :param key: Function computing the comparison key of an element
+        :type key: function
+        :param reverse: Sort in descending order
+        :type reverse: bool
+        """
+
+        self._head, _ = linked_list_sort(self._head, key, reverse)
+
     def __iter__(self):
         """Iterates over the stack, top-to-bottom"""
 
@@ -157,6 +199,23 @@ if __name__ == "__main__":
             self.assertEqual('y', self.stack.peek())
             self.assertRaises(Exception, Stack().peek)
 
+        def test_extend_drain(self):
+            self.stack.extend("ab")
+            self.stack.extend(x for x in "cd")
+            self.assertEqual([*"dcb"], self.stack.drain(3))
+            self.assertEqual([*"aybtscm"], self.stack.drain())
+            self.assertEqual([], self.stack.drain(1))
+            self.assertRaises(ValueError, self.stack.drain, -1)
+
+        def test_sort(self):
+            self.stack.sort()
+            self.assertEqual(['b', 'c', 'm', 's', 't', 'y'], list(self.stack))
+            self.assertEqual("b", self.stack.pop())
+            self.stack.sort(reverse=True)
+            self.assertEqual(['y', 't', 's', 'm', 'c'], list(self.stack))
+            self.assertEqual(5, len(self.stack))
+            Stack().sort()
+
         def test_iter(self):
             letters = ['y', 'b', 't', 's', 'c', 'm']
             self.assertEqual(letters, list(self.stack))
@@ -9,21 +9,25 @@ class KruskalMST:
     """An EdgeWeightedGraph client that finds the minimum spanning tree for the
     graph. Uses Kruskal's algorithm."""
 
-    def __init__(self, G):
+    def __init__(self, G, queue=MinPriorityQueue):
         """KruskalMST constructor.
 
         :param G: The complete graph to analyze
         :type G: EdgeWeightedGraph
+        :param queue: The priority queue class ordering the edges, e.g.
+            DaryMinPriorityQueue or PairingHeap
+        :type queue: type
         """
 
         self._mst = Queue()
-        pq = MinPriorityQueue()
-        for edge in G:
-            pq.enqueue(edge, edge.weight)
+        # edges compare equal by weight, so queue their indices instead
+        edges = [*G]
+        pq = queue.from_iterable(
+            (k, edge.weight) for k, edge in enumerate(edges))
         uf = UnionFind(G.order())
 
         while pq and len(self._mst) < G.order() - 1:
-            e = pq.dequeue()
+            e = edges[pq.dequeue()]
             v = e.either()
             w = e.other(v)
             if uf.connected(v, w):
@@ -56,6 +60,8 @@ if __name__ == "__main__":
     import unittest
     from os import path
 
+    from containers.DaryMinPriorityQueue import DaryMinPriorityQueue
+    from containers.PairingHeap import PairingHeap
     from .Edge import Edge
     from .EdgeWeightedGraph import EdgeWeightedGraph
 
@@ -82,5 +88,11 @@ if __name__ == "__main__":
         def test_weight(self):
             self.assertEqual(1.81, round(self.mst.weight(), 2))
 
+        def test_queue(self):
+            for queue in (DaryMinPriorityQueue, PairingHeap):
+                mst = KruskalMST(self.graph, queue)
+                self.assertEqual(list(self.mst), list(mst))
+                self.assertEqual(1.81, round(mst.weight(), 2))
+
 
     unittest.main()
@@ -2,24 +2,29 @@
 
 import math
 
-from containers.MinPriorityQueue import MinPriorityQueue
+from containers.IndexMinPriorityQueue import IndexMinPriorityQueue
 
 
 class PrimMST:
     """An EdgeWeightedGraph client that finds the minimum spanning tree for the
     graph. Uses Prim's algorithm."""
 
-    def __init__(self, G):
+    def __init__(self, G, queue=None):
         """PrimMST constructor.
 
         :param G: The complete graph to analyze
         :type G: EdgeWeightedGraph
+        :param queue: The priority queue class ordering the vertices, e.g.
+            DaryMinPriorityQueue or PairingHeap; it must support
+            decrease_key(). Defaults to an IndexMinPriorityQueue
+        :type queue: type
         """
 
         self._edge_to = [None] * G.order()
         self._dist_to = [math.inf] * G.order()
         self._marked = [False] * G.order()
-        self._pq = MinPriorityQueue()
+        self._pq = IndexMinPriorityQueue(G.order()) if queue is None \
+            else queue()
 
         self._dist_to[0] = 0.0
         self._pq.enqueue(0, 0.0)
@@ -45,7 +50,7 @@ class PrimMST:
                 self._edge_to[w] = edge
                 self._dist_to[w] = edge.weight
                 if w in self._pq:
-                    self._pq.update_priority(w, self._dist_to[w])
+                    self._pq.decrease_key(w, self._dist_to[w])
                 else:
                     self._pq.enqueue(w, self._dist_to[w])
 
@@ -74,6 +79,8 @@ if __name__ == "__main__":
     import unittest
     from os import path
 
+    from containers.DaryMinPriorityQueue import DaryMinPriorityQueue
+    from containers.PairingHeap import PairingHeap
     from .EdgeWeightedGraph import EdgeWeightedGraph
     from .Edge import Edge
 
@@ -100,5 +107,10 @@ if __name__ == "__main__":
         def test_weight(self):
             self.assertEqual(1.81, round(self.mst.weight(), 2))
 
+        def test_queue(self):
+            for queue in (DaryMinPriorityQueue, PairingHeap):
+                mst = PrimMST(self.graph, queue)
+                self.assertEqual(list(self.mst), list(mst))
+
 
     unittest.main()
@@ -2,25 +2,32 @@
 
 import math
 
-from containers.MinPriorityQueue import MinPriorityQueue
+from containers.IndexMinPriorityQueue import IndexMinPriorityQueue
 
 
 class DijkstraSP:
     """An EdgeWeightedDirectedGraph client that finds the shortest path between
     two vertices on the graph. Uses Dijkstra's algorithm."""
 
-    def __init__(self, G, s):
+    def __init__(self, G, s, queue=None):
         """DijkstraSP constructor.
 
         :param G: The complete graph to analyze
         :type G: EdgeWeightedDirectedGraph
         :param s: The starting vertex for all path searches
         :type s: int
+        :param queue: Callable returning an empty priority queue to order
+            the vertices, e.g. DaryMinPriorityQueue or PairingHeap; it must
+            support decrease_key(). With integer edge weights, RadixHeap or
+            functools.partial(BucketQueue, W), W being the largest weight,
+            need no comparisons. Defaults to an IndexMinPriorityQueue
+        :type queue: function
         """
 
         self._edge_to = [None] * G.order()
         self._dist_to = [math.inf] * G.order()
-        self._pq = MinPriorityQueue()
+        self._pq = IndexMinPriorityQueue(G.order()) if queue is None \
+            else queue()
 
         self._dist_to[s] = 0.
         self._pq.enqueue(s, 0.)
@@ -43,7 +50,7 @@ class DijkstraSP:
                 self._dist_to[w] = self._dist_to[v] + edge.weight
                 self._edge_to[w] = edge
                 if w in self._pq:
-                    self._pq.update_priority(w, self._dist_to[w])
+                    self._pq.decrease_key(w, self._dist_to[w])
                 else:
                     self._pq.enqueue(w, self._dist_to[w])
 
@@ -94,8 +101,13 @@ class DijkstraSP:
 if __name__ == "__main__":
 
     import unittest
+    from functools import partial
     from os import path
 
+    from containers.BucketQueue import BucketQueue
+    from containers.DaryMinPriorityQueue import DaryMinPriorityQueue
+    from containers.PairingHeap import PairingHeap
+    from containers.RadixHeap import RadixHeap
     from .EdgeWeightedDirectedGraph import EdgeWeightedDirectedGraph
     from .DirectedEdge import DirectedEdge
 
@@ -144,5 +156,26 @@ if __name__ == "__main__":
             )
             self.assertEqual(path_to_6, sp.path_to(6))
 
+        def test_queue(self):
+            sp = DijkstraSP(self.graph, 0)
+            for queue in (DaryMinPriorityQueue, PairingHeap):
+                other = DijkstraSP(self.graph, 0, queue)
+                for v in range(self.graph.order()):
+                    self.assertEqual(sp.dist_to(v), other.dist_to(v))
+                    self.assertEqual(sp.path_to(v), other.path_to(v))
+
+        def test_monotone_queue(self):
+            graph = EdgeWeightedDirectedGraph(
+                vertices=range(self.graph.order()),
+                edges=(DirectedEdge(e.frm, e.to, round(e.weight * 100))
+                       for e in self.graph))
+            sp = DijkstraSP(graph, 0)
+            self.assertEqual(151, sp.dist_to(6))
+            for queue in (RadixHeap, partial(BucketQueue, 93)):
+                other = DijkstraSP(graph, 0, queue)
+                for v in range(graph.order()):
+                    self.assertEqual(sp.dist_to(v), other.dist_to(v))
+                    self.assertEqual(sp.path_to(v), other.path_to(v))
+
 
     unittest.main()
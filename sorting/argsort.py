@@ -0,0 +1,289 @@
+"""Sorting Utility: Argsort and Co-Sorting
+
+Finds the permutation that sorts a sequence rather than the sorted items, and
+applies it to any number of parallel sequences (e.g. the columns of a
+columnar batch), without ever building a list of tuples.
+
+Example:
+
+    order = argsort(scores, reverse=True)
+    ranked = take(names, order)
+    ages, names, ids = cosort(ages, names, ids)
+"""
+
+from array import array
+from random import shuffle
+
+from sorting.radix import _insertion_sort, _reverse_order
+
+# sub lists of up to this many indices are sorted with insertion sort
+CUTOFF = 16
+
+
+def argsort(a, key=None, reverse=False, algorithm='mergesort'):
+    """Finds the indices that would sort a sequence: a[order[0]] is its
+    smallest item, a[order[1]] the next and so on. With 'mergesort' items
+    with equal keys keep their original order, also when sorting in reverse;
+    'quicksort' is not stable. Only the indices are moved; the items (or
+    their keys) are compared in place.
+
+    Time complexity: O(nlogn)
+    Space complexity: O(n) for the indices
+
+    :param a: A sequence to be sorted, left unmodified
+    :type a: list
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Order the indices by descending items
+    :type reverse: bool
+    :param algorithm: Sort used, one of 'mergesort' or 'quicksort'
+    :type algorithm: str
+    :return: The indices of a in sorted order
+    :rtype: list
+    :raises: ValueError
+    """
+
+    if algorithm not in _ALGORITHMS:
+        raise ValueError(
+            "The algorithm `{}` is not supported.".format(algorithm))
+    keys = a if key is None else [*map(key, a)]
+    order = _ALGORITHMS[algorithm](keys, [*range(len(keys))])
+    if reverse:
+        if algorithm == 'mergesort':
+            _reverse_order(keys, order)
+        else:
+            order.reverse()
+    return order
+
+
+def take(a, order, inplace=False):
+    """Reorders a sequence by a permutation, such as one found by argsort():
+    item j of the result is a[order[j]].
+
+    In place, the permutation is applied cycle by cycle, so besides one
+    byte per item to mark the items already placed, no copy is made.
+
+    :param a: A sequence to be reordered
+    :type a: list
+    :param order: A permutation of the indices of a
+    :type order: list
+    :param inplace: Reorder a itself (any mutable sequence, including
+        array.array) rather than a copy
+    :type inplace: bool
+    :return: A new reordered list (an array.array if a is one), or a itself
+        when reordered in place
+    :rtype: list
+    :raises: ValueError
+    """
+
+    if len(order) != len(a):
+        raise ValueError("The permutation has {} indices, not {}."
+                         .format(len(order), len(a)))
+    if not inplace:
+        if isinstance(a, array):
+            return array(a.typecode, map(a.__getitem__, order))
+        return [a[i] for i in order]
+    # check order is a permutation before moving anything, since the cycle
+    # walk below never ends on a repeated index; the marks it leaves are
+    # then cleared again as the items are placed
+    pending = bytearray(len(a))
+    for i in order:
+        if not 0 <= i < len(a) or pending[i]:
+            raise ValueError("Index `{}` is out of range or repeated in the "
+                             "permutation.".format(i))
+        pending[i] = 1
+    for start in range(len(a)):
+        if not pending[start]:
+            continue
+        temp = a[start]
+        j = start
+        while True:
+            pending[j] = 0
+            i = order[j]
+            if i == start:
+                a[j] = temp
+                break
+            a[j] = a[i]
+            j = i
+    return a
+
+
+def cosort(keys, *columns, key=None, reverse=False, algorithm='mergesort',
+           inplace=False):
+    """Sorts several parallel sequences in lockstep by the items of the
+    first: finds the sorting permutation of keys once, then reorders keys
+    and every column by it.
+
+    :param keys: The sequence to sort by
+    :type keys: list
+    :param columns: Further sequences as long as keys, reordered alongside
+    :type columns: list
+    :param key: Function computing the comparison key of an item of keys
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :param algorithm: Sort used, one of 'mergesort' (stable) or 'quicksort'
+    :type algorithm: str
+    :param inplace: Reorder the sequences themselves rather than copies
+    :type inplace: bool
+    :return: keys and the columns, sorted
+    :rtype: tuple
+    :raises: ValueError
+    """
+
+    for column in columns:
+        if len(column) != len(keys):
+            raise ValueError("Every column must be as long as the keys.")
+    order = argsort(keys, key, reverse, algorithm)
+    return tuple(take(seq, order, inplace) for seq in (keys, *columns))
+
+
+def _mergesort(keys, order):
+    """Sorts indices by the keys they refer to with a stable bottom-up
+    mergesort, alternating between the index list and one auxiliary list
+
+    :param keys: The sort keys
+    :type keys: list
+    :param order: The indices to sort
+    :type order: list
+    :return: The sorted indices, order itself or the auxiliary list
+    :rtype: list
+    """
+
+    n = len(order)
+    for lo in range(0, n, CUTOFF):
+        _insertion_sort(keys, order, lo, min(lo+CUTOFF, n)-1)
+    src, dst = order, [0] * n
+    width = CUTOFF
+    while width < n:
+        for lo in range(0, n, 2*width):
+            mid, hi = min(lo+width, n), min(lo+2*width, n)
+            if mid == hi or not keys[src[mid]] < keys[src[mid-1]]:
+                dst[lo:hi] = src[lo:hi]
+                continue
+            i, j = lo, mid
+            for k in range(lo, hi):
+                if i < mid and (j >= hi or not keys[src[j]] < keys[src[i]]):
+                    dst[k] = src[i]
+                    i += 1
+                else:
+                    dst[k] = src[j]
+                    j += 1
+        src, dst = dst, src
+        width *= 2
+    return src
+
+
+def _quicksort(keys, order):
+    """Sorts indices by the keys they refer to with an iterative three-way
+    quicksort, pushing the larger sub list and sorting the smaller one next
+
+    :param keys: The sort keys
+    :type keys: list
+    :param order: The indices to sort
+    :type order: list
+    :return: The sorted indices, order itself
+    :rtype: list
+    """
+
+    shuffle(order)
+    stack = [(0, len(order)-1)]
+    while stack:
+        start, end = stack.pop()
+        while end - start >= CUTOFF:
+            pivot = keys[order[start]]
+            lt, i, gt = start, start + 1, end
+            while i <= gt:
+                k = keys[order[i]]
+                if k < pivot:
+                    order[lt], order[i] = order[i], order[lt]
+                    lt += 1
+                    i += 1
+                elif pivot < k:
+                    order[i], order[gt] = order[gt], order[i]
+                    gt -= 1
+                else:
+                    i += 1
+            if lt - start < end - gt:
+                stack.append((gt+1, end))
+                end = lt - 1
+            else:
+                stack.append((start, lt-1))
+                start = gt + 1
+        _insertion_sort(keys, order, start, end)
+    return order
+
+
+_ALGORITHMS = {
+    'mergesort': _mergesort,
+    'quicksort': _quicksort,
+}
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from random import randrange
+
+
+    class TestArgsort(unittest.TestCase):
+
+        def setUp(self):
+            self.data = [randrange(300) for _ in range(2000)]
+
+        def test_argsort(self):
+            expected = sorted(range(2000), key=self.data.__getitem__)
+            self.assertEqual(expected, argsort(self.data))
+            self.assertEqual([], argsort([]))
+            order = argsort(self.data, algorithm='quicksort')
+            self.assertEqual(sorted(self.data), [self.data[i] for i in order])
+            self.assertEqual(sorted(range(2000)), sorted(order))
+
+        def test_key_reverse(self):
+            neg = lambda x: -x
+            self.assertEqual(
+                sorted(range(2000), key=lambda i: -self.data[i]),
+                argsort(self.data, key=neg))
+            self.assertEqual(
+                sorted(range(2000), key=self.data.__getitem__, reverse=True),
+                argsort(self.data, reverse=True))
+            order = argsort(self.data, reverse=True, algorithm='quicksort')
+            self.assertEqual(sorted(self.data, reverse=True),
+                             [self.data[i] for i in order])
+
+        def test_unknown_algorithm(self):
+            self.assertRaises(ValueError, argsort, self.data,
+                              algorithm='heapsort')
+
+        def test_take(self):
+            order = argsort(self.data)
+            self.assertEqual(sorted(self.data), take(self.data, order))
+            data = array('i', self.data)
+            self.assertIs(data, take(data, order, inplace=True))
+            self.assertEqual(sorted(self.data), list(data))
+            self.assertRaises(ValueError, take, self.data, order[1:])
+
+        def test_take_not_permutation(self):
+            data = [1, 2, 3]
+            for order in ([0, 0, 1], [0, 1, 3], [-1, 0, 1]):
+                self.assertRaises(ValueError, take, data, order, True)
+                self.assertEqual([1, 2, 3], data)
+
+        def test_cosort(self):
+            ids = [*range(2000)]
+            labels = array('i', (-i for i in ids))
+            keys, ids, labels = cosort(self.data, ids, labels)
+            expected = sorted(range(2000), key=self.data.__getitem__)
+            self.assertEqual(sorted(self.data), keys)
+            self.assertEqual(expected, ids)
+            self.assertEqual([-i for i in expected], list(labels))
+
+            names = ['pear', 'fig', 'apple', 'kiwi']
+            ages = [3, 1, 3, 2]
+            self.assertEqual(([3, 3, 2, 1], ['pear', 'apple', 'kiwi', 'fig']),
+                             cosort(ages, names, reverse=True, inplace=True))
+            self.assertEqual(['pear', 'apple', 'kiwi', 'fig'], names)
+            self.assertRaises(ValueError, cosort, ages, names[1:])
+
+
+    unittest.main()
@@ -0,0 +1,358 @@
+"""Sorting Benchmarks
+
+Times every sort in the package across a range of input sizes and shapes,
+counting comparisons and measuring peak memory, and reports the results as
+JSON and as a text table.
+
+Example:
+
+    python -m sorting.benchmark --sizes 1000 100000 --shapes random sorted
+"""
+
+import json
+import random
+import time
+import tracemalloc
+
+from sorting.block_merge_sort import block_merge_sort
+from sorting.bubble_sort import bubble_sort
+from sorting.external_sort import external_sort
+from sorting.heapsort import heapsort
+from sorting.insertion_sort import binary_insertion_sort, insertion_sort
+from sorting.instrument import instrument
+from sorting.introsort import introsort
+from sorting.mergesort import mergesort
+from sorting.networks import network_sort
+from sorting.parallel_sort import parallel_sort
+from sorting.quicksort import quicksort
+from sorting.radix import counting_sort, lsd_radix_sort
+from sorting.selection_sort import selection_sort
+from sorting.shellsort import shellsort
+from sorting.timsort import timsort
+
+SIZES = (10, 100, 1000, 10**4, 10**5, 10**6, 10**7)
+
+
+class Algorithm:
+    """A sort function to benchmark, with the options to call it with"""
+
+    __slots__ = 'sort', 'options', 'max_size', 'counted', 'shape_sizes'
+
+    def __init__(self, sort, max_size, counted=True, shape_sizes=None,
+                 **options):
+        """Algorithm constructor
+
+        :param sort: The sort function
+        :type sort: function
+        :param max_size: Largest input size to run it on
+        :type max_size: int
+        :param counted: Whether its comparisons can be counted in-process
+        :type counted: bool
+        :param shape_sizes: Smaller largest input sizes for the input shapes
+            it degrades on, by shape name
+        :type shape_sizes: dict
+        :param options: Keyword arguments to call the sort function with
+        """
+
+        self.sort = sort
+        self.options = options
+        self.max_size = max_size
+        self.counted = counted
+        self.shape_sizes = shape_sizes or {}
+
+    def max_size_for(self, shape):
+        """Reports the largest input size to run it on for an input shape
+
+        :param shape: The name of the input shape
+        :type shape: str
+        :return: The largest input size
+        :rtype: int
+        """
+
+        return min(self.max_size, self.shape_sizes.get(shape, self.max_size))
+
+    def __call__(self, a):
+        """Sorts a list
+
+        :param a: The list to sort
+        :type a: list
+        :return: The sorted items
+        :rtype: list
+        """
+
+        return self.sort(a, **self.options)
+
+
+ALGORITHMS = {
+    'bubble_sort': Algorithm(bubble_sort, 2000),
+    'selection_sort': Algorithm(selection_sort, 5000),
+    'insertion_sort': Algorithm(insertion_sort, 5000),
+    'binary_insertion_sort': Algorithm(binary_insertion_sort, 10**4),
+    'network_sort': Algorithm(network_sort, 16),
+    'shellsort': Algorithm(shellsort, 10**5),
+    'shellsort_ciura': Algorithm(shellsort, 10**6, gaps='ciura'),
+    'shellsort_tokuda': Algorithm(shellsort, 10**6, gaps='tokuda'),
+    'mergesort': Algorithm(mergesort, 10**6),
+    'mergesort_iterative': Algorithm(mergesort, 10**6, iterative=True),
+    'block_merge_sort': Algorithm(block_merge_sort, 10**6),
+    # Lomuto partitioning goes O(n) deep (recursive) or O(n^2) time
+    # (iterative) on few unique items
+    'quicksort': Algorithm(quicksort, 10**6,
+                           shape_sizes={'few_unique': 2000}),
+    'quicksort_three_way': Algorithm(quicksort, 10**6,
+                                     partition='three_way'),
+    'quicksort_dual_pivot': Algorithm(quicksort, 10**6,
+                                      partition='dual_pivot'),
+    'quicksort_iterative': Algorithm(quicksort, 10**6, iterative=True,
+                                     shape_sizes={'few_unique': 10**4}),
+    'heapsort': Algorithm(heapsort, 10**6),
+    'heapsort_bounce': Algorithm(heapsort, 10**6, bounce=True),
+    'heapsort_4ary': Algorithm(heapsort, 10**6, arity=4, bounce=True),
+    'introsort': Algorithm(introsort, 10**6),
+    'timsort': Algorithm(timsort, 10**6),
+    'external_sort': Algorithm(lambda a: list(external_sort(a)), 10**6,
+                               counted=False),
+    'parallel_sort': Algorithm(parallel_sort, 10**7, counted=False),
+    'counting_sort': Algorithm(counting_sort, 10**7, counted=False),
+    'lsd_radix_sort': Algorithm(lsd_radix_sort, 10**7, counted=False),
+}
+
+
+def _random(n):
+    """Random integers in range(n)"""
+
+    return [random.randrange(n) for _ in range(n)]
+
+
+def _sorted(n):
+    """The integers in range(n), in order"""
+
+    return [*range(n)]
+
+
+def _reversed(n):
+    """The integers from n down to 1"""
+
+    return [*range(n, 0, -1)]
+
+
+def _organ_pipe(n):
+    """Integers rising to n/2, then falling"""
+
+    return [*range(n // 2), *range(n - n // 2, 0, -1)]
+
+
+def _few_unique(n):
+    """Random integers in range(10)"""
+
+    return [random.randrange(10) for _ in range(n)]
+
+
+def _nearly_sorted(n):
+    """The integers in range(n), with 1% of them swapped"""
+
+    a = [*range(n)]
+    for _ in range(max(1, n // 100)):
+        i, j = random.randrange(n), random.randrange(n)
+        a[i], a[j] = a[j], a[i]
+    return a
+
+
+SHAPES = {
+    'random': _random,
+    'sorted': _sorted,
+    'reversed': _reversed,
+    'organ_pipe': _organ_pipe,
+    'few_unique': _few_unique,
+    'nearly_sorted': _nearly_sorted,
+}
+
+
+def measure(algorithm, a, repeat=1, comparisons=True, memory=True):
+    """Benchmarks one sort on one input
+
+    :param algorithm: The sort to run
+    :type algorithm: Algorithm
+    :param a: The input list, left unmodified
+    :type a: list
+    :param repeat: Number of timed runs; the fastest is reported
+    :type repeat: int
+    :param comparisons: Count comparisons in an extra run
+    :type comparisons: bool
+    :param memory: Trace peak memory in an extra run
+    :type memory: bool
+    :return: Wall time in seconds, comparisons and peak bytes allocated;
+        the last two are None when not measured
+    :rtype: tuple
+    """
+
+    seconds = None
+    for _ in range(repeat):
+        data = [*a]
+        start = time.perf_counter()
+        algorithm(data)
+        elapsed = time.perf_counter() - start
+        if seconds is None or elapsed < seconds:
+            seconds = elapsed
+
+    count = None
+    if comparisons and algorithm.counted:
+        with instrument() as stats:
+            algorithm(stats.track(a))
+        count = stats.comparisons
+
+    peak = None
+    if memory:
+        data = [*a]
+        tracemalloc.start()
+        try:
+            algorithm(data)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return seconds, count, peak
+
+
+def run(algorithms=None, shapes=None, sizes=SIZES, repeat=1, comparisons=True,
+        memory=True, seed=None, caps=True):
+    """Benchmarks sorts across input shapes and sizes
+
+    :param algorithms: Names of the sorts to run, defaults to all
+    :type algorithms: list
+    :param shapes: Names of the input shapes to use, defaults to all
+    :type shapes: list
+    :param sizes: Input sizes to use
+    :type sizes: list
+    :param repeat: Number of timed runs per input; the fastest is reported
+    :type repeat: int
+    :param comparisons: Count comparisons
+    :type comparisons: bool
+    :param memory: Trace peak memory
+    :type memory: bool
+    :param seed: Seed for the random inputs
+    :type seed: int
+    :param caps: Skip sizes above each sort's largest size for the shape
+    :type caps: bool
+    :return: One record per run, as a dict
+    :rtype: list
+    """
+
+    random.seed(seed)
+    results = []
+    for n in sizes:
+        for shape in shapes or SHAPES:
+            a = SHAPES[shape](n)
+            for name in algorithms or ALGORITHMS:
+                algorithm = ALGORITHMS[name]
+                if caps and n > algorithm.max_size_for(shape):
+                    continue
+                seconds, count, peak = measure(algorithm, a, repeat,
+                                               comparisons, memory)
+                results.append({
+                    'algorithm': name,
+                    'shape': shape,
+                    'size': n,
+                    'seconds': seconds,
+                    'comparisons': count,
+                    'peak_bytes': peak,
+                })
+    return results
+
+
+def format_table(results):
+    """Lays benchmark results out as a text table
+
+    :param results: Records as returned by run()
+    :type results: list
+    :return: The table
+    :rtype: str
+    """
+
+    header = ('algorithm', 'shape', 'size', 'seconds', 'comparisons',
+              'peak_bytes')
+    rows = [header]
+    for r in results:
+        rows.append((
+            r['algorithm'],
+            r['shape'],
+            str(r['size']),
+            '{:.6f}'.format(r['seconds']),
+            '-' if r['comparisons'] is None else str(r['comparisons']),
+            '-' if r['peak_bytes'] is None else str(r['peak_bytes']),
+        ))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = []
+    for row in rows:
+        lines.append('  '.join(
+            cell.ljust(w) if i < 2 else cell.rjust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))))
+    lines.insert(1, '  '.join('-' * w for w in widths))
+    return '\n'.join(lines)
+
+
+if __name__ == "__main__":
+
+    import argparse
+    import sys
+    import unittest
+
+
+    class TestBenchmark(unittest.TestCase):
+
+        def test_run(self):
+            results = run(sizes=(10, 50), comparisons=False, memory=False,
+                          seed=1)
+            runs = {(r['algorithm'], r['shape'], r['size']) for r in results}
+            for name, algorithm in ALGORITHMS.items():
+                for shape in SHAPES:
+                    for n in (10, 50):
+                        self.assertEqual(n <= algorithm.max_size_for(shape),
+                                         (name, shape, n) in runs)
+            self.assertIn('few_unique', format_table(results))
+
+        def test_shape_sizes(self):
+            quicksort = ALGORITHMS['quicksort']
+            self.assertEqual(10**6, quicksort.max_size_for('random'))
+            self.assertEqual(2000, quicksort.max_size_for('few_unique'))
+            results = run(['quicksort'], ['few_unique'], (2000, 10**4),
+                          memory=False, seed=1)
+            self.assertEqual([2000], [r['size'] for r in results])
+            self.assertIsNotNone(results[0]['comparisons'])
+
+
+    parser = argparse.ArgumentParser(
+        prog='python -m sorting.benchmark',
+        description="Benchmarks the package's sorts.")
+    parser.add_argument('--algorithms', nargs='+', choices=ALGORITHMS,
+                        metavar='NAME', help="sorts to run (default: all)")
+    parser.add_argument('--shapes', nargs='+', choices=SHAPES,
+                        metavar='SHAPE', help="input shapes (default: all)")
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES,
+                        metavar='N', help="input sizes (default: 10..10^7)")
+    parser.add_argument('--repeat', type=int, default=1,
+                        help="timed runs per input, fastest is kept")
+    parser.add_argument('--seed', type=int, help="random seed")
+    parser.add_argument('--no-caps', dest='caps', action='store_false',
+                        help="run every sort at every size")
+    parser.add_argument('--no-comparisons', dest='comparisons',
+                        action='store_false', help="skip comparison counts")
+    parser.add_argument('--no-memory', dest='memory', action='store_false',
+                        help="skip peak memory tracing")
+    parser.add_argument('--json', metavar='FILE',
+                        help="also write the results as JSON to FILE "
+                             "('-' for standard output)")
+    parser.add_argument('--test', action='store_true',
+                        help="run the self-tests instead")
+    args = parser.parse_args()
+    if args.test:
+        unittest.main(argv=sys.argv[:1])
+
+    results = run(args.algorithms, args.shapes, args.sizes, args.repeat,
+                  args.comparisons, args.memory, args.seed, args.caps)
+    if args.json == '-':
+        print(json.dumps(results, indent=2))
+    else:
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump(results, f, indent=2)
+        print(format_table(results))
@@ -0,0 +1,252 @@
+"""Sorting Algorithm: In-Place Block Merge Sort"""
+
+from sorting.decorate import sort_by_key
+from sorting.insertion_sort import _binary_insertion_sort
+
+# blocks of this many items are insertion sorted before merging begins
+BLOCK_SIZE = 20
+
+
+def block_merge_sort(a, inplace=False, key=None, reverse=False):
+    """In-Place Block Merge Sort
+
+    Insertion sorts fixed-size blocks, then merges them bottom-up without any
+    buffer: each merge (SymMerge, Kim and Kutzner) binary searches for the
+    split that lets the middle of the two runs be exchanged by a rotation,
+    then merges the two halves either side of it the same way. Stable, and
+    needs no more memory than the recursion stack, so it suits sorting large
+    lists stably where mergesort's copy of the list is not affordable.
+
+    Time complexity: O(nlog^2n), with O(nlogn) comparisons
+    Space complexity: O(logn)
+
+    :param a: A sequence to be sorted
+    :type a: list
+    :param inplace: Sort a itself (any mutable sequence, including
+        array.array and writable memoryview) rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item; note the
+        keys, like a copy, take O(n) memory
+    :type key: function
+    :param reverse: Sort in descending order, still stably and in O(logn)
+        memory when no key is given
+    :type reverse: bool
+    :return: A new sorted list, or a itself when sorted in place
+    :rtype: list
+    """
+
+    if key is not None:
+        return sort_by_key(block_merge_sort, a, key, reverse, inplace)
+    b = a if inplace else [*a]
+    if reverse:
+        # equal items end up back in their original order after the list is
+        # turned around both before and after the stable ascending sort
+        _reverse(b, 0, len(b))
+        _sort(b, 0, len(b))
+        _reverse(b, 0, len(b))
+    else:
+        _sort(b, 0, len(b))
+    return b
+
+
+def _sort(srt, lo, hi):
+    """Sorts srt[lo:hi] in place by insertion sorting blocks, then merging
+    adjacent runs of doubling width in place
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param lo: The beginning index of the sub list
+    :type lo: int
+    :param hi: The index just past the end of the sub list
+    :type hi: int
+    """
+
+    for start in range(lo, hi, BLOCK_SIZE):
+        _binary_insertion_sort(srt, start, min(start+BLOCK_SIZE, hi), start+1)
+    width = BLOCK_SIZE
+    while width < hi - lo:
+        for start in range(lo, hi - width, 2*width):
+            mid = start + width
+            end = min(mid + width, hi)
+            if srt[mid] < srt[mid-1]:
+                _sym_merge(srt, start, mid, end)
+        width *= 2
+
+
+def _sym_merge(srt, lo, mid, hi):
+    """Merges the ordered runs srt[lo:mid] and srt[mid:hi] in place, keeping
+    equal items in their original order
+
+    :param srt: The list holding both runs
+    :type srt: list
+    :param lo: The beginning index of the left run
+    :type lo: int
+    :param mid: The beginning index of the right run
+    :type mid: int
+    :param hi: The index just past the end of the right run
+    :type hi: int
+    """
+
+    if mid - lo == 1:
+        # move the single left item past every right item ranked lower
+        i, j = mid, hi
+        while i < j:
+            h = (i + j) // 2
+            if srt[h] < srt[lo]:
+                i = h + 1
+            else:
+                j = h
+        _rotate(srt, lo, mid, i)
+        return
+    if hi - mid == 1:
+        # move the single right item before every left item ranked higher
+        i, j = lo, mid
+        while i < j:
+            h = (i + j) // 2
+            if not srt[mid] < srt[h]:
+                i = h + 1
+            else:
+                j = h
+        _rotate(srt, i, mid, hi)
+        return
+
+    # find start so that srt[start:mid] and srt[mid:end] may be exchanged,
+    # end mirroring start around the middle of srt[lo:hi]
+    half = (lo + hi) // 2
+    n = half + mid
+    if mid > half:
+        start, r = n - hi, half
+    else:
+        start, r = lo, mid
+    p = n - 1
+    while start < r:
+        c = (start + r) // 2
+        if not srt[p-c] < srt[c]:
+            start = c + 1
+        else:
+            r = c
+    end = n - start
+    if start < mid < end:
+        _rotate(srt, start, mid, end)
+    if lo < start < half:
+        _sym_merge(srt, lo, start, half)
+    if half < end < hi:
+        _sym_merge(srt, half, end, hi)
+
+
+def _rotate(srt, lo, mid, hi):
+    """Exchanges srt[lo:mid] and srt[mid:hi] in place by three reversals
+
+    :param srt: The list holding both sub lists
+    :type srt: list
+    :param lo: The beginning index of the left sub list
+    :type lo: int
+    :param mid: The beginning index of the right sub list
+    :type mid: int
+    :param hi: The index just past the end of the right sub list
+    :type hi: int
+    """
+
+    if lo < mid < hi:
+        _reverse(srt, lo, mid)
+        _reverse(srt, mid, hi)
+        _reverse(srt, lo, hi)
+
+
+def _reverse(srt, lo, hi):
+    """Reverses srt[lo:hi] in place
+
+    :param srt: The list holding the sub list
+    :type srt: list
+    :param lo: The beginning index of the sub list
+    :type lo: int
+    :param hi: The index just past the end of the sub list
+    :type hi: int
+    """
+
+    hi -= 1
+    while lo < hi:
+        srt[lo], srt[hi] = srt[hi], srt[lo]
+        lo += 1
+        hi -= 1
+
+
+if __name__ == "__main__":
+
+    import tracemalloc
+    import unittest
+    from array import array
+    from random import randrange, shuffle
+
+
+    class _Pair(tuple):
+        """Compares on the first item only, to observe stability"""
+
+        def __new__(cls, key, value):
+            return super().__new__(cls, (key, value))
+
+        def __lt__(self, other):
+            return self[0] < other[0]
+
+
+    class TestBlockMergeSort(unittest.TestCase):
+
+        def setUp(self):
+            self.ordered = [x for x in range(20)]
+            self.shuffled = [*self.ordered]
+            while self.ordered == self.shuffled:
+                shuffle(self.shuffled)
+
+        def test_block_merge_sort(self):
+            self.assertEqual(self.ordered, block_merge_sort(self.shuffled))
+            self.assertNotEqual(self.ordered, self.shuffled)
+            self.assertEqual([], block_merge_sort([]))
+            for n in (21, 40, 41, 199, 1000, 3001):
+                data = [randrange(n) for _ in range(n)]
+                self.assertEqual(sorted(data), block_merge_sort(data))
+
+        def test_stable(self):
+            pairs = [(randrange(8), i) for i in range(2000)]
+            self.assertEqual(sorted(pairs, key=lambda p: p[0]),
+                             [(k, v) for k, v in block_merge_sort(
+                                 [_Pair(k, v) for k, v in pairs])])
+            self.assertEqual(sorted(pairs, key=lambda p: p[0], reverse=True),
+                             [(k, v) for k, v in block_merge_sort(
+                                 [_Pair(k, v) for k, v in pairs],
+                                 reverse=True)])
+
+        def test_memory(self):
+            data = array('i', (randrange(10**6) for _ in range(2000)))
+            tracemalloc.start()
+            block_merge_sort(data, inplace=True)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            self.assertLess(peak, 4096)
+            self.assertEqual(sorted(data), list(data))
+            tracemalloc.start()
+            block_merge_sort(data, inplace=True, reverse=True)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            self.assertLess(peak, 4096)
+            self.assertEqual(sorted(data, reverse=True), list(data))
+
+        def test_inplace(self):
+            data = array('i', self.shuffled)
+            self.assertIs(data, block_merge_sort(data, inplace=True))
+            self.assertEqual(self.ordered, list(data))
+
+            view = memoryview(array('i', self.shuffled))
+            block_merge_sort(view, inplace=True)
+            self.assertEqual(self.ordered, view.tolist())
+
+        def test_key(self):
+            words = ['pear', 'fig', 'apple', 'kiwi', 'plum', 'date']
+            self.assertEqual(sorted(words, key=len),
+                             block_merge_sort(words, key=len))
+            self.assertEqual(sorted(words, key=len, reverse=True),
+                             block_merge_sort(words, key=len, reverse=True))
+            self.assertEqual(self.ordered[::-1],
+                             block_merge_sort(self.shuffled, reverse=True))
+
+
+    unittest.main()
@@ -1,19 +1,30 @@
 """Sorting Algorithm: Bubble Sort"""
 
+from sorting.decorate import sort_by_key
 
-def bubble_sort(a):
+
+def bubble_sort(a, inplace=False, key=None, reverse=False):
     """Bubble Sort
 
     Time complexity: O(n^2)
     Space complexity: O(1)
 
-    :param a: A list to be sorted
+    :param a: A sequence to be sorted
     :type a: list
-    :return: A new sorted list
+    :param inplace: Sort a itself (any mutable sequence, including
+        array.array and writable memoryview) rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :return: A new sorted list, or a itself when sorted in place
     :rtype: list
     """
 
-    b = [*a]
+    if key is not None or reverse:
+        return sort_by_key(bubble_sort, a, key, reverse, inplace)
+    b = a if inplace else [*a]
     n = len(b)
     for i in range(n):
         for j in range(n-i-1):
@@ -25,6 +36,7 @@ def bubble_sort(a):
 if __name__ == "__main__":
 
     import unittest
+    from array import array
     from random import shuffle
 
 
@@ -40,5 +52,23 @@ if __name__ == "__main__":
             self.assertEqual(self.ordered, bubble_sort(self.shuffled))
             self.assertNotEqual(self.ordered, self.shuffled)
 
+        def test_inplace(self):
+            data = array('i', self.shuffled)
+            self.assertIs(data, bubble_sort(data, inplace=True))
+            self.assertEqual(self.ordered, list(data))
+
+            view = memoryview(array('i', self.shuffled))
+            bubble_sort(view, inplace=True)
+            self.assertEqual(self.ordered, view.tolist())
+
+        def test_key(self):
+            words = ['pear', 'fig', 'apple', 'kiwi', 'plum', 'date']
+            self.assertEqual(sorted(words, key=len),
+                             bubble_sort(words, key=len))
+            self.assertEqual(sorted(words, key=len, reverse=True),
+                             bubble_sort(words, key=len, reverse=True))
+            self.assertEqual(self.ordered[::-1],
+                             bubble_sort(self.shuffled, reverse=True))
+
 
     unittest.main()
@@ -0,0 +1,154 @@
+"""Sorting Utility: Decorate-Sort-Undecorate"""
+
+
+def sort_by_key(sort, a, key=None, reverse=False, inplace=False, **options):
+    """Sorts a sequence with any of the package's sort functions, ordering
+    items by key(item) and optionally in descending order.
+
+    Each key is computed exactly once and paired with the item's original
+    index, so the sort only ever compares (key, index) tuples: keys are never
+    recomputed, items themselves are never compared, and items with equal
+    keys keep their original relative order.
+
+    :param sort: The sort function to run, e.g. sorting.mergesort.mergesort
+    :type sort: function
+    :param a: A sequence to be sorted
+    :type a: list
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :param inplace: Write the result back into a rather than a new list
+    :type inplace: bool
+    :param options: Further keyword arguments to pass through to sort
+    :return: A new sorted list, or a itself when sorted in place
+    :rtype: list
+    """
+
+    b, decorated = _decorate(a, key, reverse)
+    sort(decorated, inplace=True, **options)
+    return _undecorate(a, b, decorated, reverse, inplace)
+
+
+def _decorate(a, key=None, reverse=False):
+    """Pairs the key of every item with its index
+
+    :param a: A sequence to be sorted
+    :type a: list
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Prepare for a sort in descending order
+    :type reverse: bool
+    :return: A copy of the items of a, and the (key, index) pairs to sort
+    :rtype: tuple
+    """
+
+    b = [*a]
+    keys = b if key is None else [*map(key, b)]
+
+    # equal keys are ordered by descending index for a reverse sort, so that
+    # turning the result around afterwards leaves them in their original order
+    step = -1 if reverse else 1
+    return b, [*zip(keys, range(0, step * len(b), step))]
+
+
+def _undecorate(a, b, decorated, reverse=False, inplace=False):
+    """Lays the items out in the order of their sorted (key, index) pairs
+
+    :param a: The sequence being sorted
+    :type a: list
+    :param b: The copy of the items of a returned by _decorate()
+    :type b: list
+    :param decorated: The (key, index) pairs, sorted in ascending order
+    :type decorated: list
+    :param reverse: Lay the items out in descending order
+    :type reverse: bool
+    :param inplace: Write the result back into a rather than a new list
+    :type inplace: bool
+    :return: A new sorted list, or a itself when sorted in place
+    :rtype: list
+    """
+
+    if reverse:
+        decorated.reverse()
+    if not inplace:
+        return [b[abs(i)] for _, i in decorated]
+    for j, (_, i) in enumerate(decorated):
+        a[j] = b[abs(i)]
+    return a
+
+
+class Reversed:
+    """Wraps a key so that it compares in descending order"""
+
+    __slots__ = 'key',
+
+    def __init__(self, key):
+        """Reversed constructor
+
+        :param key: The key to wrap
+        """
+
+        self.key = key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __gt__(self, other):
+        return self.key < other.key
+
+
+if __name__ == "__main__":
+
+    import unittest
+
+
+    def _selection_sort(a, inplace=False):
+        """A deliberately unstable sort to decorate"""
+
+        b = a if inplace else [*a]
+        for i in range(len(b)):
+            m = min(range(i, len(b)), key=b.__getitem__)
+            b[i], b[m] = b[m], b[i]
+        return b
+
+
+    class TestSortByKey(unittest.TestCase):
+
+        def setUp(self):
+            self.words = ['pear', 'fig', 'apple', 'kiwi', 'plum', 'date']
+
+        def test_key(self):
+            self.assertEqual(sorted(self.words, key=len),
+                             sort_by_key(_selection_sort, self.words, len))
+
+        def test_reverse(self):
+            self.assertEqual(
+                sorted(self.words, key=len, reverse=True),
+                sort_by_key(_selection_sort, self.words, len, reverse=True))
+            self.assertEqual(
+                sorted(self.words, reverse=True),
+                sort_by_key(_selection_sort, self.words, reverse=True))
+
+        def test_key_called_once(self):
+            calls = []
+            sort_by_key(_selection_sort, self.words,
+                        lambda w: calls.append(w) or w)
+            self.assertEqual(self.words, calls)
+
+        def test_inplace(self):
+            words = [*self.words]
+            self.assertIs(words, sort_by_key(_selection_sort, words, len,
+                                             inplace=True))
+            self.assertEqual(sorted(self.words, key=len), words)
+
+        def test_reversed(self):
+            self.assertTrue(Reversed(2) < Reversed(1))
+            self.assertTrue(Reversed(1) > Reversed(2))
+            self.assertTrue(Reversed(1) == Reversed(1))
+
+
+    unittest.main()
@@ -0,0 +1,269 @@
+"""Sorting Algorithm: External Mergesort"""
+
+import os
+import pickle
+import tempfile
+from itertools import islice
+from operator import itemgetter
+
+from containers.MinPriorityQueue import MinPriorityQueue
+from sorting.decorate import Reversed
+from sorting.mergesort import mergesort
+
+# number of items pickled together when writing a run to disk
+BLOCK_SIZE = 1024
+
+
+def external_sort(iterable, key=None, reverse=False, chunk_size=100000,
+                  fan_in=64, tmpdir=None):
+    """External Mergesort
+
+    Sorts data too large to fit in memory. The input is read in chunks of
+    chunk_size items, each chunk is sorted with mergesort and spilled to a
+    temporary file as a sorted run, and the runs are then merged through a
+    priority queue at most fan_in at a time. Sorted items are produced lazily
+    as the final merge advances; temporary files are removed once the
+    generator is exhausted or closed. Stable.
+
+    Time complexity: O(nlogn)
+    Space complexity: O(chunk_size + fan_in) in memory, O(n) on disk
+
+    :param iterable: Any iterable of picklable items, e.g. an open file
+    :type iterable: iterable
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :param chunk_size: Maximum number of items held in memory while sorting
+    :type chunk_size: int
+    :param fan_in: Maximum number of runs merged together at once
+    :type fan_in: int
+    :param tmpdir: Directory for the temporary run files
+    :type tmpdir: str
+    :return: Generator of the items in sorted order
+    :rtype: generator
+    :raises: ValueError
+    """
+
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be at least 1.")
+    if fan_in < 2:
+        raise ValueError("The fan-in must be at least 2.")
+    return _sort(iterable, key, reverse, chunk_size, fan_in, tmpdir)
+
+
+def _sort(iterable, key, reverse, chunk_size, fan_in, tmpdir):
+    """Spills sorted runs and merges them; see external_sort()
+
+    :param iterable: Any iterable of picklable items
+    :type iterable: iterable
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :param chunk_size: Maximum number of items held in memory while sorting
+    :type chunk_size: int
+    :param fan_in: Maximum number of runs merged together at once
+    :type fan_in: int
+    :param tmpdir: Directory for the temporary run files
+    :type tmpdir: str
+    :return: Generator of the items in sorted order
+    :rtype: generator
+    """
+
+    # with a key, runs hold (key, item) pairs so keys are computed only once
+    get_key = None if key is None else itemgetter(0)
+    with tempfile.TemporaryDirectory(dir=tmpdir) as directory:
+        runs = []
+        it = iter(iterable)
+        chunk = [*islice(it, chunk_size)]
+        while chunk:
+            chunk = _sort_chunk(chunk, key, reverse)
+            if key is not None:
+                chunk = ((k, item) for k, _, item in chunk)
+            runs.append(_spill(chunk, directory))
+            chunk = [*islice(it, chunk_size)]
+
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i+fan_in]
+                merged.append(_spill(
+                    _merge([_read_run(run) for run in group],
+                           get_key, reverse),
+                    directory))
+                for run in group:
+                    os.remove(run)
+            runs = merged
+
+        items = _merge([_read_run(run) for run in runs], get_key, reverse)
+        if key is None:
+            yield from items
+        else:
+            for _, item in items:
+                yield item
+
+
+def _sort_chunk(chunk, key, reverse):
+    """Sorts a chunk with mergesort without decorating it a second time:
+    with a key, the items are turned into (key, index, item) triples, whose
+    indices settle ties between equal keys so that items are never compared
+
+    :param chunk: The items read into memory
+    :type chunk: list
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :return: The sorted items, or triples with a key
+    :rtype: list
+    """
+
+    # a stable ascending sort leaves equal keys in their original order
+    # after the chunk is turned around if they were in reverse order before:
+    # reversed items, or indices counting down
+    if key is not None:
+        step = -1 if reverse else 1
+        chunk = [(key(item), i, item) for i, item in
+                 zip(range(0, step * len(chunk), step), chunk)]
+    elif reverse:
+        chunk.reverse()
+    mergesort(chunk, inplace=True)
+    if reverse:
+        chunk.reverse()
+    return chunk
+
+
+def _spill(items, directory):
+    """Writes a sorted run to a new temporary file
+
+    :param items: The items of the run, in order
+    :type items: iterable
+    :param directory: Directory to create the file in
+    :type directory: str
+    :return: Path of the run file
+    :rtype: str
+    """
+
+    it = iter(items)
+    with tempfile.NamedTemporaryFile(dir=directory, suffix='.run',
+                                     delete=False) as f:
+        block = [*islice(it, BLOCK_SIZE)]
+        while block:
+            pickle.dump(block, f, pickle.HIGHEST_PROTOCOL)
+            block = [*islice(it, BLOCK_SIZE)]
+        return f.name
+
+
+def _read_run(path):
+    """Streams the items of a run file back in order
+
+    :param path: Path of the run file
+    :type path: str
+    :return: Generator of the run's items
+    :rtype: generator
+    """
+
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                block = pickle.load(f)
+            except EOFError:
+                return
+            yield from block
+
+
+def _merge(runs, get_key=None, reverse=False):
+    """Merges sorted runs into one sorted stream with a k-way merge. Ties are
+    broken by run order, so the merge is stable.
+
+    :param runs: Iterators over the sorted runs, in input order
+    :type runs: list
+    :param get_key: Function extracting the comparison key of an item
+    :type get_key: function
+    :param reverse: The runs are in descending order
+    :type reverse: bool
+    :return: Generator of the merged items
+    :rtype: generator
+    """
+
+    pq = MinPriorityQueue()
+
+    def enqueue(i, item):
+        k = item if get_key is None else get_key(item)
+        pq.enqueue((i, item), (Reversed(k) if reverse else k, i))
+
+    for i, run in enumerate(runs):
+        for item in run:
+            enqueue(i, item)
+            break
+    while pq:
+        i, item = pq.dequeue()
+        yield item
+        for item in runs[i]:
+            enqueue(i, item)
+            break
+
+
+if __name__ == "__main__":
+
+    import io
+    import unittest
+    from random import randrange
+    from types import GeneratorType
+
+
+    class TestExternalSort(unittest.TestCase):
+
+        def setUp(self):
+            self.data = [randrange(500) for _ in range(2000)]
+
+        def test_external_sort(self):
+            self.assertEqual(sorted(self.data),
+                             list(external_sort(self.data, chunk_size=100)))
+
+        def test_multiple_passes(self):
+            result = external_sort(self.data, chunk_size=30, fan_in=3)
+            self.assertEqual(sorted(self.data), list(result))
+
+        def test_key_reverse(self):
+            pairs = [(x % 7, i) for i, x in enumerate(self.data)]
+            first = itemgetter(0)
+            self.assertEqual(
+                sorted(pairs, key=first, reverse=True),
+                list(external_sort(pairs, key=first, reverse=True,
+                                   chunk_size=50, fan_in=4)))
+            self.assertEqual(
+                sorted(self.data, reverse=True),
+                list(external_sort(self.data, reverse=True, chunk_size=64)))
+
+        def test_key_not_comparable(self):
+            rows = [{'k': x % 7, 'i': i} for i, x in enumerate(self.data)]
+            k = itemgetter('k')
+            for reverse in (False, True):
+                self.assertEqual(
+                    sorted(rows, key=k, reverse=reverse),
+                    list(external_sort(rows, key=k, reverse=reverse,
+                                       chunk_size=70, fan_in=5)))
+
+        def test_file(self):
+            lines = ["{:03d}\n".format(x) for x in self.data]
+            f = io.StringIO("".join(lines))
+            self.assertEqual(sorted(lines),
+                             list(external_sort(f, chunk_size=128)))
+
+        def test_lazy(self):
+            result = external_sort(self.data, chunk_size=100)
+            self.assertIsInstance(result, GeneratorType)
+            self.assertEqual(min(self.data), next(result))
+            result.close()
+
+        def test_empty(self):
+            self.assertEqual([], list(external_sort([])))
+
+        def test_invalid(self):
+            self.assertRaises(ValueError, external_sort, [], chunk_size=0)
+            self.assertRaises(ValueError, external_sort, [], fan_in=1)
+
+
+    unittest.main()
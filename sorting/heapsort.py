@@ -1,54 +1,200 @@
 """Sorting Algorithm: Heapsort"""
 
+from sorting.decorate import sort_by_key
 
-def heapsort(a):
+
+def heapsort(a, inplace=False, key=None, reverse=False, arity=2,
+             bounce=False):
     """Heapsort
 
         Time complexity: O(nlogn)
         Space complexity: O(1)
 
-        :param a: A list to be sorted
+        A heap with a larger arity (e.g. 4 or 8) is shallower, so each
+        sift-down visits fewer levels of adjacent children. The "bounce"
+        sift-down used when removing the largest item first walks the hole
+        left at the root down to a leaf along the larger children, then
+        climbs back up to place the displaced item; since that item nearly
+        always belongs near the bottom, this saves close to half the
+        comparisons.
+
+        :param a: A sequence to be sorted
         :type a: list
-        :return: A new sorted list
+        :param inplace: Sort a itself (any mutable sequence, including
+            array.array and writable memoryview) rather than a copy
+        :type inplace: bool
+        :param key: Function computing the comparison key of an item
+        :type key: function
+        :param reverse: Sort in descending order
+        :type reverse: bool
+        :param arity: Number of children of each heap node
+        :type arity: int
+        :param bounce: Use the bounce sift-down when removing items
+        :type bounce: bool
+        :return: A new sorted list, or a itself when sorted in place
         :rtype: list
+        :raises: ValueError
         """
 
-    b = [*a]
-    n = len(b)
-    for i in range(n, -1, -1):
-        _heapify(b, n, i)
-    for i in range(n-1, 0, -1):
-        b[0], b[i] = b[i], b[0]
-        _heapify(b, i, 0)
+    if arity < 2:
+        raise ValueError("The heap arity must be at least 2.")
+    if key is not None or reverse:
+        return sort_by_key(heapsort, a, key, reverse, inplace, arity=arity,
+                           bounce=bounce)
+    b = a if inplace else [*a]
+    if arity == 2 and not bounce:
+        _sort(b, 0, len(b)-1)
+    else:
+        _sort_dary(b, 0, len(b)-1, arity, bounce)
     return b
 
 
-def _heapify(heap, n, i):
+def _sort(srt, start, end):
+    """Sorts a sub list by heap ordering it in place and repeatedly moving the
+    largest item to the end of the unsorted region
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param start: The beginning index of the sub list to be sorted
+    :type start: int
+    :param end: The ending index of the sub list to be sorted
+    :type end: int
+    """
+
+    n = end - start + 1
+    for i in range(n//2 - 1, -1, -1):
+        _heapify(srt, n, i, start)
+    for i in range(n-1, 0, -1):
+        srt[start], srt[start+i] = srt[start+i], srt[start]
+        _heapify(srt, i, 0, start)
+
+
+def _heapify(heap, n, i, offset=0):
     """Creates a heap-ordered binary tree
 
     :param heap: A list to heap order
     :type heap: list
     :param n: Length of sub list to heapify
     :type n: int
-    :param i: Index of element to heap order
+    :param i: Index of element to heap order, relative to offset
     :type i: int
+    :param offset: Index in heap where the sub list begins
+    :type offset: int
+    """
+
+    item = heap[offset+i]
+    while True:
+        l = i * 2 + 1
+        if l >= n:
+            break
+        r = l + 1
+        max = r if r < n and heap[offset+l] < heap[offset+r] else l
+        if not item < heap[offset+max]:
+            break
+        heap[offset+i] = heap[offset+max]
+        i = max
+    heap[offset+i] = item
+
+
+def _sort_dary(srt, start, end, arity, bounce=False):
+    """Sorts a sub list with a d-ary heap: builds the heap bottom-up, then
+    repeatedly moves the largest item to the end of the unsorted region
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param start: The beginning index of the sub list to be sorted
+    :type start: int
+    :param end: The ending index of the sub list to be sorted
+    :type end: int
+    :param arity: Number of children of each heap node
+    :type arity: int
+    :param bounce: Use the bounce sift-down when removing items
+    :type bounce: bool
     """
 
-    max = i
-    l = i * 2 + 1
-    r = i * 2 + 2
-    if l < n and heap[i] < heap[l]:
-        max = l
-    if r < n and heap[max] < heap[r]:
-        max = r
-    if max != i:
-        heap[i], heap[max] = heap[max], heap[i]
-        _heapify(heap, n, max)
+    n = end - start + 1
+    for i in range((n-2) // arity, -1, -1):
+        _sift_down(srt, n, i, start, arity)
+    sift = _sift_bounce if bounce else _sift_down
+    for i in range(n-1, 0, -1):
+        srt[start], srt[start+i] = srt[start+i], srt[start]
+        sift(srt, i, 0, start, arity)
+
+
+def _sift_down(heap, n, i, offset, arity):
+    """Moves an item of a d-ary heap down until it is no smaller than any of
+    its children
+
+    :param heap: A list to heap order
+    :type heap: list
+    :param n: Length of sub list to heapify
+    :type n: int
+    :param i: Index of element to heap order, relative to offset
+    :type i: int
+    :param offset: Index in heap where the sub list begins
+    :type offset: int
+    :param arity: Number of children of each heap node
+    :type arity: int
+    """
+
+    item = heap[offset+i]
+    while True:
+        first = i * arity + 1
+        if first >= n:
+            break
+        max = first
+        for c in range(first + 1, min(first + arity, n)):
+            if heap[offset+max] < heap[offset+c]:
+                max = c
+        if not item < heap[offset+max]:
+            break
+        heap[offset+i] = heap[offset+max]
+        i = max
+    heap[offset+i] = item
+
+
+def _sift_bounce(heap, n, i, offset, arity):
+    """Moves an item of a d-ary heap to its place by first promoting the
+    larger child at every level down to a leaf, then climbing back up from
+    that leaf until the item fits
+
+    :param heap: A list to heap order
+    :type heap: list
+    :param n: Length of sub list to heapify
+    :type n: int
+    :param i: Index of element to heap order, relative to offset
+    :type i: int
+    :param offset: Index in heap where the sub list begins
+    :type offset: int
+    :param arity: Number of children of each heap node
+    :type arity: int
+    """
+
+    item = heap[offset+i]
+    top = j = i
+    while True:
+        first = j * arity + 1
+        if first >= n:
+            break
+        max = first
+        for c in range(first + 1, min(first + arity, n)):
+            if heap[offset+max] < heap[offset+c]:
+                max = c
+        heap[offset+j] = heap[offset+max]
+        j = max
+    while j > top:
+        parent = (j - 1) // arity
+        if not heap[offset+parent] < item:
+            break
+        heap[offset+j] = heap[offset+parent]
+        j = parent
+    heap[offset+j] = item
 
 
 if __name__ == "__main__":
 
     import unittest
+    from array import array
     from random import shuffle
 
 
@@ -64,5 +210,33 @@ if __name__ == "__main__":
             self.assertEqual(self.ordered, heapsort(self.shuffled))
             self.assertNotEqual(self.ordered, self.shuffled)
 
+        def test_dary(self):
+            data = [*self.shuffled] * 30
+            for arity in (2, 3, 4, 8):
+                for bounce in (False, True):
+                    self.assertEqual(sorted(data),
+                                     heapsort(data, arity=arity,
+                                              bounce=bounce))
+            self.assertEqual(self.ordered[::-1],
+                             heapsort(self.shuffled, reverse=True, arity=4))
+            self.assertRaises(ValueError, heapsort, data, arity=1)
+
+        def test_inplace(self):
+            data = array('i', self.shuffled)
+            self.assertIs(data, heapsort(data, inplace=True))
+            self.assertEqual(self.ordered, list(data))
+
+            view = memoryview(array('i', self.shuffled))
+            heapsort(view, inplace=True)
+            self.assertEqual(self.ordered, view.tolist())
+
+        def test_key(self):
+            words = ['pear', 'fig', 'apple', 'kiwi', 'plum', 'date']
+            self.assertEqual(sorted(words, key=len), heapsort(words, key=len))
+            self.assertEqual(sorted(words, key=len, reverse=True),
+                             heapsort(words, key=len, reverse=True))
+            self.assertEqual(self.ordered[::-1],
+                             heapsort(self.shuffled, reverse=True))
+
 
     unittest.main()
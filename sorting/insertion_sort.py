@@ -1,32 +1,113 @@
 """Sorting Algorithm: Insertion Sort"""
 
+from bisect import bisect_right
 
-def insertion_sort(a):
+from sorting.decorate import sort_by_key
+
+
+def insertion_sort(a, inplace=False, key=None, reverse=False):
     """Insertion Sort
 
     Time complexity: Between O(n) and O(n^2)
     Space complexity: O(1)
 
-    :param a: A list to be sorted
+    :param a: A sequence to be sorted
     :type a: list
-    :return: A new sorted list
+    :param inplace: Sort a itself (any mutable sequence, including
+        array.array and writable memoryview) rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :return: A new sorted list, or a itself when sorted in place
     :rtype: list
     """
 
-    b = [*a]
-    for i in range(len(b)):
-        temp = b[i]
+    if key is not None or reverse:
+        return sort_by_key(insertion_sort, a, key, reverse, inplace)
+    b = a if inplace else [*a]
+    _sort(b, 0, len(b)-1)
+    return b
+
+
+def binary_insertion_sort(a, inplace=False, key=None, reverse=False):
+    """Binary Insertion Sort
+
+    Finds where each item goes with a binary search over the items already
+    sorted, then shifts them along in one slice assignment, so it makes
+    O(nlogn) comparisons rather than O(n^2). Stable.
+
+    Time complexity: Between O(n) and O(n^2)
+    Space complexity: O(1)
+
+    :param a: A sequence to be sorted
+    :type a: list
+    :param inplace: Sort a itself (any mutable sequence, including
+        array.array and writable memoryview) rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :return: A new sorted list, or a itself when sorted in place
+    :rtype: list
+    """
+
+    if key is not None or reverse:
+        return sort_by_key(binary_insertion_sort, a, key, reverse, inplace)
+    b = a if inplace else [*a]
+    _binary_insertion_sort(b, 0, len(b), 1)
+    return b
+
+
+def _sort(srt, start, end):
+    """Sorts a sub list in place by shifting each item left until it meets an
+    item of equal or lower rank
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param start: The beginning index of the sub list to be sorted
+    :type start: int
+    :param end: The ending index of the sub list to be sorted
+    :type end: int
+    """
+
+    for i in range(start+1, end+1):
+        temp = srt[i]
         j = i - 1
-        while j >= 0 and b[j] > temp:
-            b[j+1] = b[j]
+        while j >= start and srt[j] > temp:
+            srt[j+1] = srt[j]
             j -= 1
-        b[j+1] = temp
-    return b
+        srt[j+1] = temp
+
+
+def _binary_insertion_sort(srt, lo, hi, start):
+    """Sorts srt[lo:hi] in place given that srt[lo:start] is already sorted,
+    finding each insertion point with a binary search
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param lo: The beginning index of the sub list
+    :type lo: int
+    :param hi: The index just past the end of the sub list
+    :type hi: int
+    :param start: The index of the first item not known to be in order
+    :type start: int
+    """
+
+    for i in range(start, hi):
+        pivot = srt[i]
+        pos = bisect_right(srt, pivot, lo, i)
+        if pos < i:
+            srt[pos+1:i+1] = srt[pos:i]
+            srt[pos] = pivot
 
 
 if __name__ == "__main__":
 
     import unittest
+    from array import array
     from random import shuffle
 
 
@@ -42,5 +123,38 @@ if __name__ == "__main__":
             self.assertEqual(self.ordered, insertion_sort(self.shuffled))
             self.assertNotEqual(self.ordered, self.shuffled)
 
+        def test_binary_insertion_sort(self):
+            self.assertEqual(self.ordered,
+                             binary_insertion_sort(self.shuffled))
+            self.assertEqual([], binary_insertion_sort([]))
+            pairs = [(x % 3, x) for x in self.shuffled]
+            first = lambda p: p[0]
+            self.assertEqual(sorted(pairs, key=first),
+                             binary_insertion_sort(pairs, key=first))
+            self.assertEqual(sorted(pairs, key=first, reverse=True),
+                             binary_insertion_sort(pairs, key=first,
+                                                   reverse=True))
+            view = memoryview(array('i', self.shuffled))
+            binary_insertion_sort(view, inplace=True)
+            self.assertEqual(self.ordered, view.tolist())
+
+        def test_inplace(self):
+            data = array('i', self.shuffled)
+            self.assertIs(data, insertion_sort(data, inplace=True))
+            self.assertEqual(self.ordered, list(data))
+
+            view = memoryview(array('i', self.shuffled))
+            insertion_sort(view, inplace=True)
+            self.assertEqual(self.ordered, view.tolist())
+
+        def test_key(self):
+            words = ['pear', 'fig', 'apple', 'kiwi', 'plum', 'date']
+            self.assertEqual(sorted(words, key=len),
+                             insertion_sort(words, key=len))
+            self.assertEqual(sorted(words, key=len, reverse=True),
+                             insertion_sort(words, key=len, reverse=True))
+            self.assertEqual(self.ordered[::-1],
+                             insertion_sort(self.shuffled, reverse=True))
+
 
     unittest.main()
@@ -0,0 +1,396 @@
+"""Sorting Utility: Instrumentation
+
+Counts what the package's sorts do while an instrument() block is active:
+comparisons and element moves on tracked data, recursion depth, peak
+auxiliary memory and the time spent in each phase (partitions, merges, ...).
+Outside such a block nothing is patched or wrapped, so the sorts run without
+any overhead.
+
+The patching is process-wide, so only one block may be active at a time:
+instrument() is not re-entrant and raises RuntimeError while another block,
+on any thread, is open. Calls made on other threads during a block pass
+through the wrappers without being counted, at the cost of one extra call.
+
+Example:
+
+    with instrument() as stats:
+        quicksort(stats.track(data), inplace=True)
+    print(stats.comparisons, stats.moves, stats.max_depth, stats.phases)
+"""
+
+import importlib
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# held while an instrument() block is active
+_LOCK = threading.Lock()
+
+# (module, attribute) of functions whose nested calls count toward depth
+RECURSIVE = (
+    ('sorting.quicksort', '_sort'),
+    ('sorting.quicksort', '_sort_3way'),
+    ('sorting.quicksort', '_sort_dual'),
+    ('sorting.mergesort', 'mergesort'),
+    ('sorting.introsort', '_sort'),
+)
+
+# (module, attribute, phase) of functions whose calls are timed as a phase
+PHASES = (
+    ('sorting.quicksort', '_partition', 'partition'),
+    ('sorting.quicksort', '_partition_3way', 'partition'),
+    ('sorting.quicksort', '_partition_dual', 'partition'),
+    ('sorting.quicksort', '_network_sort', 'network'),
+    ('sorting.introsort', '_partition', 'partition'),
+    ('sorting.introsort', '_heapsort', 'heapsort'),
+    ('sorting.introsort', '_insertion_sort', 'insertion_sort'),
+    ('sorting.selection', '_partition_3way', 'partition'),
+    ('sorting.selection', '_median_of_medians', 'median_of_medians'),
+    ('sorting.mergesort', '_merge', 'merge'),
+    ('sorting.mergesort', '_merge_runs', 'merge'),
+    ('sorting.mergesort', '_binary_insertion_sort', 'insertion_sort'),
+    ('sorting.block_merge_sort', '_sym_merge', 'merge'),
+    ('sorting.heapsort', '_heapify', 'heapify'),
+    ('sorting.heapsort', '_sift_down', 'heapify'),
+    ('sorting.heapsort', '_sift_bounce', 'heapify'),
+    ('sorting.timsort', '_count_run', 'count_run'),
+    ('sorting.timsort', '_binary_insertion_sort', 'insertion_sort'),
+    ('sorting.timsort', '_MergeState._merge_at', 'merge'),
+)
+
+
+class SortStats:
+    """Counters collected during an instrument() block"""
+
+    __slots__ = ('comparisons', 'moves', 'depth', 'max_depth', 'peak_bytes',
+                 'seconds', 'phases', '_active', '_thread')
+
+    def __init__(self):
+        """SortStats constructor"""
+
+        self.comparisons = 0
+        self.moves = 0
+        self.depth = 0
+        self.max_depth = 0
+        self.peak_bytes = None
+        self.seconds = 0.
+        self.phases = {}
+        self._active = set()
+        self._thread = threading.get_ident()
+
+    def track(self, a):
+        """Wraps a sequence so that comparisons between its items, and moves
+        made while it is sorted in place, are counted
+
+        :param a: A sequence to be sorted
+        :type a: list
+        :return: The tracked copy to pass to a sort function
+        :rtype: list
+        """
+
+        return TrackedList(self, (Probe(self, item) for item in a))
+
+    @staticmethod
+    def untrack(a):
+        """Unwraps the items of a tracked (and possibly sorted) sequence
+
+        :param a: A sequence of Probe items
+        :type a: list
+        :return: The original items, in the order of a
+        :rtype: list
+        """
+
+        return [probe.value for probe in a]
+
+    def as_dict(self):
+        """Reports the counters as a plain dict, e.g. for a metrics pipeline
+
+        :return: The counters
+        :rtype: dict
+        """
+
+        return {
+            'comparisons': self.comparisons,
+            'moves': self.moves,
+            'max_depth': self.max_depth,
+            'peak_bytes': self.peak_bytes,
+            'seconds': self.seconds,
+            'phases': {name: {'calls': calls, 'seconds': seconds}
+                       for name, (calls, seconds) in self.phases.items()},
+        }
+
+
+class Probe:
+    """Wraps an item and counts every comparison made against it"""
+
+    __slots__ = 'stats', 'value'
+
+    def __init__(self, stats, value):
+        """Probe constructor
+
+        :param stats: The counters to update
+        :type stats: SortStats
+        :param value: The wrapped item
+        """
+
+        self.stats = stats
+        self.value = value
+
+    def __lt__(self, other):
+        self.stats.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        self.stats.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        self.stats.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        self.stats.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        self.stats.comparisons += 1
+        return self.value == other.value
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, self.value)
+
+
+class TrackedList(list):
+    """A list that counts the items written into it"""
+
+    __slots__ = 'stats',
+
+    def __init__(self, stats, iterable=()):
+        """TrackedList constructor
+
+        :param stats: The counters to update
+        :type stats: SortStats
+        :param iterable: The initial items
+        :type iterable: iterable
+        """
+
+        super().__init__(iterable)
+        self.stats = stats
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = [*value]
+            self.stats.moves += len(value)
+        else:
+            self.stats.moves += 1
+        super().__setitem__(index, value)
+
+
+@contextmanager
+def instrument(callback=None, memory=False):
+    """Instruments the package's sorts for the duration of a with block
+
+    :param callback: Function called with the SortStats when the block exits
+    :type callback: function
+    :param memory: Trace peak memory allocated in the block (slows it down)
+    :type memory: bool
+    :return: Context manager yielding the SortStats being collected
+    :raises: RuntimeError
+    """
+
+    if not _LOCK.acquire(blocking=False):
+        raise RuntimeError("Another instrument() block is already active.")
+    stats = SortStats()
+    originals = []
+    try:
+        for module, path in RECURSIVE:
+            originals.append(_patch(module, path, _recursive(stats)))
+        for module, path, phase in PHASES:
+            originals.append(_patch(module, path, _phase(stats, phase)))
+        if memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            stats.seconds = time.perf_counter() - start
+            if memory:
+                stats.peak_bytes = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+    finally:
+        for owner, name, original in reversed(originals):
+            setattr(owner, name, original)
+        _LOCK.release()
+    if callback is not None:
+        callback(stats)
+
+
+def _patch(module, path, wrap):
+    """Replaces a function by a wrapper around it
+
+    :param module: Name of the module holding the function
+    :type module: str
+    :param path: Attribute path of the function in the module
+    :type path: str
+    :param wrap: Function returning the wrapper for a function
+    :type wrap: function
+    :return: The owner, attribute name and original function
+    :rtype: tuple
+    """
+
+    owner = importlib.import_module(module)
+    *parents, name = path.split('.')
+    for parent in parents:
+        owner = getattr(owner, parent)
+    original = getattr(owner, name)
+    setattr(owner, name, wrap(original))
+    return owner, name, original
+
+
+def _recursive(stats):
+    """Makes wrappers that track the nesting depth of calls
+
+    :param stats: The counters to update
+    :type stats: SortStats
+    :return: Function returning the wrapper for a function
+    :rtype: function
+    """
+
+    def wrap(func):
+        def wrapper(*args, **kwargs):
+            if threading.get_ident() != stats._thread:
+                return func(*args, **kwargs)
+            stats.depth += 1
+            if stats.depth > stats.max_depth:
+                stats.max_depth = stats.depth
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.depth -= 1
+        return wrapper
+    return wrap
+
+
+def _phase(stats, phase):
+    """Makes wrappers that count and time calls as a phase. Calls nested in a
+    call of the same phase (e.g. recursive ones) are not counted again.
+
+    :param stats: The counters to update
+    :type stats: SortStats
+    :param phase: Name of the phase
+    :type phase: str
+    :return: Function returning the wrapper for a function
+    :rtype: function
+    """
+
+    def wrap(func):
+        def wrapper(*args, **kwargs):
+            if phase in stats._active or \
+                    threading.get_ident() != stats._thread:
+                return func(*args, **kwargs)
+            stats._active.add(phase)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                calls, seconds = stats.phases.get(phase, (0, 0.))
+                stats.phases[phase] = (calls + 1,
+                                       seconds + time.perf_counter() - start)
+                stats._active.discard(phase)
+        return wrapper
+    return wrap
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from random import shuffle
+
+    from sorting import heapsort as heapsort_module
+    from sorting import quicksort as quicksort_module
+    from threading import Thread
+
+    from sorting.heapsort import heapsort
+    from sorting.mergesort import mergesort
+    from sorting.quicksort import quicksort
+    from sorting.timsort import timsort
+
+
+    class TestInstrument(unittest.TestCase):
+
+        def setUp(self):
+            self.ordered = [x for x in range(200)]
+            self.shuffled = [*self.ordered]
+            while self.ordered == self.shuffled:
+                shuffle(self.shuffled)
+
+        def test_quicksort(self):
+            with instrument() as stats:
+                data = stats.track(self.shuffled)
+                quicksort(data, inplace=True)
+            self.assertEqual(self.ordered, stats.untrack(data))
+            self.assertGreater(stats.comparisons, 199)
+            self.assertGreater(stats.moves, 0)
+            self.assertGreater(stats.max_depth, 1)
+            self.assertIn('partition', stats.phases)
+            self.assertEqual(0, stats.depth)
+
+        def test_mergesort(self):
+            with instrument() as stats:
+                mergesort(stats.track(self.shuffled), cutoff=0)
+            self.assertEqual(8, stats.max_depth)
+            self.assertIn('merge', stats.phases)
+            with instrument() as stats:
+                mergesort(stats.track(self.shuffled))
+            self.assertEqual(4, stats.max_depth)
+            self.assertIn('insertion_sort', stats.phases)
+            with instrument() as stats:
+                timsort(stats.track(self.shuffled))
+            self.assertIn('merge', stats.phases)
+
+        def test_recursive_phase(self):
+            with instrument() as stats:
+                heapsort(self.shuffled)
+            calls, _ = stats.phases['heapify']
+            self.assertLess(calls, 2 * len(self.shuffled))
+
+        def test_callback_and_memory(self):
+            reports = []
+            with instrument(reports.append, memory=True):
+                heapsort(self.shuffled)
+            self.assertEqual(1, len(reports))
+            self.assertGreater(reports[0].peak_bytes, 0)
+            self.assertIn('heapify', reports[0].as_dict()['phases'])
+
+        def test_top_level_depth(self):
+            for partition in ('lomuto', 'three_way', 'dual_pivot'):
+                with instrument() as stats:
+                    quicksort(self.shuffled, partition, cutoff=500)
+                self.assertEqual(1, stats.max_depth)
+
+        def test_exclusive(self):
+            with instrument():
+                with self.assertRaises(RuntimeError):
+                    with instrument():
+                        pass
+                worker = Thread(target=heapsort, args=(self.shuffled,))
+                worker.start()
+                worker.join()
+            with instrument() as stats:
+                worker = Thread(target=quicksort, args=(self.shuffled,))
+                worker.start()
+                worker.join()
+            self.assertEqual({}, stats.phases)
+            self.assertEqual(0, stats.max_depth)
+
+        def test_restored(self):
+            partition = quicksort_module._partition
+            heapify = heapsort_module._heapify
+            with instrument():
+                self.assertIsNot(partition, quicksort_module._partition)
+            self.assertIs(partition, quicksort_module._partition)
+            self.assertIs(heapify, heapsort_module._heapify)
+
+
+    unittest.main()
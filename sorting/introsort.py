@@ -0,0 +1,133 @@
+"""Sorting Algorithm: Introsort"""
+
+import math
+
+from sorting.decorate import sort_by_key
+from sorting.heapsort import _sort as _heapsort
+from sorting.insertion_sort import _sort as _insertion_sort
+from sorting.quicksort import _median_of_three, _partition
+
+# sub lists at or below this length are finished with insertion sort
+CUTOFF = 16
+
+
+def introsort(a, inplace=False, key=None, reverse=False):
+    """Introsort
+
+    Quicksort with median-of-three pivots that falls back to heapsort once
+    the recursion depth exceeds 2log2(n), and finishes small sub lists with
+    insertion sort. No shuffle is needed to guard against bad inputs.
+
+    Time complexity: O(nlogn)
+    Space complexity: O(logn)
+
+    :param a: A sequence to be sorted
+    :type a: list
+    :param inplace: Sort a itself (any mutable sequence, including
+        array.array and writable memoryview) rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :return: A new sorted list, or a itself when sorted in place
+    :rtype: list
+    """
+
+    if key is not None or reverse:
+        return sort_by_key(introsort, a, key, reverse, inplace)
+    b = a if inplace else [*a]
+    n = len(b)
+    if n > 1:
+        _sort(b, 0, n-1, 2 * int(math.log2(n)))
+    return b
+
+
+def _sort(srt, start, end, depth):
+    """Sorts a list by partitioning it until either the sub lists are small
+    enough for insertion sort or the depth limit is reached, at which point
+    the remaining sub list is heapsorted. Recurses into the smaller side of
+    each partition and loops on the larger one.
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param start: The beginning index of the sub list to be sorted
+    :type start: int
+    :param end: The ending index of the sub list to be sorted
+    :type end: int
+    :param depth: Number of partitioning levels left before heapsort
+    :type depth: int
+    """
+
+    while end - start >= CUTOFF:
+        if depth == 0:
+            _heapsort(srt, start, end)
+            return
+        depth -= 1
+        _median_of_three(srt, start, end)
+        p = _partition(srt, start, end)
+        if p - start < end - p:
+            _sort(srt, start, p-1, depth)
+            start = p + 1
+        else:
+            _sort(srt, p+1, end, depth)
+            end = p - 1
+    _insertion_sort(srt, start, end)
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from array import array
+    from random import randrange, shuffle
+
+
+    class TestIntrosort(unittest.TestCase):
+
+        def setUp(self):
+            self.ordered = [x for x in range(20)]
+            self.shuffled = [*self.ordered]
+            while self.ordered == self.shuffled:
+                shuffle(self.shuffled)
+
+        def test_introsort(self):
+            self.assertEqual(self.ordered, introsort(self.shuffled))
+            self.assertNotEqual(self.ordered, self.shuffled)
+
+        def test_inplace(self):
+            data = array('i', self.shuffled)
+            self.assertIs(data, introsort(data, inplace=True))
+            self.assertEqual(self.ordered, list(data))
+
+            view = memoryview(array('i', self.shuffled))
+            introsort(view, inplace=True)
+            self.assertEqual(self.ordered, view.tolist())
+
+        def test_key(self):
+            words = ['pear', 'fig', 'apple', 'kiwi', 'plum', 'date']
+            self.assertEqual(sorted(words, key=len), introsort(words, key=len))
+            self.assertEqual(sorted(words, key=len, reverse=True),
+                             introsort(words, key=len, reverse=True))
+            self.assertEqual(self.ordered[::-1],
+                             introsort(self.shuffled, reverse=True))
+
+        def test_large(self):
+            data = [randrange(1000) for _ in range(5000)]
+            self.assertEqual(sorted(data), introsort(data))
+
+        def test_presorted(self):
+            data = list(range(1000))
+            self.assertEqual(data, introsort(data))
+            self.assertEqual(data, introsort(data[::-1]))
+
+        def test_duplicates(self):
+            # Lomuto partitioning degrades on equal keys: heapsort takes over
+            data = [7] * 2000 + [3] * 2000
+            self.assertEqual(sorted(data), introsort(data))
+
+        def test_empty(self):
+            self.assertEqual([], introsort([]))
+            self.assertEqual([1], introsort([1]))
+
+
+    unittest.main()
@@ -0,0 +1,181 @@
+"""Sorting Algorithm: Linked List Mergesort"""
+
+
+def linked_list_sort(head, key=None, reverse=False):
+    """Linked List Mergesort
+
+    Sorts a singly linked list of nodes with value and next attributes (such
+    as those of containers.Queue and containers.Stack) by relinking the
+    nodes: merges adjacent runs of width 1, 2, 4, ... bottom-up, splitting
+    them off by walking the list, so no node is created, no item is copied
+    and there is no recursion. Stable.
+
+    Time complexity: O(nlogn)
+    Space complexity: O(1)
+
+    :param head: The first node of the list
+    :type head: _Node
+    :param key: Function computing the comparison key of an item; since no
+        keys are stored, it is called on every comparison
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :return: The first and last nodes of the sorted list
+    :rtype: tuple
+    """
+
+    if head is None:
+        return None, None
+    tail = head
+    width = 1
+    while True:
+        cursor = head
+        head = tail = None
+        merges = 0
+        while cursor is not None:
+            left = cursor
+            right = _split(left, width)
+            cursor = _split(right, width)
+            first, last = _merge(left, right, key, reverse)
+            if tail is None:
+                head = first
+            else:
+                tail.next = first
+            tail = last
+            merges += 1
+        if merges == 1:
+            return head, tail
+        width *= 2
+
+
+def _split(node, width):
+    """Cuts a list after its first width nodes
+
+    :param node: The first node of the list
+    :type node: _Node
+    :param width: The number of nodes to keep
+    :type width: int
+    :return: The first node after the cut, None if there are no more
+    :rtype: _Node
+    """
+
+    for _ in range(width - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _merge(left, right, key, reverse):
+    """Merges two ordered lists by relinking their nodes, taking the left
+    node when both compare equal
+
+    :param left: The first node of the left list
+    :type left: _Node
+    :param right: The first node of the right list, or None
+    :type right: _Node
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Merge in descending order
+    :type reverse: bool
+    :return: The first and last nodes of the merged list
+    :rtype: tuple
+    """
+
+    head = tail = None
+    while left is not None and right is not None:
+        a, b = left.value, right.value
+        if key is not None:
+            a, b = key(a), key(b)
+        if (a < b) if reverse else (b < a):
+            node, right = right, right.next
+        else:
+            node, left = left, left.next
+        if tail is None:
+            head = node
+        else:
+            tail.next = node
+        tail = node
+    rest = left if right is None else right
+    if tail is None:
+        head = rest
+    else:
+        tail.next = rest
+    tail = rest
+    while tail.next is not None:
+        tail = tail.next
+    return head, tail
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from random import randrange
+
+
+    class _Node:
+        """A data node in a singly linked list"""
+
+        __slots__ = 'value', 'next'
+
+        def __init__(self, value, next=None):
+            self.value = value
+            self.next = next
+
+
+    def _link(values):
+        head = None
+        for value in reversed(values):
+            head = _Node(value, head)
+        return head
+
+
+    def _unlink(head):
+        values = []
+        while head is not None:
+            values.append(head.value)
+            head = head.next
+        return values
+
+
+    class TestLinkedListSort(unittest.TestCase):
+
+        def setUp(self):
+            self.data = [randrange(100) for _ in range(1000)]
+
+        def test_linked_list_sort(self):
+            for n in (0, 1, 2, 3, 17, 1000):
+                head, tail = linked_list_sort(_link(self.data[:n]))
+                self.assertEqual(sorted(self.data[:n]), _unlink(head))
+                if n:
+                    self.assertIsNone(tail.next)
+                    self.assertEqual(max(self.data[:n]), tail.value)
+
+        def test_relinks_nodes(self):
+            head = _link(self.data)
+            nodes = set()
+            node = head
+            while node is not None:
+                nodes.add(id(node))
+                node = node.next
+            head, _ = linked_list_sort(head)
+            node = head
+            while node is not None:
+                self.assertIn(id(node), nodes)
+                node = node.next
+
+        def test_key_reverse(self):
+            pairs = [(x % 7, i) for i, x in enumerate(self.data)]
+            first = lambda p: p[0]
+            head, _ = linked_list_sort(_link(pairs), key=first)
+            self.assertEqual(sorted(pairs, key=first), _unlink(head))
+            head, _ = linked_list_sort(_link(pairs), key=first, reverse=True)
+            self.assertEqual(sorted(pairs, key=first, reverse=True),
+                             _unlink(head))
+
+
+    unittest.main()
@@ -1,24 +1,64 @@
 """Sorting Algorithm: Mergesort"""
 
+from sorting.decorate import sort_by_key
+from sorting.insertion_sort import _binary_insertion_sort
 
-def mergesort(a):
+# sub lists of up to this many items are sorted with binary insertion sort
+CUTOFF = 16
+
+
+def mergesort(a, iterative=False, inplace=False, key=None, reverse=False,
+              cutoff=CUTOFF):
     """Mergesort
 
     Time complexity: O(nlogn)
     Space complexity: O(n)
 
-    :param a: A list to be sorted
+    The iterative (bottom-up) variant merges runs of width 1, 2, 4, ... back
+    and forth between the list and a single auxiliary buffer allocated once,
+    avoiding recursion and the per-level slice copies.
+
+    Both variants sort sub lists of up to cutoff items with binary insertion
+    sort instead of splitting them further, which saves most of the calls
+    and merges of the last few levels.
+
+    :param a: A sequence to be sorted
     :type a: list
-    :return: A new sorted list
+    :param iterative: Merge bottom-up rather than recursing
+    :type iterative: bool
+    :param inplace: Sort a itself (any mutable sequence, including
+        array.array and writable memoryview) rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :param cutoff: Size at or below which sub lists are insertion sorted
+    :type cutoff: int
+    :return: A new sorted list, or a itself when sorted in place
     :rtype: list
     """
 
-    b = [*a]
+    if key is not None or reverse:
+        return sort_by_key(mergesort, a, key, reverse, inplace,
+                           iterative=iterative, cutoff=cutoff)
+    b = a if inplace else [*a]
     n = len(b)
+    if iterative:
+        _sort_bottom_up(b, cutoff)
+        return b
+    if n <= cutoff:
+        _binary_insertion_sort(b, 0, n, 1)
+        return b
     if n <= 1:
         return b
     mid = n // 2
-    left, right = mergesort(b[:mid]), mergesort(b[mid:])
+    left, right = b[:mid], b[mid:]
+    if isinstance(b, memoryview):
+        # slices of a memoryview share its buffer rather than copying it
+        left, right = left.tolist(), right.tolist()
+    mergesort(left, inplace=True, cutoff=cutoff)
+    mergesort(right, inplace=True, cutoff=cutoff)
     return _merge(left, right, b)
 
 
@@ -50,12 +90,78 @@ def _merge(left, right, merged):
     return merged
 
 
+def _sort_bottom_up(srt, cutoff=0):
+    """Sorts a list in place by merging adjacent runs of doubling width,
+    alternating the source and destination between the list and one auxiliary
+    buffer
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param cutoff: Width of the runs to insertion sort before merging
+    :type cutoff: int
+    """
+
+    n = len(srt)
+    width = max(cutoff, 1)
+    if width > 1:
+        for lo in range(0, n, width):
+            _binary_insertion_sort(srt, lo, min(lo+width, n), lo+1)
+    src, dst = srt, [None] * n
+    while width < n:
+        for lo in range(0, n, 2*width):
+            _merge_runs(src, dst, lo, min(lo+width, n), min(lo+2*width, n))
+        src, dst = dst, src
+        width *= 2
+    if src is not srt:
+        for k in range(n):
+            srt[k] = src[k]
+
+
+def _merge_runs(src, dst, lo, mid, hi):
+    """Merges the ordered runs src[lo:mid] and src[mid:hi] into dst[lo:hi]
+
+    :param src: The list holding both runs
+    :type src: list
+    :param dst: The list receiving the merged run
+    :type dst: list
+    :param lo: The beginning index of the left run
+    :type lo: int
+    :param mid: The beginning index of the right run
+    :type mid: int
+    :param hi: The index just past the end of the right run
+    :type hi: int
+    """
+
+    i, j = lo, mid
+    for k in range(lo, hi):
+        if i < mid and (j >= hi or not src[j] < src[i]):
+            dst[k] = src[i]
+            i += 1
+        else:
+            dst[k] = src[j]
+            j += 1
+
+
 if __name__ == "__main__":
 
     import unittest
+    from array import array
     from random import shuffle
 
 
+    class _Pair(tuple):
+        """Compares on the first item only, to observe stability"""
+
+        def __new__(cls, key, value):
+            return super().__new__(cls, (key, value))
+
+        def __lt__(self, other):
+            return self[0] < other[0]
+
+        def __le__(self, other):
+            return self[0] <= other[0]
+
+
     class TestMergesort(unittest.TestCase):
 
         def setUp(self):
@@ -68,5 +174,56 @@ if __name__ == "__main__":
             self.assertEqual(self.ordered, mergesort(self.shuffled))
             self.assertNotEqual(self.ordered, self.shuffled)
 
+        def test_inplace(self):
+            data = array('i', self.shuffled)
+            self.assertIs(data, mergesort(data, inplace=True))
+            self.assertEqual(self.ordered, list(data))
+
+            view = memoryview(array('i', self.shuffled))
+            mergesort(view, inplace=True)
+            self.assertEqual(self.ordered, view.tolist())
+
+            data = array('d', self.shuffled * 50)
+            self.assertIs(data, mergesort(data, inplace=True))
+            self.assertEqual(sorted(self.shuffled * 50), list(data))
+            view = memoryview(array('q', self.shuffled * 50))
+            mergesort(view, inplace=True)
+            self.assertEqual(sorted(self.shuffled * 50), view.tolist())
+
+        def test_key(self):
+            words = ['pear', 'fig', 'apple', 'kiwi', 'plum', 'date']
+            self.assertEqual(sorted(words, key=len), mergesort(words, key=len))
+            self.assertEqual(sorted(words, key=len, reverse=True),
+                             mergesort(words, key=len, reverse=True))
+            self.assertEqual(self.ordered[::-1],
+                             mergesort(self.shuffled, reverse=True))
+
+        def test_iterative(self):
+            self.assertEqual(self.ordered,
+                             mergesort(self.shuffled, iterative=True))
+            self.assertEqual([], mergesort([], iterative=True))
+            data = [*self.shuffled, *self.shuffled, 5]
+            self.assertEqual(sorted(data), mergesort(data, iterative=True))
+
+        def test_cutoff(self):
+            data = [*self.shuffled] * 10
+            for cutoff in (0, 1, 7, 16, 64, 500):
+                self.assertEqual(sorted(data), mergesort(data, cutoff=cutoff))
+                self.assertEqual(sorted(data), mergesort(data, iterative=True,
+                                                         cutoff=cutoff))
+            pairs = [(x % 4, x) for x in data]
+            for iterative in (False, True):
+                self.assertEqual(sorted(pairs, key=lambda p: p[0]),
+                                 [(k, v) for k, v in mergesort(
+                                     [_Pair(k, v) for k, v in pairs],
+                                     iterative=iterative, cutoff=8)])
+
+        def test_iterative_stable(self):
+            pairs = [(x % 4, x) for x in self.shuffled]
+            self.assertEqual(sorted(pairs, key=lambda p: p[0]),
+                             [(k, v) for k, v in mergesort(
+                                 [_Pair(k, v) for k, v in pairs],
+                                 iterative=True)])
+
 
     unittest.main()
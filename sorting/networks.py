@@ -0,0 +1,217 @@
+"""Sorting Algorithm: Sorting Networks"""
+
+from sorting.decorate import sort_by_key
+from sorting.insertion_sort import _binary_insertion_sort
+
+# comparators (i, j), applied in order, of the smallest known sorting network
+# for each size; those for up to 13 items and for 16 items use the fewest
+# comparators possible, and those for 14 and 15 are pruned from the 16
+NETWORKS = {
+    2: ((0, 1),),
+    3: ((1, 2), (0, 2), (0, 1)),
+    4: ((0, 1), (2, 3), (0, 2), (1, 3), (1, 2)),
+    5: ((0, 3), (1, 4), (0, 2), (1, 3), (0, 1), (2, 4), (1, 2), (3, 4),
+        (2, 3)),
+    6: ((0, 5), (1, 3), (2, 4), (1, 2), (3, 4), (0, 3), (2, 5), (0, 1),
+        (2, 3), (4, 5), (1, 2), (3, 4)),
+    7: ((0, 6), (2, 3), (4, 5), (0, 2), (1, 4), (3, 6), (0, 1), (2, 5),
+        (3, 4), (1, 2), (4, 6), (2, 3), (4, 5), (1, 2), (3, 4), (5, 6)),
+    8: ((0, 2), (1, 3), (4, 6), (5, 7), (0, 4), (1, 5), (2, 6), (3, 7),
+        (0, 1), (2, 3), (4, 5), (6, 7), (2, 4), (3, 5), (1, 4), (3, 6),
+        (1, 2), (3, 4), (5, 6)),
+    9: ((0, 3), (1, 7), (2, 5), (4, 8), (0, 7), (2, 4), (3, 8), (5, 6),
+        (0, 2), (1, 3), (4, 5), (7, 8), (1, 4), (3, 6), (5, 7), (0, 1),
+        (2, 4), (3, 5), (6, 8), (2, 3), (4, 5), (6, 7), (1, 2), (3, 4),
+        (5, 6)),
+    10: ((0, 8), (1, 9), (2, 7), (3, 5), (4, 6), (0, 2), (1, 4), (5, 8),
+        (7, 9), (0, 3), (2, 4), (5, 7), (6, 9), (0, 1), (3, 6), (8, 9),
+        (1, 5), (2, 3), (4, 8), (6, 7), (1, 2), (3, 5), (4, 6), (7, 8),
+        (2, 3), (4, 5), (6, 7), (3, 4), (5, 6)),
+    11: ((0, 9), (1, 6), (2, 4), (3, 7), (5, 8), (0, 1), (3, 5), (4, 10),
+        (6, 9), (7, 8), (1, 3), (2, 5), (4, 7), (8, 10), (0, 4), (1, 2),
+        (3, 7), (5, 9), (6, 8), (0, 1), (2, 6), (4, 5), (7, 8), (9, 10),
+        (2, 4), (3, 6), (5, 7), (8, 9), (1, 2), (3, 4), (5, 6), (7, 8),
+        (2, 3), (4, 5), (6, 7)),
+    12: ((0, 8), (1, 7), (2, 6), (3, 11), (4, 10), (5, 9), (0, 1), (2, 5),
+        (3, 4), (6, 9), (7, 8), (10, 11), (0, 2), (1, 6), (5, 10), (9, 11),
+        (0, 3), (1, 2), (4, 6), (5, 7), (8, 11), (9, 10), (1, 4), (3, 5),
+        (6, 8), (7, 10), (1, 3), (2, 5), (6, 9), (8, 10), (2, 3), (4, 5),
+        (6, 7), (8, 9), (4, 6), (5, 7), (3, 4), (5, 6), (7, 8)),
+    13: ((0, 12), (1, 10), (2, 9), (3, 7), (5, 11), (6, 8), (1, 6), (2, 3),
+        (4, 11), (7, 9), (8, 10), (0, 4), (1, 2), (3, 6), (7, 8), (9, 10),
+        (11, 12), (4, 6), (5, 9), (8, 11), (10, 12), (0, 5), (3, 8), (4, 7),
+        (6, 11), (9, 10), (0, 1), (2, 5), (6, 9), (7, 8), (10, 11), (1, 3),
+        (2, 4), (5, 6), (9, 10), (1, 2), (3, 4), (5, 7), (6, 8), (2, 3),
+        (4, 5), (6, 7), (8, 9), (3, 4), (5, 6)),
+    14: ((0, 13), (1, 12), (4, 8), (5, 6), (7, 11), (9, 10), (0, 5), (1, 7),
+        (2, 9), (3, 4), (6, 13), (11, 12), (0, 1), (2, 3), (4, 5), (6, 8),
+        (7, 9), (10, 11), (12, 13), (0, 2), (1, 3), (4, 10), (5, 11), (6, 7),
+        (8, 9), (1, 2), (3, 12), (4, 6), (5, 7), (8, 10), (9, 11), (1, 4),
+        (2, 6), (5, 8), (7, 10), (9, 13), (2, 4), (3, 6), (9, 12), (11, 13),
+        (3, 5), (6, 8), (7, 9), (10, 12), (3, 4), (5, 6), (7, 8), (9, 10),
+        (11, 12), (6, 7), (8, 9)),
+    15: ((0, 13), (1, 12), (3, 14), (4, 8), (5, 6), (7, 11), (9, 10), (0, 5),
+        (1, 7), (2, 9), (3, 4), (6, 13), (8, 14), (11, 12), (0, 1), (2, 3),
+        (4, 5), (6, 8), (7, 9), (10, 11), (12, 13), (0, 2), (1, 3), (4, 10),
+        (5, 11), (6, 7), (8, 9), (12, 14), (1, 2), (3, 12), (4, 6), (5, 7),
+        (8, 10), (9, 11), (13, 14), (1, 4), (2, 6), (5, 8), (7, 10), (9, 13),
+        (11, 14), (2, 4), (3, 6), (9, 12), (11, 13), (3, 5), (6, 8), (7, 9),
+        (10, 12), (3, 4), (5, 6), (7, 8), (9, 10), (11, 12), (6, 7), (8, 9)),
+    16: ((0, 13), (1, 12), (2, 15), (3, 14), (4, 8), (5, 6), (7, 11),
+        (9, 10), (0, 5), (1, 7), (2, 9), (3, 4), (6, 13), (8, 14), (10, 15),
+        (11, 12), (0, 1), (2, 3), (4, 5), (6, 8), (7, 9), (10, 11), (12, 13),
+        (14, 15), (0, 2), (1, 3), (4, 10), (5, 11), (6, 7), (8, 9), (12, 14),
+        (13, 15), (1, 2), (3, 12), (4, 6), (5, 7), (8, 10), (9, 11),
+        (13, 14), (1, 4), (2, 6), (5, 8), (7, 10), (9, 13), (11, 14), (2, 4),
+        (3, 6), (9, 12), (11, 13), (3, 5), (6, 8), (7, 9), (10, 12), (3, 4),
+        (5, 6), (7, 8), (9, 10), (11, 12), (6, 7), (8, 9)),
+}
+
+MAX_SIZE = max(NETWORKS)
+
+
+def network_sort(a, inplace=False, key=None, reverse=False):
+    """Sorting Network
+
+    Sorts up to MAX_SIZE (16) items with a fixed sequence of compare-exchange
+    steps chosen for their size, compiled into straight-line code, so there
+    are no loops, branches on indices or calls: this is the cheapest way to
+    sort very short sequences, and what mergesort and quicksort finish their
+    small sub lists with. Not stable.
+
+    Time complexity: O(1) for a given size
+    Space complexity: O(1)
+
+    :param a: A sequence of at most MAX_SIZE items to be sorted
+    :type a: list
+    :param inplace: Sort a itself (any mutable sequence, including
+        array.array and writable memoryview) rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :return: A new sorted list, or a itself when sorted in place
+    :rtype: list
+    :raises: ValueError
+    """
+
+    if len(a) > MAX_SIZE:
+        raise ValueError("Sorting networks sort at most {} items, not {}."
+                         .format(MAX_SIZE, len(a)))
+    if key is not None or reverse:
+        return sort_by_key(network_sort, a, key, reverse, inplace)
+    b = a if inplace else [*a]
+    _sort(b, 0, len(b)-1)
+    return b
+
+
+def _sort(srt, start, end):
+    """Sorts a sub list in place with the network for its size, or with
+    binary insertion sort if it is larger than MAX_SIZE
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param start: The beginning index of the sub list to be sorted
+    :type start: int
+    :param end: The ending index of the sub list to be sorted
+    :type end: int
+    """
+
+    n = end - start + 1
+    if n > MAX_SIZE:
+        _binary_insertion_sort(srt, start, end+1, start+1)
+    elif n > 1:
+        _UNROLLED[n](srt, start)
+
+
+def _unroll(n, comparators):
+    """Compiles a sorting network into a function that loads the items into
+    local variables, runs every comparator as one inline statement and
+    stores the items back
+
+    :param n: The number of items the network sorts
+    :type n: int
+    :param comparators: The comparators (i, j) of the network, in order
+    :type comparators: tuple
+    :return: Function sorting srt[start:start+n] in place, called with srt
+        and start
+    :rtype: function
+    """
+
+    items = ', '.join('v{}'.format(k) for k in range(n))
+    slots = ', '.join('srt[start+{}]'.format(k) for k in range(n))
+    lines = ['def network(srt, start):',
+             '    {} = {}'.format(items, slots)]
+    for i, j in comparators:
+        lines.append('    if v{1} < v{0}: v{0}, v{1} = v{1}, v{0}'
+                     .format(i, j))
+    lines.append('    {} = {}'.format(slots, items))
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['network']
+
+
+_UNROLLED = {n: _unroll(n, comparators)
+             for n, comparators in NETWORKS.items()}
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from array import array
+    from random import shuffle
+
+
+    class TestNetworkSort(unittest.TestCase):
+
+        def setUp(self):
+            self.ordered = [x for x in range(16)]
+            self.shuffled = [*self.ordered]
+            while self.ordered == self.shuffled:
+                shuffle(self.shuffled)
+
+        def test_network_sort(self):
+            self.assertEqual(self.ordered, network_sort(self.shuffled))
+            self.assertNotEqual(self.ordered, self.shuffled)
+            self.assertEqual([], network_sort([]))
+            self.assertEqual([1], network_sort([1]))
+
+        def test_every_input(self):
+            # by the 0-1 principle, a network that sorts every sequence of
+            # zeros and ones sorts every sequence
+            for n in range(2, MAX_SIZE+1):
+                for bits in range(1 << n):
+                    data = [(bits >> k) & 1 for k in range(n)]
+                    self.assertEqual(sorted(data), network_sort(data))
+
+        def test_too_long(self):
+            self.assertRaises(ValueError, network_sort, [*range(17)])
+
+        def test_sub_list(self):
+            data = [*range(40, 0, -1)]
+            _sort(data, 5, 14)
+            self.assertEqual([*range(26, 36)], data[5:15])
+            _sort(data, 0, 39)
+            self.assertEqual([*range(1, 41)], data)
+
+        def test_inplace(self):
+            data = array('i', self.shuffled)
+            self.assertIs(data, network_sort(data, inplace=True))
+            self.assertEqual(self.ordered, list(data))
+
+            view = memoryview(array('i', self.shuffled))
+            network_sort(view, inplace=True)
+            self.assertEqual(self.ordered, view.tolist())
+
+        def test_key(self):
+            words = ['pear', 'fig', 'apple', 'kiwi', 'plum', 'date']
+            self.assertEqual(sorted(words, key=len),
+                             network_sort(words, key=len))
+            self.assertEqual(sorted(words, key=len, reverse=True),
+                             network_sort(words, key=len, reverse=True))
+            self.assertEqual(self.ordered[::-1],
+                             network_sort(self.shuffled, reverse=True))
+
+
+    unittest.main()
@@ -0,0 +1,248 @@
+"""Sorting Algorithm: Parallel Sample Sort"""
+
+import os
+import random
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from sorting.decorate import sort_by_key
+from sorting.mergesort import mergesort
+
+# inputs shorter than this are not worth starting worker processes for
+SERIAL_CUTOFF = 10000
+
+# number of samples drawn per bucket when choosing splitters
+OVERSAMPLE = 32
+
+
+def parallel_sort(a, inplace=False, key=None, reverse=False,
+                  algorithm=mergesort, workers=None):
+    """Parallel Sample Sort
+
+    Draws a random sample of the input to choose splitters, distributes the
+    items into one bucket per worker process, sorts the buckets concurrently
+    with the given sort function and concatenates them. The numbers in an
+    array.array are handed to the workers through shared memory instead of
+    being pickled. Stable if algorithm is stable.
+
+    Only the sorting of the buckets runs in parallel: drawing the sample and
+    distributing the items into buckets is O(n) work done by the calling
+    process before any worker starts, which bounds the speedup for large
+    worker counts.
+
+    Time complexity: O(nlogn / workers + n)
+    Space complexity: O(n)
+
+    :param a: A sequence to be sorted
+    :type a: list
+    :param inplace: Sort a itself rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :param algorithm: Sort function used on each bucket, e.g. quicksort
+    :type algorithm: function
+    :param workers: Number of worker processes, defaults to the CPU count
+    :type workers: int
+    :return: A new sorted list (an array.array if a is one), or a itself when
+        sorted in place
+    :rtype: list
+    """
+
+    if key is None and reverse and isinstance(a, array):
+        # equal numbers cannot be told apart, so sorting ascending through
+        # shared memory and turning the result around is as good as stable
+        b = parallel_sort(a, inplace, algorithm=algorithm, workers=workers)
+        b.reverse()
+        return b
+    if key is not None or reverse:
+        b = sort_by_key(parallel_sort, a, key, reverse, inplace,
+                        algorithm=algorithm, workers=workers)
+        if isinstance(a, array) and not inplace:
+            return array(a.typecode, b)
+        return b
+    workers = workers or os.cpu_count() or 1
+    if isinstance(a, array):
+        b = a if inplace else array(a.typecode, a)
+    else:
+        b = a if inplace else [*a]
+    n = len(b)
+    if workers < 2 or n < SERIAL_CUTOFF:
+        return algorithm(b, inplace=True)
+
+    picks = random.sample(range(n), min(n, workers * OVERSAMPLE))
+    sample = [b[i] for i in picks]
+    algorithm(sample, inplace=True)
+    step = len(sample) / workers
+    splitters = [sample[int(i * step)] for i in range(1, workers)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if isinstance(b, array):
+            _sort_shared(executor, b, splitters, algorithm)
+        else:
+            _sort_buckets(executor, b, splitters, algorithm)
+    return b
+
+
+def _sort_buckets(executor, srt, splitters, sort):
+    """Distributes the items of a sequence into buckets, has the workers sort
+    them and writes them back in order
+
+    :param executor: The pool of worker processes
+    :type executor: ProcessPoolExecutor
+    :param srt: The sequence being sorted
+    :type srt: list
+    :param splitters: Ordered items separating the buckets
+    :type splitters: list
+    :param sort: Sort function used on each bucket
+    :type sort: function
+    """
+
+    buckets = [[] for _ in range(len(splitters) + 1)]
+    for item in srt:
+        buckets[bisect_right(splitters, item)].append(item)
+    k = 0
+    for bucket in executor.map(_sort_bucket, [sort] * len(buckets), buckets):
+        for item in bucket:
+            srt[k] = item
+            k += 1
+
+
+def _sort_bucket(sort, bucket):
+    """Sorts one bucket in a worker process
+
+    :param sort: Sort function to use
+    :type sort: function
+    :param bucket: The items of the bucket
+    :type bucket: list
+    :return: The sorted bucket
+    :rtype: list
+    """
+
+    return sort(bucket, inplace=True)
+
+
+def _sort_shared(executor, srt, splitters, sort):
+    """Distributes the numbers of an array into contiguous buckets in a shared
+    memory block, has the workers sort each bucket where it lies and copies
+    the block back into the array
+
+    :param executor: The pool of worker processes
+    :type executor: ProcessPoolExecutor
+    :param srt: The array being sorted
+    :type srt: array.array
+    :param splitters: Ordered numbers separating the buckets
+    :type splitters: list
+    :param sort: Sort function used on each bucket
+    :type sort: function
+    """
+
+    n = len(srt)
+    buckets = [bisect_right(splitters, item) for item in srt]
+    start = [0] * (len(splitters) + 2)
+    for bucket in buckets:
+        start[bucket+1] += 1
+    for i in range(1, len(start)):
+        start[i] += start[i-1]
+
+    shm = SharedMemory(create=True, size=max(1, n * srt.itemsize))
+    try:
+        with shm.buf.cast(srt.typecode) as shared:
+            cursor = start[:-1]
+            for item, bucket in zip(srt, buckets):
+                shared[cursor[bucket]] = item
+                cursor[bucket] += 1
+            del cursor, buckets
+
+            futures = [executor.submit(_sort_segment, shm.name, srt.typecode,
+                                       start[i], start[i+1], sort)
+                       for i in range(len(start) - 1)
+                       if start[i+1] - start[i] > 1]
+            for future in futures:
+                future.result()
+            with memoryview(srt).cast('B') as raw:
+                raw[:] = shm.buf[:len(raw)]
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _sort_segment(name, typecode, start, end, sort):
+    """Sorts one bucket of a shared memory block in a worker process
+
+    :param name: Name of the shared memory block
+    :type name: str
+    :param typecode: The array typecode of the numbers in the block
+    :type typecode: str
+    :param start: Index of the first number in the bucket
+    :type start: int
+    :param end: Index just past the last number in the bucket
+    :type end: int
+    :param sort: Sort function to use
+    :type sort: function
+    """
+
+    shm = SharedMemory(name=name)
+    try:
+        with shm.buf.cast(typecode) as shared, shared[start:end] as segment:
+            sort(segment, inplace=True)
+    finally:
+        shm.close()
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from random import randrange, shuffle
+
+    from sorting.quicksort import quicksort
+
+
+    class TestParallelSort(unittest.TestCase):
+
+        def setUp(self):
+            self.ordered = [x for x in range(20)]
+            self.shuffled = [*self.ordered]
+            while self.ordered == self.shuffled:
+                shuffle(self.shuffled)
+            self.data = [randrange(5000) for _ in range(SERIAL_CUTOFF * 2)]
+
+        def test_parallel_sort(self):
+            self.assertEqual(self.ordered, parallel_sort(self.shuffled))
+            self.assertEqual(sorted(self.data),
+                             parallel_sort(self.data, workers=3))
+            self.assertEqual(sorted(self.data),
+                             parallel_sort(self.data, algorithm=quicksort,
+                                           workers=2))
+
+        def test_array(self):
+            data = array('d', self.data)
+            result = parallel_sort(data, workers=3)
+            self.assertIsInstance(result, array)
+            self.assertEqual(sorted(self.data), list(result))
+            self.assertEqual(self.data, list(data))
+
+            self.assertIs(data, parallel_sort(data, inplace=True, workers=4))
+            self.assertEqual(sorted(self.data), list(data))
+
+            data = array('q', self.data)
+            result = parallel_sort(data, reverse=True, workers=2)
+            self.assertIsInstance(result, array)
+            self.assertEqual('q', result.typecode)
+            self.assertEqual(sorted(self.data, reverse=True), list(result))
+            self.assertIs(data, parallel_sort(data, inplace=True,
+                                              key=lambda x: -x, workers=2))
+            self.assertEqual(sorted(self.data, reverse=True), list(data))
+
+        def test_key(self):
+            pairs = [(x % 10, i) for i, x in enumerate(self.data)]
+            self.assertEqual(
+                sorted(pairs, key=lambda p: p[0], reverse=True),
+                parallel_sort(pairs, key=lambda p: p[0], reverse=True,
+                              workers=2))
+
+
+    unittest.main()
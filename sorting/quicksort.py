@@ -2,22 +2,71 @@
 
 from random import shuffle
 
+from sorting.decorate import sort_by_key
+from sorting.networks import _sort as _network_sort
 
-def quicksort(a):
+# sub lists of up to this many items are sorted with a sorting network
+CUTOFF = 16
+
+
+def quicksort(a, partition='lomuto', iterative=False, inplace=False, key=None,
+              reverse=False, cutoff=CUTOFF):
     """Quicksort
 
     Time complexity: O(nlogn)
     Space complexity: O(logn)
 
-    :param a: A list to be sorted
+    The 'three_way' partition scheme gathers every item equal to the pivot in
+    a single pass, so inputs with few distinct keys sort in close to linear
+    time instead of degrading toward O(n^2).
+
+    The 'dual_pivot' scheme (Yaroslavskiy's) splits each sub list into three
+    around two pivots, the first and last items of the shuffled sub list. It
+    makes fewer swaps than 'lomuto' and each pass over the items does more
+    work, so there are fewer levels to recurse through.
+
+    The iterative driver keeps pending sub lists on an explicit stack instead
+    of recursing, so it can never hit the interpreter's recursion limit.
+
+    Sub lists of up to cutoff items are not partitioned further but sorted
+    with a sorting network (binary insertion sort above 16 items), which
+    removes most of the calls made on the last few levels.
+
+    :param a: A sequence to be sorted
     :type a: list
-    :return: A new sorted list
+    :param partition: Partition scheme, one of 'lomuto', 'three_way' or
+        'dual_pivot'
+    :type partition: str
+    :param iterative: Use an explicit stack rather than recursion
+    :type iterative: bool
+    :param inplace: Sort a itself (any mutable sequence, including
+        array.array and writable memoryview) rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :param cutoff: Size at or below which sub lists are finished without
+        partitioning
+    :type cutoff: int
+    :return: A new sorted list, or a itself when sorted in place
     :rtype: list
+    :raises: ValueError
     """
 
-    b = [*a]
+    if partition not in _SCHEMES:
+        raise ValueError(
+            "The partition scheme `{}` is not supported.".format(partition))
+    if key is not None or reverse:
+        return sort_by_key(quicksort, a, key, reverse, inplace,
+                           partition=partition, iterative=iterative,
+                           cutoff=cutoff)
+    b = a if inplace else [*a]
     shuffle(b)
-    _sort(b, 0, len(b)-1)
+    if iterative:
+        _sort_iterative(b, 0, len(b)-1, partition, cutoff)
+    else:
+        globals()[_SCHEMES[partition]](b, 0, len(b)-1, cutoff)
     return b
 
 
@@ -45,7 +94,28 @@ def _partition(srt, start, end):
     return follower
 
 
-def _sort(srt, start, end):
+def _median_of_three(srt, start, end):
+    """Moves the median of the first, middle and last items of a sub list to
+    the end position, where partition() expects to find its pivot
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param start: The beginning index of the sub list
+    :type start: int
+    :param end: The ending index of the sub list
+    :type end: int
+    """
+
+    mid = (start + end) // 2
+    if srt[mid] < srt[start]:
+        srt[start], srt[mid] = srt[mid], srt[start]
+    if srt[end] < srt[start]:
+        srt[start], srt[end] = srt[end], srt[start]
+    if srt[mid] < srt[end]:
+        srt[mid], srt[end] = srt[end], srt[mid]
+
+
+def _sort(srt, start, end, cutoff=0):
     """Sorts a list recursively by placing one element at a time in order
     using the partition() function
 
@@ -55,18 +125,198 @@ def _sort(srt, start, end):
     :type start: int
     :param end: The ending index of the sub list to be sorted
     :type end: int
+    :param cutoff: Size at or below which the sub list is sorted with a
+        sorting network
+    :type cutoff: int
     """
 
+    if end - start < cutoff:
+        _network_sort(srt, start, end)
+        return
     if start >= end:
         return
     p = _partition(srt, start, end)
-    _sort(srt, start, p-1)
-    _sort(srt, p+1, end)
+    _sort(srt, start, p-1, cutoff)
+    _sort(srt, p+1, end, cutoff)
+
+
+def _partition_3way(srt, start, end):
+    """Partitions a list around its first item into three sub lists: lower
+    ranked items on the left, items equal to the first item in the middle and
+    higher ranked items on the right (Dijkstra's Dutch national flag)
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param start: The beginning index of the sub list to be partitioned
+    :type start: int
+    :param end: The ending index of the sub list to be partitioned
+    :type end: int
+    :return: The first and last indices of the middle sub list
+    :rtype: tuple
+    """
+
+    pivot = srt[start]
+    lt, i, gt = start, start + 1, end
+    while i <= gt:
+        if srt[i] < pivot:
+            srt[lt], srt[i] = srt[i], srt[lt]
+            lt += 1
+            i += 1
+        elif pivot < srt[i]:
+            srt[i], srt[gt] = srt[gt], srt[i]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _sort_3way(srt, start, end, cutoff=0):
+    """Sorts a list recursively by placing every item equal to the pivot in
+    order at once using the partition_3way() function
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param start: The beginning index of the sub list to be sorted
+    :type start: int
+    :param end: The ending index of the sub list to be sorted
+    :type end: int
+    :param cutoff: Size at or below which the sub list is sorted with a
+        sorting network
+    :type cutoff: int
+    """
+
+    if end - start < cutoff:
+        _network_sort(srt, start, end)
+        return
+    if start >= end:
+        return
+    lt, gt = _partition_3way(srt, start, end)
+    _sort_3way(srt, start, lt-1, cutoff)
+    _sort_3way(srt, gt+1, end, cutoff)
+
+
+def _partition_dual(srt, start, end):
+    """Partitions a list around its first and last items, the pivots, into
+    three sub lists: items ranked lower than the smaller pivot on the left,
+    items ranked higher than the larger pivot on the right and the rest in
+    the middle (Yaroslavskiy's dual-pivot partition)
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param start: The beginning index of the sub list to be partitioned
+    :type start: int
+    :param end: The ending index of the sub list to be partitioned
+    :type end: int
+    :return: The indices of the smaller and of the larger pivot
+    :rtype: tuple
+    """
+
+    if srt[end] < srt[start]:
+        srt[start], srt[end] = srt[end], srt[start]
+    low, high = srt[start], srt[end]
+    lt, i, gt = start + 1, start + 1, end - 1
+    while i <= gt:
+        if srt[i] < low:
+            srt[i], srt[lt] = srt[lt], srt[i]
+            lt += 1
+        elif high < srt[i]:
+            while high < srt[gt] and i < gt:
+                gt -= 1
+            srt[i], srt[gt] = srt[gt], srt[i]
+            gt -= 1
+            if srt[i] < low:
+                srt[i], srt[lt] = srt[lt], srt[i]
+                lt += 1
+        i += 1
+    lt -= 1
+    gt += 1
+    srt[start], srt[lt] = srt[lt], srt[start]
+    srt[end], srt[gt] = srt[gt], srt[end]
+    return lt, gt
+
+
+def _sort_dual(srt, start, end, cutoff=0):
+    """Sorts a list recursively by placing two pivots at a time in order
+    using the partition_dual() function
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param start: The beginning index of the sub list to be sorted
+    :type start: int
+    :param end: The ending index of the sub list to be sorted
+    :type end: int
+    :param cutoff: Size at or below which the sub list is sorted with a
+        sorting network
+    :type cutoff: int
+    """
+
+    if end - start < cutoff:
+        _network_sort(srt, start, end)
+        return
+    if start >= end:
+        return
+    lt, gt = _partition_dual(srt, start, end)
+    _sort_dual(srt, start, lt-1, cutoff)
+    if srt[lt] < srt[gt]:
+        _sort_dual(srt, lt+1, gt-1, cutoff)
+    _sort_dual(srt, gt+1, end, cutoff)
+
+
+def _sort_iterative(srt, start, end, partition='lomuto', cutoff=0):
+    """Sorts a list without recursion. After each partition the larger sub
+    lists are pushed onto a stack and one at most half as large is sorted
+    next, which bounds the stack at O(logn) entries.
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param start: The beginning index of the sub list to be sorted
+    :type start: int
+    :param end: The ending index of the sub list to be sorted
+    :type end: int
+    :param partition: Partition scheme, one of 'lomuto', 'three_way' or
+        'dual_pivot'
+    :type partition: str
+    :param cutoff: Size at or below which sub lists are sorted with a
+        sorting network
+    :type cutoff: int
+    """
+
+    stack = [(start, end)]
+    while stack:
+        start, end = stack.pop()
+        while end - start >= max(cutoff, 1):
+            if partition == 'dual_pivot':
+                lt, gt = _partition_dual(srt, start, end)
+                if srt[lt] < srt[gt]:
+                    stack.append((lt+1, gt-1))
+            elif partition == 'three_way':
+                lt, gt = _partition_3way(srt, start, end)
+            else:
+                lt = gt = _partition(srt, start, end)
+            if lt - start < end - gt:
+                stack.append((gt+1, end))
+                end = lt - 1
+            else:
+                stack.append((start, lt-1))
+                start = gt + 1
+        if start < end:
+            _network_sort(srt, start, end)
+
+
+# names of the recursive sort for each partition scheme, looked up when
+# called so that a function replaced in the module (e.g. by instrument())
+# is the one used
+_SCHEMES = {
+    'lomuto': '_sort',
+    'three_way': '_sort_3way',
+    'dual_pivot': '_sort_dual',
+}
 
 
 if __name__ == "__main__":
 
     import unittest
+    from array import array
 
 
     class TestQuicksort(unittest.TestCase):
@@ -81,5 +331,65 @@ if __name__ == "__main__":
             self.assertEqual(self.ordered, quicksort(self.shuffled))
             self.assertNotEqual(self.ordered, self.shuffled)
 
+        def test_inplace(self):
+            data = array('i', self.shuffled)
+            self.assertIs(data, quicksort(data, inplace=True))
+            self.assertEqual(self.ordered, list(data))
+
+            view = memoryview(array('i', self.shuffled))
+            quicksort(view, inplace=True)
+            self.assertEqual(self.ordered, view.tolist())
+
+        def test_key(self):
+            words = ['pear', 'fig', 'apple', 'kiwi', 'plum', 'date']
+            self.assertEqual(sorted(words, key=len), quicksort(words, key=len))
+            self.assertEqual(sorted(words, key=len, reverse=True),
+                             quicksort(words, key=len, reverse=True))
+            self.assertEqual(self.ordered[::-1],
+                             quicksort(self.shuffled, reverse=True))
+
+        def test_three_way(self):
+            self.assertEqual(self.ordered,
+                             quicksort(self.shuffled, partition='three_way'))
+            keys = [x % 3 for x in range(3000)]
+            self.assertEqual(sorted(keys),
+                             quicksort(keys, partition='three_way'))
+
+        def test_dual_pivot(self):
+            self.assertEqual(self.ordered,
+                             quicksort(self.shuffled, partition='dual_pivot'))
+            keys = [x % 3 for x in range(3000)]
+            self.assertEqual(sorted(keys),
+                             quicksort(keys, partition='dual_pivot'))
+            data = [*self.shuffled] * 5
+            for start, end in ((0, 99), (3, 50), (10, 11)):
+                lt, gt = _partition_dual(data, start, end)
+                self.assertTrue(start <= lt < gt <= end)
+                self.assertTrue(all(x < data[lt] for x in data[start:lt]))
+                self.assertTrue(all(data[lt] <= x <= data[gt]
+                                    for x in data[lt+1:gt]))
+                self.assertTrue(all(data[gt] <= x
+                                    for x in data[gt+1:end+1]))
+
+        def test_iterative(self):
+            for partition in _SCHEMES:
+                self.assertEqual(
+                    self.ordered,
+                    quicksort(self.shuffled, partition, iterative=True))
+            keys = [x % 5 for x in range(3000)]
+            self.assertEqual(sorted(keys),
+                             quicksort(keys, 'three_way', iterative=True))
+
+        def test_cutoff(self):
+            data = [*self.shuffled] * 10
+            for partition in _SCHEMES:
+                for iterative in (False, True):
+                    for cutoff in (0, 1, 5, 16, 40):
+                        self.assertEqual(sorted(data), quicksort(
+                            data, partition, iterative, cutoff=cutoff))
+
+        def test_unknown_partition(self):
+            self.assertRaises(ValueError, quicksort, self.shuffled, 'hoare')
+
 
     unittest.main()
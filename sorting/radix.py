@@ -0,0 +1,347 @@
+"""Sorting Algorithms: Counting Sort and Radix Sorts"""
+
+from random import shuffle
+
+# groups at or below this size are finished with insertion sort
+CUTOFF = 16
+
+
+def counting_sort(a, inplace=False, key=None, reverse=False):
+    """Counting Sort
+
+    Distributes items into one bucket per integer key between the smallest
+    and largest key, so it suits keys drawn from a small range. Stable.
+
+    Time complexity: O(n + k), k being the range of the keys
+    Space complexity: O(n + k)
+
+    :param a: A sequence of integers (or of items with integer keys)
+    :type a: list
+    :param inplace: Sort a itself (any mutable sequence, including
+        array.array) rather than a copy
+    :type inplace: bool
+    :param key: Function computing the integer key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :return: A new sorted list, or a itself when sorted in place
+    :rtype: list
+    """
+
+    b = [*a]
+    keys = b if key is None else [*map(key, b)]
+    order = []
+    if keys:
+        lo = min(keys)
+        buckets = [[] for _ in range(max(keys) - lo + 1)]
+        for i, k in enumerate(keys):
+            buckets[k-lo].append(i)
+        order = [i for bucket in buckets for i in bucket]
+    return _arrange(a, b, keys, order, inplace, reverse)
+
+
+def lsd_radix_sort(a, inplace=False, key=None, reverse=False, bits=8):
+    """LSD (Least Significant Digit) Radix Sort
+
+    Sorts integers by their digits in base 2^bits, from the lowest digit to
+    the highest, with one stable distribution pass per digit. Keys may be
+    negative; the number of passes follows from the spread of the keys.
+    Stable.
+
+    Time complexity: O(w/bits * (n + 2^bits)), w being the key width in bits
+    Space complexity: O(n + 2^bits)
+
+    :param a: A sequence of integers (or of items with integer keys)
+    :type a: list
+    :param inplace: Sort a itself (any mutable sequence, including
+        array.array) rather than a copy
+    :type inplace: bool
+    :param key: Function computing the integer key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :param bits: Number of bits per digit
+    :type bits: int
+    :return: A new sorted list, or a itself when sorted in place
+    :rtype: list
+    :raises: ValueError
+    """
+
+    if bits < 1:
+        raise ValueError("The number of bits per digit must be at least 1.")
+    b = [*a]
+    keys = b if key is None else [*map(key, b)]
+    order = [*range(len(b))]
+    if keys:
+        lo = min(keys)
+        spread = max(keys) - lo
+        radix = 1 << bits
+        mask = radix - 1
+        shift = 0
+        while spread >> shift:
+            buckets = [[] for _ in range(radix)]
+            for i in order:
+                buckets[((keys[i] - lo) >> shift) & mask].append(i)
+            order = [i for bucket in buckets for i in bucket]
+            shift += bits
+    return _arrange(a, b, keys, order, inplace, reverse)
+
+
+def msd_radix_sort(a, inplace=False, key=None, reverse=False):
+    """MSD (Most Significant Digit) Radix Sort
+
+    Sorts strings or bytes by distributing them on their first byte, then
+    sorting each group on the next byte, and so on; strings are compared by
+    their UTF-8 encoding, which preserves code point order. Small groups are
+    finished with insertion sort. Stable.
+
+    Time complexity: O(n * w), w being the average key length
+    Space complexity: O(n + 256w)
+
+    :param a: A sequence of str or bytes (or of items with such keys)
+    :type a: list
+    :param inplace: Sort a itself rather than a copy
+    :type inplace: bool
+    :param key: Function computing the str or bytes key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :return: A new sorted list, or a itself when sorted in place
+    :rtype: list
+    """
+
+    b = [*a]
+    keys = _encode(b if key is None else [*map(key, b)])
+    order = []
+    stack = [([*range(len(b))], 0)]
+    while stack:
+        group, d = stack.pop()
+        if len(group) <= CUTOFF:
+            _insertion_sort(keys, group, 0, len(group)-1)
+            order += group
+            continue
+        ended = []
+        buckets = [[] for _ in range(256)]
+        for i in group:
+            k = keys[i]
+            if len(k) == d:
+                ended.append(i)
+            else:
+                buckets[k[d]].append(i)
+        order += ended
+        stack.extend((bucket, d+1) for bucket in reversed(buckets) if bucket)
+    return _arrange(a, b, keys, order, inplace, reverse)
+
+
+def string_quicksort(a, inplace=False, key=None, reverse=False):
+    """Three-Way String Quicksort
+
+    Partitions strings or bytes three ways on the byte at the current
+    position, so only the group equal to the pivot byte moves on to the next
+    position. Uses no per-byte bucket tables, which makes it faster than MSD
+    radix sort on keys with long common prefixes or few distinct bytes.
+    Strings are compared by their UTF-8 encoding.
+
+    Time complexity: O(nlogn + n * w) on average
+    Space complexity: O(logn + w)
+
+    :param a: A sequence of str or bytes (or of items with such keys)
+    :type a: list
+    :param inplace: Sort a itself rather than a copy
+    :type inplace: bool
+    :param key: Function computing the str or bytes key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :return: A new sorted list, or a itself when sorted in place
+    :rtype: list
+    """
+
+    b = [*a]
+    keys = _encode(b if key is None else [*map(key, b)])
+    order = [*range(len(b))]
+    shuffle(order)
+    stack = [(0, len(order)-1, 0)]
+    while stack:
+        start, end, d = stack.pop()
+        if end - start < CUTOFF:
+            _insertion_sort(keys, order, start, end)
+            continue
+        v = _byte_at(keys[order[start]], d)
+        lt, i, gt = start, start + 1, end
+        while i <= gt:
+            t = _byte_at(keys[order[i]], d)
+            if t < v:
+                order[lt], order[i] = order[i], order[lt]
+                lt += 1
+                i += 1
+            elif t > v:
+                order[i], order[gt] = order[gt], order[i]
+                gt -= 1
+            else:
+                i += 1
+        stack.append((gt+1, end, d))
+        if v >= 0:
+            stack.append((lt, gt, d+1))
+        stack.append((start, lt-1, d))
+    return _arrange(a, b, keys, order, inplace, reverse)
+
+
+def _byte_at(k, d):
+    """Reports the byte of a key at position d, or -1 past its end
+
+    :param k: The key
+    :type k: bytes
+    :param d: Position in the key
+    :type d: int
+    :return: The byte value
+    :rtype: int
+    """
+
+    return k[d] if d < len(k) else -1
+
+
+def _encode(keys):
+    """Encodes str keys to UTF-8 so that every key is indexed by byte
+
+    :param keys: The str or bytes keys
+    :type keys: list
+    :return: The bytes keys
+    :rtype: list
+    """
+
+    if keys and isinstance(keys[0], str):
+        return [k.encode('utf-8') for k in keys]
+    return keys
+
+
+def _insertion_sort(keys, order, start, end):
+    """Sorts a sub list of indices in place by the keys they refer to
+
+    :param keys: The sort keys
+    :type keys: list
+    :param order: The indices being sorted
+    :type order: list
+    :param start: The beginning index of the sub list to be sorted
+    :type start: int
+    :param end: The ending index of the sub list to be sorted
+    :type end: int
+    """
+
+    for i in range(start+1, end+1):
+        temp = order[i]
+        j = i - 1
+        while j >= start and keys[order[j]] > keys[temp]:
+            order[j+1] = order[j]
+            j -= 1
+        order[j+1] = temp
+
+
+def _arrange(a, b, keys, order, inplace, reverse):
+    """Lays out the items in the order found by a sort
+
+    :param a: The sequence being sorted
+    :type a: list
+    :param b: A copy of the items of a
+    :type b: list
+    :param keys: The sort keys of the items
+    :type keys: list
+    :param order: Indices of the items in ascending key order, equal keys in
+        their original order
+    :type order: list
+    :param inplace: Write the result back into a rather than a new list
+    :type inplace: bool
+    :param reverse: Lay the items out in descending order
+    :type reverse: bool
+    :return: A new sorted list, or a itself when sorted in place
+    :rtype: list
+    """
+
+    if reverse:
+        _reverse_order(keys, order)
+    if not inplace:
+        return [b[i] for i in order]
+    for j, i in enumerate(order):
+        a[j] = b[i]
+    return a
+
+
+def _reverse_order(keys, order):
+    """Turns indices in ascending key order into descending key order in
+    place, keeping indices with equal keys in their original order
+
+    :param keys: The sort keys
+    :type keys: list
+    :param order: Indices in ascending key order, equal keys in their
+        original order
+    :type order: list
+    """
+
+    # turn the order around, then restore each run of equal keys
+    order.reverse()
+    start = 0
+    for i in range(1, len(order) + 1):
+        if i == len(order) or keys[order[i]] != keys[order[start]]:
+            order[start:i] = order[start:i][::-1]
+            start = i
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from array import array
+    from random import choice, randrange
+
+
+    class TestRadix(unittest.TestCase):
+
+        def setUp(self):
+            self.ints = [randrange(-500, 500) for _ in range(2000)]
+            self.words = [''.join(choice('abcé') for _ in range(randrange(8)))
+                          for _ in range(2000)]
+
+        def test_counting_sort(self):
+            self.assertEqual(sorted(self.ints), counting_sort(self.ints))
+            self.assertEqual([], counting_sort([]))
+
+        def test_lsd_radix_sort(self):
+            self.assertEqual(sorted(self.ints), lsd_radix_sort(self.ints))
+            big = [randrange(2**40) for _ in range(1000)]
+            self.assertEqual(sorted(big), lsd_radix_sort(big, bits=11))
+            self.assertRaises(ValueError, lsd_radix_sort, big, bits=0)
+            self.assertRaises(ValueError, lsd_radix_sort, [], bits=-1)
+            self.assertEqual([7, 7], lsd_radix_sort([7, 7]))
+
+        def test_msd_radix_sort(self):
+            self.assertEqual(sorted(self.words), msd_radix_sort(self.words))
+            data = [w.encode('utf-8') for w in self.words]
+            self.assertEqual(sorted(data), msd_radix_sort(data))
+
+        def test_string_quicksort(self):
+            self.assertEqual(sorted(self.words), string_quicksort(self.words))
+            data = [w.encode('utf-8') for w in self.words]
+            self.assertEqual(sorted(data), string_quicksort(data))
+            self.assertEqual([], string_quicksort([]))
+
+        def test_key_reverse(self):
+            pairs = [(x, i) for i, x in enumerate(self.ints)]
+            first = lambda p: p[0]
+            for sort in (counting_sort, lsd_radix_sort):
+                self.assertEqual(sorted(pairs, key=first),
+                                 sort(pairs, key=first))
+                self.assertEqual(sorted(pairs, key=first, reverse=True),
+                                 sort(pairs, key=first, reverse=True))
+            pairs = [(w, i) for i, w in enumerate(self.words)]
+            self.assertEqual(sorted(pairs, key=first, reverse=True),
+                             msd_radix_sort(pairs, key=first, reverse=True))
+            self.assertEqual(sorted(self.words, reverse=True),
+                             string_quicksort(self.words, reverse=True))
+
+        def test_inplace(self):
+            for sort in (counting_sort, lsd_radix_sort):
+                data = array('i', self.ints)
+                self.assertIs(data, sort(data, inplace=True))
+                self.assertEqual(sorted(self.ints), list(data))
+
+
+    unittest.main()
@@ -0,0 +1,336 @@
+"""Selection Algorithms: Quickselect, Top-k and Partial Sort"""
+
+import math
+from itertools import islice
+
+from sorting.decorate import Reversed
+from sorting.heapsort import _heapify, _sort as _heapsort
+from sorting.insertion_sort import _sort as _insertion_sort
+from sorting.introsort import _sort as _introsort
+from sorting.quicksort import _median_of_three, _partition_3way
+
+# number of median-of-three partitions allowed to keep more than three
+# quarters of a sub list before select falls back to median-of-medians
+BAD_PARTITIONS = 4
+
+
+def select_kth(a, k, inplace=False, key=None):
+    """Finds the item that would be at index k if the sequence were sorted.
+    Uses quickselect with median-of-three pivots, switching to the
+    median-of-medians pivot for good once a few partitions have failed to
+    discard a quarter of the items, so the running time is linear even on
+    adversarial input.
+
+    Time complexity: O(n)
+    Space complexity: O(1) in place, O(n) otherwise
+
+    :param a: A sequence to select from
+    :type a: list
+    :param k: The 0-based rank of the item to find
+    :type k: int
+    :param inplace: Partition a itself around the item rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :return: The k-th smallest item
+    :raises: IndexError
+    """
+
+    if not 0 <= k < len(a):
+        raise IndexError("The rank `{}` is out of range.".format(k))
+    if key is not None:
+        b = [*a]
+        decorated = [*zip(map(key, b), range(len(b)))]
+        _select(decorated, 0, len(b)-1, k)
+        if inplace:
+            for j, (_, i) in enumerate(decorated):
+                a[j] = b[i]
+        return b[decorated[k][1]]
+    b = a if inplace else [*a]
+    _select(b, 0, len(b)-1, k)
+    return b[k]
+
+
+def partial_sort(a, k, inplace=False, key=None, reverse=False):
+    """Orders a sequence so that its first k items are the k smallest in
+    sorted order; the remaining items follow in no particular order.
+
+    Time complexity: O(n + klogk)
+    Space complexity: O(logk) in place, O(n) otherwise
+
+    :param a: A sequence to be partially sorted
+    :type a: list
+    :param k: The number of leading items to sort
+    :type k: int
+    :param inplace: Sort a itself rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Put the k largest items first, in descending order
+    :type reverse: bool
+    :return: A new partially sorted list, or a itself when sorted in place
+    :rtype: list
+    """
+
+    if key is not None or reverse:
+        b = [*a]
+        keys = b if key is None else [*map(key, b)]
+        if reverse:
+            keys = [*map(Reversed, keys)]
+        decorated = [*zip(keys, range(len(b)))]
+        partial_sort(decorated, k, inplace=True)
+        if not inplace:
+            return [b[i] for _, i in decorated]
+        for j, (_, i) in enumerate(decorated):
+            a[j] = b[i]
+        return a
+    b = a if inplace else [*a]
+    k = min(k, len(b))
+    if k > 0:
+        _select(b, 0, len(b)-1, k-1)
+        _introsort(b, 0, k-1, 2 * int(math.log2(k)))
+    return b
+
+
+def nsmallest(k, iterable, key=None):
+    """Finds the k smallest items of an iterable in one pass, keeping only k
+    items in memory at a time in a bounded max-heap. Equivalent to
+    sorted(iterable, key=key)[:k].
+
+    Time complexity: O(nlogk)
+    Space complexity: O(k)
+
+    :param k: The number of items to find
+    :type k: int
+    :param iterable: Any iterable, e.g. a generator
+    :type iterable: iterable
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :return: The k smallest items, in ascending order
+    :rtype: list
+    """
+
+    if key is None:
+        decorated = ((item, i, item) for i, item in enumerate(iterable))
+    else:
+        decorated = ((key(item), i, item) for i, item in enumerate(iterable))
+    return _bounded_heap(k, decorated)
+
+
+def nlargest(k, iterable, key=None):
+    """Finds the k largest items of an iterable in one pass, keeping only k
+    items in memory at a time in a bounded heap. Equivalent to
+    sorted(iterable, key=key, reverse=True)[:k].
+
+    Time complexity: O(nlogk)
+    Space complexity: O(k)
+
+    :param k: The number of items to find
+    :type k: int
+    :param iterable: Any iterable, e.g. a generator
+    :type iterable: iterable
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :return: The k largest items, in descending order
+    :rtype: list
+    """
+
+    if key is None:
+        decorated = ((Reversed(item), i, item)
+                     for i, item in enumerate(iterable))
+    else:
+        decorated = ((Reversed(key(item)), i, item)
+                     for i, item in enumerate(iterable))
+    return _bounded_heap(k, decorated)
+
+
+def _bounded_heap(k, decorated):
+    """Keeps the k smallest of a stream of (key, index, item) entries in a
+    max-heap whose root is the entry to evict next
+
+    :param k: The number of entries to keep
+    :type k: int
+    :param decorated: Iterable of (key, index, item) entries
+    :type decorated: iterable
+    :return: The items of the k smallest entries, in ascending order
+    :rtype: list
+    """
+
+    if k <= 0:
+        return []
+    heap = [*islice(decorated, k)]
+    n = len(heap)
+    for i in range(n//2 - 1, -1, -1):
+        _heapify(heap, n, i)
+    if n == k:
+        for entry in decorated:
+            if entry < heap[0]:
+                heap[0] = entry
+                _heapify(heap, k, 0)
+    _heapsort(heap, 0, n-1)
+    return [item for _, _, item in heap]
+
+
+def _select(srt, start, end, k, bad=BAD_PARTITIONS):
+    """Rearranges a sub list so that srt[k] holds the item of rank k, smaller
+    items precede it and larger ones follow it
+
+    The median-of-three partitions that shrink the sub list to at most three
+    quarters add up to O(n) work, and at most bad others are allowed before
+    every pivot comes from median-of-medians, which is O(n) on its own.
+
+    :param srt: The list being partitioned
+    :type srt: list
+    :param start: The beginning index of the sub list
+    :type start: int
+    :param end: The ending index of the sub list
+    :type end: int
+    :param k: The index whose item to find
+    :type k: int
+    :param bad: Number of poor median-of-three partitions allowed, 0 to
+        use median-of-medians pivots only
+    :type bad: int
+    """
+
+    while start < end:
+        n = end - start + 1
+        if bad > 0:
+            _median_of_three(srt, start, end)
+            p = end
+        else:
+            p = _median_of_medians(srt, start, end)
+        srt[start], srt[p] = srt[p], srt[start]
+        lt, gt = _partition_3way(srt, start, end)
+        if k < lt:
+            end = lt - 1
+        elif k > gt:
+            start = gt + 1
+        else:
+            return
+        if bad > 0 and 4 * (end - start + 1) > 3 * n:
+            bad -= 1
+
+
+def _median_of_medians(srt, start, end):
+    """Finds a pivot guaranteed to have at least 30% of a sub list on either
+    side: the median of the medians of groups of five
+
+    :param srt: The list being partitioned
+    :type srt: list
+    :param start: The beginning index of the sub list
+    :type start: int
+    :param end: The ending index of the sub list
+    :type end: int
+    :return: The index of the pivot
+    :rtype: int
+    """
+
+    if end - start < 5:
+        _insertion_sort(srt, start, end)
+        return (start + end) // 2
+    m = start
+    for i in range(start, end+1, 5):
+        j = min(i + 4, end)
+        _insertion_sort(srt, i, j)
+        mid = (i + j) // 2
+        srt[m], srt[mid] = srt[mid], srt[m]
+        m += 1
+    mid = (start + m - 1) // 2
+    _select(srt, start, m-1, mid, 0)
+    return mid
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from random import randrange, shuffle
+
+
+    class TestSelection(unittest.TestCase):
+
+        def setUp(self):
+            self.ordered = [x for x in range(20)]
+            self.shuffled = [*self.ordered]
+            while self.ordered == self.shuffled:
+                shuffle(self.shuffled)
+            self.data = [randrange(300) for _ in range(2000)]
+
+        def test_select_kth(self):
+            for k in range(20):
+                self.assertEqual(k, select_kth(self.shuffled, k))
+            expected = sorted(self.data)
+            for k in (0, 1, 999, 1998, 1999):
+                self.assertEqual(expected[k], select_kth(self.data, k))
+            self.assertRaises(IndexError, select_kth, self.data, 2000)
+            self.assertRaises(IndexError, select_kth, [], 0)
+
+        def test_select_kth_key(self):
+            self.assertEqual(15,
+                             select_kth(self.shuffled, 4, key=lambda x: -x))
+
+        def test_select_kth_inplace(self):
+            data = [*self.data]
+            pivot = select_kth(data, 700, inplace=True)
+            self.assertTrue(all(x <= pivot for x in data[:700]))
+            self.assertTrue(all(x >= pivot for x in data[700:]))
+
+        def test_median_of_medians(self):
+            data = [*range(1000)]
+            shuffle(data)
+            pivot = data[_median_of_medians(data, 0, 999)]
+            self.assertTrue(280 <= pivot <= 720)
+            self.assertEqual(sorted(data), sorted(range(1000)))
+
+        def test_select_linear(self):
+            class Counted:
+                compares = 0
+
+                def __init__(self, x):
+                    self.x = x
+
+                def __lt__(self, other):
+                    Counted.compares += 1
+                    return self.x < other.x
+
+            n = 3000
+            for data in ([*range(n)], [*range(n, 0, -1)],
+                         [*range(0, n, 2), *range(n-1, 0, -2)]):
+                for bad in (0, BAD_PARTITIONS):
+                    srt = [*map(Counted, data)]
+                    Counted.compares = 0
+                    _select(srt, 0, n-1, n // 3, bad)
+                    self.assertEqual(sorted(data)[n//3], srt[n//3].x)
+                    self.assertLess(Counted.compares, 40 * n)
+
+        def test_partial_sort(self):
+            result = partial_sort(self.data, 100)
+            self.assertEqual(sorted(self.data)[:100], result[:100])
+            self.assertEqual(sorted(self.data), sorted(result))
+            self.assertEqual(self.ordered, partial_sort(self.shuffled, 50))
+            self.assertEqual(sorted(self.data, reverse=True)[:10],
+                             partial_sort(self.data, 10, reverse=True)[:10])
+            pairs = [(x % 5, i) for i, x in enumerate(self.data)]
+            first = lambda p: p[0]
+            self.assertEqual(sorted(pairs, key=first)[:40],
+                             partial_sort(pairs, 40, key=first)[:40])
+
+        def test_nsmallest(self):
+            self.assertEqual(sorted(self.data)[:100],
+                             nsmallest(100, iter(self.data)))
+            self.assertEqual(self.ordered, nsmallest(50, self.shuffled))
+            self.assertEqual([], nsmallest(0, self.data))
+            pairs = [(x % 5, i) for i, x in enumerate(self.data)]
+            first = lambda p: p[0]
+            self.assertEqual(sorted(pairs, key=first)[:30],
+                             nsmallest(30, pairs, key=first))
+
+        def test_nlargest(self):
+            self.assertEqual(sorted(self.data, reverse=True)[:100],
+                             nlargest(100, iter(self.data)))
+            pairs = [(x % 5, i) for i, x in enumerate(self.data)]
+            first = lambda p: p[0]
+            self.assertEqual(sorted(pairs, key=first, reverse=True)[:30],
+                             nlargest(30, pairs, key=first))
+
+
+    unittest.main()
@@ -1,19 +1,30 @@
 """Sorting Algorithm: Selection Sort"""
 
+from sorting.decorate import sort_by_key
 
-def selection_sort(a):
+
+def selection_sort(a, inplace=False, key=None, reverse=False):
     """Selection Sort
 
     Time complexity: O(n^2)
     Space complexity: O(1)
 
-    :param a: A list to be sorted
+    :param a: A sequence to be sorted
     :type a: list
-    :return: A new sorted list
+    :param inplace: Sort a itself (any mutable sequence, including
+        array.array and writable memoryview) rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :return: A new sorted list, or a itself when sorted in place
     :rtype: list
     """
 
-    b = [*a]
+    if key is not None or reverse:
+        return sort_by_key(selection_sort, a, key, reverse, inplace)
+    b = a if inplace else [*a]
     n = len(b)
     for i in range(n):
         min = i
@@ -27,6 +38,7 @@ def selection_sort(a):
 if __name__ == "__main__":
 
     import unittest
+    from array import array
     from random import shuffle
 
 
@@ -42,5 +54,23 @@ if __name__ == "__main__":
             self.assertEqual(self.ordered, selection_sort(self.shuffled))
             self.assertNotEqual(self.ordered, self.shuffled)
 
+        def test_inplace(self):
+            data = array('i', self.shuffled)
+            self.assertIs(data, selection_sort(data, inplace=True))
+            self.assertEqual(self.ordered, list(data))
+
+            view = memoryview(array('i', self.shuffled))
+            selection_sort(view, inplace=True)
+            self.assertEqual(self.ordered, view.tolist())
+
+        def test_key(self):
+            words = ['pear', 'fig', 'apple', 'kiwi', 'plum', 'date']
+            self.assertEqual(sorted(words, key=len),
+                             selection_sort(words, key=len))
+            self.assertEqual(sorted(words, key=len, reverse=True),
+                             selection_sort(words, key=len, reverse=True))
+            self.assertEqual(self.ordered[::-1],
+                             selection_sort(self.shuffled, reverse=True))
+
 
     unittest.main()
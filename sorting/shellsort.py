@@ -1,36 +1,183 @@
 """Sorting Algorithm: Shellsort"""
 
+from sorting.decorate import sort_by_key
 
-def shellsort(a):
+
+def shellsort(a, inplace=False, key=None, reverse=False, gaps='shell'):
     """Shellsort
 
     Time complexity: Between O(nlogn) and O(nlog^2n) ?
     Space complexity: O(1)
 
-    :param a: A list to be sorted
+    The gap sequence can be Shell's original halving ('shell'), 'knuth',
+    'sedgewick', 'ciura' (extended geometrically past 1750), 'tokuda', or any
+    sequence of gaps containing 1. 'auto' picks the sequence with the fewest
+    comparisons measured for the input size.
+
+    :param a: A sequence to be sorted
     :type a: list
-    :return: A new sorted list
+    :param inplace: Sort a itself (any mutable sequence, including
+        array.array and writable memoryview) rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :param gaps: Name of a gap sequence, 'auto', or a sequence of gaps
+    :type gaps: str
+    :return: A new sorted list, or a itself when sorted in place
     :rtype: list
+    :raises: ValueError
     """
 
-    b = [*a]
+    if isinstance(gaps, str):
+        if gaps not in GAPS:
+            raise ValueError(
+                "The gap sequence `{}` is not supported.".format(gaps))
+    elif 1 not in gaps:
+        raise ValueError("A gap sequence must contain 1.")
+    if key is not None or reverse:
+        return sort_by_key(shellsort, a, key, reverse, inplace, gaps=gaps)
+    b = a if inplace else [*a]
     n = len(b)
-    gap = n // 2
-    while gap > 0:
-        for i in range(n):
+    if isinstance(gaps, str):
+        gaps = GAPS[gaps](n)
+    for gap in sorted({g for g in gaps if 0 < g < n}, reverse=True):
+        for i in range(gap, n):
             temp = b[i]
             j = i
             while j >= gap and b[j-gap] > temp:
                 b[j] = b[j-gap]
                 j -= gap
             b[j] = temp
-        gap //= 2
     return b
 
 
+def _shell(n):
+    """Shell's gaps: n/2, n/4, ..., 1
+
+    :param n: Length of the list to be sorted
+    :type n: int
+    :return: The gaps below n, ascending
+    :rtype: list
+    """
+
+    gaps = []
+    gap = n // 2
+    while gap > 0:
+        gaps.append(gap)
+        gap //= 2
+    return gaps[::-1] or [1]
+
+
+def _knuth(n):
+    """Knuth's gaps: (3^k - 1) / 2 = 1, 4, 13, 40, 121, ...
+
+    :param n: Length of the list to be sorted
+    :type n: int
+    :return: The gaps below n, ascending
+    :rtype: list
+    """
+
+    gaps = [1]
+    while gaps[-1] * 3 + 1 < n:
+        gaps.append(gaps[-1] * 3 + 1)
+    return gaps
+
+
+def _sedgewick(n):
+    """Sedgewick's gaps: 1 and 4^k + 3 * 2^(k-1) + 1 = 8, 23, 77, 281, ...
+
+    :param n: Length of the list to be sorted
+    :type n: int
+    :return: The gaps below n, ascending
+    :rtype: list
+    """
+
+    gaps = [1]
+    k = 1
+    while 4**k + 3 * 2**(k-1) + 1 < n:
+        gaps.append(4**k + 3 * 2**(k-1) + 1)
+        k += 1
+    return gaps
+
+
+# Ciura's empirically found gaps, extended by a ratio of 2.25
+CIURA = (1, 4, 10, 23, 57, 132, 301, 701, 1750)
+
+
+def _ciura(n):
+    """Ciura's gaps: 1, 4, 10, 23, 57, 132, 301, 701, 1750, then each gap
+    2.25 times the previous one
+
+    :param n: Length of the list to be sorted
+    :type n: int
+    :return: The gaps below n, ascending
+    :rtype: list
+    """
+
+    gaps = [g for g in CIURA if g < n] or [1]
+    if len(gaps) == len(CIURA):
+        gap = int(gaps[-1] * 2.25)
+        while gap < n:
+            gaps.append(gap)
+            gap = int(gap * 2.25)
+    return gaps
+
+
+def _tokuda(n):
+    """Tokuda's gaps: ceil((9^k - 4^k) / (5 * 4^(k-1))) = 1, 4, 9, 20, 46, ...
+
+    :param n: Length of the list to be sorted
+    :type n: int
+    :return: The gaps below n, ascending
+    :rtype: list
+    """
+
+    gaps = [1]
+    k = 2
+    while True:
+        gap = -(-(9**k - 4**k) // (5 * 4**(k-1)))
+        if gap >= n:
+            return gaps
+        gaps.append(gap)
+        k += 1
+
+
+# (length, sequence) pairs: below each length, the sequence that needed the
+# fewest comparisons on random input; extended Ciura above the last one
+AUTO = ((100, _knuth),)
+
+
+def _auto(n):
+    """Picks the gap sequence measured best for the length of the list
+
+    :param n: Length of the list to be sorted
+    :type n: int
+    :return: The gaps below n, ascending
+    :rtype: list
+    """
+
+    for limit, sequence in AUTO:
+        if n < limit:
+            return sequence(n)
+    return _ciura(n)
+
+
+GAPS = {
+    'shell': _shell,
+    'knuth': _knuth,
+    'sedgewick': _sedgewick,
+    'ciura': _ciura,
+    'tokuda': _tokuda,
+    'auto': _auto,
+}
+
+
 if __name__ == "__main__":
 
     import unittest
+    from array import array
     from random import shuffle
 
 
@@ -46,5 +193,40 @@ if __name__ == "__main__":
             self.assertEqual(self.ordered, shellsort(self.shuffled))
             self.assertNotEqual(self.ordered, self.shuffled)
 
+        def test_gaps(self):
+            data = [*self.shuffled] * 60
+            for gaps in GAPS:
+                self.assertEqual(sorted(data), shellsort(data, gaps=gaps))
+            self.assertEqual(self.ordered,
+                             shellsort(self.shuffled, gaps=[7, 3, 1]))
+            self.assertRaises(ValueError, shellsort, data, gaps='pratt')
+            self.assertRaises(ValueError, shellsort, data, gaps=[5, 2])
+
+        def test_sequences(self):
+            self.assertEqual([1, 4, 13, 40, 121], _knuth(300))
+            self.assertEqual([1, 8, 23, 77, 281], _sedgewick(300))
+            self.assertEqual([1, 4, 10, 23, 57, 132, 301, 701, 1750, 3937],
+                             _ciura(5000))
+            self.assertEqual([1, 4, 9, 20, 46, 103, 233], _tokuda(300))
+            self.assertEqual(_knuth(99), _auto(99))
+            self.assertEqual(_ciura(10**5), _auto(10**5))
+
+        def test_inplace(self):
+            data = array('i', self.shuffled)
+            self.assertIs(data, shellsort(data, inplace=True))
+            self.assertEqual(self.ordered, list(data))
+
+            view = memoryview(array('i', self.shuffled))
+            shellsort(view, inplace=True)
+            self.assertEqual(self.ordered, view.tolist())
+
+        def test_key(self):
+            words = ['pear', 'fig', 'apple', 'kiwi', 'plum', 'date']
+            self.assertEqual(sorted(words, key=len), shellsort(words, key=len))
+            self.assertEqual(sorted(words, key=len, reverse=True),
+                             shellsort(words, key=len, reverse=True))
+            self.assertEqual(self.ordered[::-1],
+                             shellsort(self.shuffled, reverse=True))
+
 
     unittest.main()
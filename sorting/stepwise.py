@@ -0,0 +1,395 @@
+"""Sorting Utility: Resumable, Time-Sliced Sorting
+
+Sorts a large list a bounded amount of work at a time, so that an asyncio
+event loop (or any other cooperative scheduler) can run other tasks between
+the slices instead of stalling for the whole sort, or hands the whole sort to
+a thread or process pool in one call.
+
+Example:
+
+    sorted_items = await sort_async(items, key=itemgetter('score'))
+    sorted_items = await sort_in_executor(items, quicksort, executor=pool)
+"""
+
+import asyncio
+import time
+from functools import partial
+
+from sorting.insertion_sort import _binary_insertion_sort
+from sorting.mergesort import mergesort
+
+# runs of this many items are insertion sorted before merging begins
+CUTOFF = 16
+
+# number of items merged or copied per step
+STEP_SIZE = 4096
+
+# seconds of sorting between two yields to the event loop
+TIME_SLICE = 0.002
+
+
+class StepwiseSort:
+    """A bottom-up mergesort that can be paused after any step and resumed
+    later. Each step copies, decorates with keys, merges or lays out at most
+    step_size items (plus one insertion sorted run), however long the list
+    is; creating the sort does no work at all. Stable.
+
+    Time complexity: O(nlogn) in total
+    Space complexity: O(n)
+    """
+
+    __slots__ = '_steps', '_result', 'done'
+
+    def __init__(self, a, inplace=False, key=None, reverse=False,
+                 step_size=STEP_SIZE):
+        """StepwiseSort constructor
+
+        :param a: A sequence to be sorted. In between the steps of an in
+            place sort, a is left partially sorted.
+        :type a: list
+        :param inplace: Sort a itself rather than a copy
+        :type inplace: bool
+        :param key: Function computing the comparison key of an item
+        :type key: function
+        :param reverse: Sort in descending order
+        :type reverse: bool
+        :param step_size: Number of items handled per step
+        :type step_size: int
+        """
+
+        self._steps = _sort_steps(a, inplace, key, reverse,
+                                  max(step_size, 1))
+        self._result = None
+        self.done = False
+
+    def step(self):
+        """Runs one step of the sort
+
+        :return: Whether the sort is finished
+        :rtype: bool
+        """
+
+        if not self.done:
+            try:
+                next(self._steps)
+            except StopIteration as stop:
+                self._result = stop.value
+                self._steps = None
+                self.done = True
+        return self.done
+
+    def run_for(self, seconds):
+        """Runs steps until the sort is finished or the given time is up
+
+        :param seconds: Time to run for, at least one step is always run
+        :type seconds: float
+        :return: Whether the sort is finished
+        :rtype: bool
+        """
+
+        deadline = time.perf_counter() + seconds
+        while not self.step() and time.perf_counter() < deadline:
+            pass
+        return self.done
+
+    def run(self):
+        """Runs the sort to the end
+
+        :return: A new sorted list, or a itself when sorted in place
+        :rtype: list
+        """
+
+        while not self.step():
+            pass
+        return self._result
+
+    @property
+    def result(self):
+        """The sorted list
+
+        :return: A new sorted list, or a itself when sorted in place
+        :rtype: list
+        """
+
+        if not self.done:
+            raise Exception("StepwiseSort is not finished.")
+        return self._result
+
+
+async def sort_async(a, inplace=False, key=None, reverse=False,
+                     time_slice=TIME_SLICE, step_size=STEP_SIZE):
+    """Sorts a sequence on the running event loop, a time slice at a time,
+    yielding to the other tasks in between the slices. Stable.
+
+    :param a: A sequence to be sorted
+    :type a: list
+    :param inplace: Sort a itself rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :param time_slice: Seconds to sort for before each yield to the loop
+    :type time_slice: float
+    :param step_size: Number of items handled per step
+    :type step_size: int
+    :return: A new sorted list, or a itself when sorted in place
+    :rtype: list
+    """
+
+    sorter = StepwiseSort(a, inplace, key, reverse, step_size)
+    while not sorter.run_for(time_slice):
+        await asyncio.sleep(0)
+    return sorter.result
+
+
+async def sort_in_executor(a, algorithm=mergesort, executor=None, **options):
+    """Runs any of the package's sort functions in an executor, leaving the
+    event loop free while it runs.
+
+    A thread pool shares a with the sort, but the sort holds the GIL except
+    at the interpreter's switch interval. A process pool runs it truly in
+    parallel, but pickles a (and the sorted result) and so needs a
+    picklable key; it cannot sort a in place.
+
+    :param a: A sequence to be sorted
+    :type a: list
+    :param algorithm: The sort function to run, e.g. sorting.quicksort
+    :type algorithm: function
+    :param executor: A concurrent.futures executor, defaults to the loop's
+        default thread pool
+    :type executor: Executor
+    :param options: Keyword arguments to call the sort function with, e.g.
+        key or reverse
+    :return: A new sorted list, or a itself when sorted in place
+    :rtype: list
+    """
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor,
+                                      partial(algorithm, a, **options))
+
+
+def _sort_steps(a, inplace, key, reverse, step_size):
+    """Sorts a sequence step_size items at a time: copies it (or pairs the
+    key of every item with its index, as sorting.decorate does), sorts the
+    copy by _merge_steps(), then lays the items out in order
+
+    :param a: A sequence to be sorted
+    :type a: list
+    :param inplace: Sort a itself rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :param step_size: Number of items handled per step
+    :type step_size: int
+    :return: Generator yielding None after each step, and returning a new
+        sorted list, or a itself when sorted in place
+    :rtype: generator
+    """
+
+    n = len(a)
+    if key is None and not reverse:
+        if inplace:
+            srt = a
+        else:
+            srt = []
+            for lo in range(0, n, step_size):
+                srt.extend(a[lo:lo+step_size])
+                yield
+        yield from _merge_steps(srt, step_size)
+        return srt
+
+    # equal keys are ordered by descending index for a reverse sort, so that
+    # reading the result backwards leaves them in their original order
+    sign = -1 if reverse else 1
+    b, decorated = [], []
+    for lo in range(0, n, step_size):
+        chunk = [*a[lo:lo+step_size]]
+        b.extend(chunk)
+        keys = chunk if key is None else map(key, chunk)
+        decorated.extend(zip(keys, range(sign * lo,
+                                         sign * (lo + len(chunk)), sign)))
+        yield
+    yield from _merge_steps(decorated, step_size)
+
+    order = range(n-1, -1, -1) if reverse else range(n)
+    result = a if inplace else []
+    for lo in range(0, n, step_size):
+        items = []
+        for j in order[lo:lo+step_size]:
+            items.append(b[abs(decorated[j][1])])
+            # free the pairs (and keys) a step at a time rather than all at
+            # once when the sort finishes
+            decorated[j] = None
+        if inplace:
+            for k, item in enumerate(items, lo):
+                a[k] = item
+        else:
+            result.extend(items)
+        yield
+    return result
+
+
+def _merge_steps(srt, step_size):
+    """Sorts a list in place by bottom-up mergesort, pausing after every
+    step_size items merged or copied
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param step_size: Number of items merged per step
+    :type step_size: int
+    :return: Generator yielding None after each step
+    :rtype: generator
+    """
+
+    n = len(srt)
+    work = 0
+    for lo in range(0, n, CUTOFF):
+        _binary_insertion_sort(srt, lo, min(lo+CUTOFF, n), lo+1)
+        work += CUTOFF
+        if work >= step_size:
+            work = 0
+            yield
+
+    src, dst = srt, [None] * n
+    width = CUTOFF
+    while width < n:
+        for lo in range(0, n, 2*width):
+            mid, hi = min(lo+width, n), min(lo+2*width, n)
+            i, j = lo, mid
+            for k in range(lo, hi):
+                if i < mid and (j >= hi or not src[j] < src[i]):
+                    dst[k] = src[i]
+                    i += 1
+                else:
+                    dst[k] = src[j]
+                    j += 1
+                work += 1
+                if work >= step_size:
+                    work = 0
+                    yield
+        src, dst = dst, src
+        width *= 2
+
+    if src is not srt:
+        for k in range(n):
+            srt[k] = src[k]
+            work += 1
+            if work >= step_size:
+                work = 0
+                yield
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from concurrent.futures import ThreadPoolExecutor
+    from random import randrange
+
+    from sorting.quicksort import quicksort
+
+
+    class TestStepwise(unittest.TestCase):
+
+        def setUp(self):
+            self.data = [randrange(500) for _ in range(3000)]
+
+        def test_steps(self):
+            sorter = StepwiseSort(self.data, step_size=100)
+            steps = 1
+            while not sorter.step():
+                steps += 1
+            self.assertEqual(sorted(self.data), sorter.result)
+            self.assertGreater(steps, 3000 * 8 // 100)
+            self.assertTrue(sorter.step())
+
+        def test_unfinished(self):
+            sorter = StepwiseSort(self.data, step_size=100)
+            sorter.step()
+            self.assertFalse(sorter.done)
+            self.assertRaises(Exception, lambda: sorter.result)
+
+        def test_key_reverse_inplace(self):
+            pairs = [(x, i) for i, x in enumerate(self.data)]
+            first = lambda p: p[0]
+            self.assertEqual(sorted(pairs, key=first),
+                             StepwiseSort(pairs, key=first).run())
+            self.assertEqual(
+                sorted(pairs, key=first, reverse=True),
+                StepwiseSort(pairs, key=first, reverse=True).run())
+            data = [*self.data]
+            self.assertIs(data, StepwiseSort(data, inplace=True).run())
+            self.assertEqual(sorted(self.data), data)
+            self.assertEqual([], StepwiseSort([]).run())
+
+        def test_bounded_steps(self):
+            work = [0]
+
+            class _Key:
+                """Counts its comparisons"""
+
+                __slots__ = 'x',
+
+                def __init__(self, x):
+                    work[0] += 1
+                    self.x = x
+
+                def __lt__(self, other):
+                    work[0] += 1
+                    return self.x < other.x
+
+            class _Counted(list):
+                """Counts writes to its items"""
+
+                def __setitem__(self, i, value):
+                    work[0] += 1
+                    super().__setitem__(i, value)
+
+            data = _Counted(self.data)
+            for reverse in (False, True):
+                work[0] = 0
+                sorter = StepwiseSort(data, True, _Key, reverse, 100)
+                self.assertEqual(0, work[0])
+                most = 0
+                while not sorter.done:
+                    work[0] = 0
+                    sorter.step()
+                    most = max(most, work[0])
+                # a step may also insertion sort runs of CUTOFF items
+                self.assertLessEqual(most, 8 * 100)
+                self.assertEqual(sorted(self.data, reverse=reverse), data)
+
+        def test_sort_async(self):
+            ticks = []
+
+            async def ticker():
+                while True:
+                    ticks.append(None)
+                    await asyncio.sleep(0)
+
+            async def main():
+                task = asyncio.create_task(ticker())
+                result = await sort_async(self.data * 10, time_slice=0.0001,
+                                          step_size=64)
+                task.cancel()
+                return result
+
+            self.assertEqual(sorted(self.data * 10), asyncio.run(main()))
+            self.assertGreater(len(ticks), 1)
+
+        def test_sort_in_executor(self):
+            async def main():
+                with ThreadPoolExecutor(1) as executor:
+                    return await sort_in_executor(
+                        self.data, quicksort, executor, reverse=True)
+
+            self.assertEqual(sorted(self.data, reverse=True),
+                             asyncio.run(main()))
+            self.assertEqual(sorted(self.data),
+                             asyncio.run(sort_in_executor(self.data)))
+
+
+    unittest.main()
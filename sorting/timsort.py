@@ -0,0 +1,505 @@
+"""Sorting Algorithm: Timsort"""
+
+from sorting.decorate import sort_by_key
+from sorting.insertion_sort import _binary_insertion_sort
+
+# number of consecutive wins by one run before merges switch to galloping
+MIN_GALLOP = 7
+
+
+def timsort(a, inplace=False, key=None, reverse=False):
+    """Timsort: an adaptive, natural-run mergesort
+
+    Splits the list into ascending and (strictly) descending runs, extends
+    short runs to a minimum length with binary insertion sort, and merges the
+    runs on a stack kept balanced so each merge joins runs of similar length.
+    Merges switch to galloping when one run keeps winning, so presorted and
+    nearly sorted data are handled in close to linear time. Stable.
+
+    Time complexity: Between O(n) and O(nlogn)
+    Space complexity: O(n)
+
+    :param a: A sequence to be sorted
+    :type a: list
+    :param inplace: Sort a itself (any mutable sequence, including
+        array.array and writable memoryview) rather than a copy
+    :type inplace: bool
+    :param key: Function computing the comparison key of an item
+    :type key: function
+    :param reverse: Sort in descending order
+    :type reverse: bool
+    :return: A new sorted list, or a itself when sorted in place
+    :rtype: list
+    """
+
+    if key is not None or reverse:
+        return sort_by_key(timsort, a, key, reverse, inplace)
+    b = a if inplace else [*a]
+    _sort(b)
+    return b
+
+
+def _sort(srt):
+    """Sorts a list in place by finding natural runs and merging them
+
+    :param srt: The list being sorted
+    :type srt: list
+    """
+
+    n = len(srt)
+    if n < 2:
+        return
+    min_run = _min_run(n)
+    state = _MergeState(srt)
+    lo = 0
+    while lo < n:
+        run = _count_run(srt, lo, n)
+        if run < min_run:
+            force = min(min_run, n - lo)
+            _binary_insertion_sort(srt, lo, lo+force, lo+run)
+            run = force
+        state.push_run(lo, run)
+        state.merge_collapse()
+        lo += run
+    state.merge_force_collapse()
+
+
+def _min_run(n):
+    """Computes the minimum run length for a list, between 32 and 64, chosen
+    so that n / min_run is close to (but no more than) a power of two
+
+    :param n: Length of the list
+    :type n: int
+    :return: Minimum run length
+    :rtype: int
+    """
+
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _count_run(srt, lo, hi):
+    """Reports the length of the run beginning at lo, reversing it in place
+    first if it is strictly descending
+
+    :param srt: The list being sorted
+    :type srt: list
+    :param lo: The beginning index of the run
+    :type lo: int
+    :param hi: The index just past the end of the list
+    :type hi: int
+    :return: Length of the run
+    :rtype: int
+    """
+
+    i = lo + 1
+    if i == hi:
+        return 1
+    if srt[i] < srt[lo]:
+        while i + 1 < hi and srt[i+1] < srt[i]:
+            i += 1
+        srt[lo:i+1] = srt[lo:i+1][::-1]
+    else:
+        while i + 1 < hi and not srt[i+1] < srt[i]:
+            i += 1
+    return i - lo + 1
+
+
+def _copy(srt, lo, hi):
+    """Copies srt[lo:hi] into a sequence of the same kind. Slicing a
+    memoryview only makes a view, so its items are copied out explicitly.
+
+    :param srt: The sequence being sorted
+    :type srt: list
+    :param lo: The beginning index of the slice
+    :type lo: int
+    :param hi: The index just past the end of the slice
+    :type hi: int
+    :return: A copy of the slice
+    :rtype: list
+    """
+
+    if isinstance(srt, memoryview):
+        return memoryview(srt[lo:hi].tobytes()).cast(srt.format)
+    return srt[lo:hi]
+
+
+def _gallop_left(key, srt, base, n, hint):
+    """Locates the leftmost position at which key could be inserted into the
+    ordered run srt[base:base+n], searching outward from hint with doubling
+    steps before finishing with a binary search
+
+    :param key: The item to locate
+    :param srt: The list holding the run
+    :type srt: list
+    :param base: The beginning index of the run
+    :type base: int
+    :param n: Length of the run
+    :type n: int
+    :param hint: Offset in the run to start searching from
+    :type hint: int
+    :return: Offset k such that srt[base+k-1] < key <= srt[base+k]
+    :rtype: int
+    """
+
+    last, ofs = 0, 1
+    if srt[base+hint] < key:
+        max_ofs = n - hint
+        while ofs < max_ofs and srt[base+hint+ofs] < key:
+            last, ofs = ofs, (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last, ofs = last + hint, ofs + hint
+    else:
+        max_ofs = hint + 1
+        while ofs < max_ofs and not srt[base+hint-ofs] < key:
+            last, ofs = ofs, (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last, ofs = hint - ofs, hint - last
+    last += 1
+    while last < ofs:
+        m = (last + ofs) // 2
+        if srt[base+m] < key:
+            last = m + 1
+        else:
+            ofs = m
+    return ofs
+
+
+def _gallop_right(key, srt, base, n, hint):
+    """Locates the rightmost position at which key could be inserted into the
+    ordered run srt[base:base+n], searching outward from hint with doubling
+    steps before finishing with a binary search
+
+    :param key: The item to locate
+    :param srt: The list holding the run
+    :type srt: list
+    :param base: The beginning index of the run
+    :type base: int
+    :param n: Length of the run
+    :type n: int
+    :param hint: Offset in the run to start searching from
+    :type hint: int
+    :return: Offset k such that srt[base+k-1] <= key < srt[base+k]
+    :rtype: int
+    """
+
+    last, ofs = 0, 1
+    if key < srt[base+hint]:
+        max_ofs = hint + 1
+        while ofs < max_ofs and key < srt[base+hint-ofs]:
+            last, ofs = ofs, (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last, ofs = hint - ofs, hint - last
+    else:
+        max_ofs = n - hint
+        while ofs < max_ofs and not key < srt[base+hint+ofs]:
+            last, ofs = ofs, (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last, ofs = last + hint, ofs + hint
+    last += 1
+    while last < ofs:
+        m = (last + ofs) // 2
+        if key < srt[base+m]:
+            ofs = m
+        else:
+            last = m + 1
+    return ofs
+
+
+class _MergeState:
+    """The stack of pending runs for one sort, and the merges between them"""
+
+    __slots__ = 'srt', 'runs', 'min_gallop'
+
+    def __init__(self, srt):
+        """MergeState constructor
+
+        :param srt: The list being sorted
+        :type srt: list
+        """
+
+        self.srt = srt
+        self.runs = []
+        self.min_gallop = MIN_GALLOP
+
+    def push_run(self, base, n):
+        """Adds a run to the top of the stack
+
+        :param base: The beginning index of the run
+        :type base: int
+        :param n: Length of the run
+        :type n: int
+        """
+
+        self.runs.append((base, n))
+
+    def merge_collapse(self):
+        """Merges runs at the top of the stack until, for the top three run
+        lengths A, B, C (C on top): A > B + C and B > C, which keeps the stack
+        O(logn) deep and the merges balanced
+        """
+
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if ((n > 0 and runs[n-1][1] <= runs[n][1] + runs[n+1][1]) or
+                    (n > 1 and runs[n-2][1] <= runs[n-1][1] + runs[n][1])):
+                if runs[n-1][1] < runs[n+1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n+1][1]:
+                break
+            self._merge_at(n)
+
+    def merge_force_collapse(self):
+        """Merges every run left on the stack into one"""
+
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n-1][1] < runs[n+1][1]:
+                n -= 1
+            self._merge_at(n)
+
+    def _merge_at(self, i):
+        """Merges the runs at stack positions i and i+1
+
+        :param i: Stack index of the left run
+        :type i: int
+        """
+
+        srt = self.srt
+        base_a, len_a = self.runs[i]
+        base_b, len_b = self.runs[i+1]
+        self.runs[i] = (base_a, len_a + len_b)
+        del self.runs[i+1]
+
+        # items of A already below B's first, and items of B already above
+        # A's last, are in their final place
+        k = _gallop_right(srt[base_b], srt, base_a, len_a, 0)
+        base_a += k
+        len_a -= k
+        if len_a == 0:
+            return
+        len_b = _gallop_left(srt[base_a+len_a-1], srt, base_b, len_b, len_b-1)
+        if len_b == 0:
+            return
+        if len_a <= len_b:
+            self._merge_lo(base_a, len_a, base_b, len_b)
+        else:
+            self._merge_hi(base_a, len_a, base_b, len_b)
+
+    def _merge_lo(self, base_a, len_a, base_b, len_b):
+        """Merges two adjacent runs left to right, copying the (shorter) left
+        run out of the way first
+
+        :param base_a: The beginning index of the left run
+        :type base_a: int
+        :param len_a: Length of the left run
+        :type len_a: int
+        :param base_b: The beginning index of the right run
+        :type base_b: int
+        :param len_b: Length of the right run
+        :type len_b: int
+        """
+
+        srt = self.srt
+        tmp = _copy(srt, base_a, base_a+len_a)
+        i, j, dest = 0, base_b, base_a
+        end_b = base_b + len_b
+        min_gallop = self.min_gallop
+        while i < len_a and j < end_b:
+            count_a = count_b = 0
+            while i < len_a and j < end_b:
+                if srt[j] < tmp[i]:
+                    srt[dest] = srt[j]
+                    j += 1
+                    count_b += 1
+                    count_a = 0
+                    dest += 1
+                    if count_b >= min_gallop:
+                        break
+                else:
+                    srt[dest] = tmp[i]
+                    i += 1
+                    count_a += 1
+                    count_b = 0
+                    dest += 1
+                    if count_a >= min_gallop:
+                        break
+            if i >= len_a or j >= end_b:
+                break
+
+            # one run keeps winning: copy whole stretches at a time
+            min_gallop += 1
+            while True:
+                min_gallop -= min_gallop > 1
+                count_a = _gallop_right(srt[j], tmp, i, len_a - i, 0)
+                srt[dest:dest+count_a] = tmp[i:i+count_a]
+                dest += count_a
+                i += count_a
+                if i >= len_a:
+                    break
+                count_b = _gallop_left(tmp[i], srt, j, end_b - j, 0)
+                srt[dest:dest+count_b] = srt[j:j+count_b]
+                dest += count_b
+                j += count_b
+                if j >= end_b:
+                    break
+                srt[dest] = tmp[i]
+                dest += 1
+                i += 1
+                if i >= len_a:
+                    break
+                if count_a < MIN_GALLOP and count_b < MIN_GALLOP:
+                    break
+            min_gallop += 1
+        self.min_gallop = max(min_gallop, 1)
+        srt[dest:dest+len_a-i] = tmp[i:]
+
+    def _merge_hi(self, base_a, len_a, base_b, len_b):
+        """Merges two adjacent runs right to left, copying the (shorter) right
+        run out of the way first
+
+        :param base_a: The beginning index of the left run
+        :type base_a: int
+        :param len_a: Length of the left run
+        :type len_a: int
+        :param base_b: The beginning index of the right run
+        :type base_b: int
+        :param len_b: Length of the right run
+        :type len_b: int
+        """
+
+        srt = self.srt
+        tmp = _copy(srt, base_b, base_b+len_b)
+        i, j, dest = base_a + len_a - 1, len_b - 1, base_b + len_b - 1
+        min_gallop = self.min_gallop
+        while i >= base_a and j >= 0:
+            count_a = count_b = 0
+            while i >= base_a and j >= 0:
+                if tmp[j] < srt[i]:
+                    srt[dest] = srt[i]
+                    i -= 1
+                    count_a += 1
+                    count_b = 0
+                    dest -= 1
+                    if count_a >= min_gallop:
+                        break
+                else:
+                    srt[dest] = tmp[j]
+                    j -= 1
+                    count_b += 1
+                    count_a = 0
+                    dest -= 1
+                    if count_b >= min_gallop:
+                        break
+            if i < base_a or j < 0:
+                break
+
+            # one run keeps winning: copy whole stretches at a time
+            min_gallop += 1
+            while True:
+                min_gallop -= min_gallop > 1
+                k = i - base_a + 1
+                count_a = k - _gallop_right(tmp[j], srt, base_a, k, k-1)
+                srt[dest-count_a+1:dest+1] = srt[i-count_a+1:i+1]
+                dest -= count_a
+                i -= count_a
+                if i < base_a:
+                    break
+                count_b = j + 1 - _gallop_left(srt[i], tmp, 0, j+1, j)
+                srt[dest-count_b+1:dest+1] = tmp[j-count_b+1:j+1]
+                dest -= count_b
+                j -= count_b
+                if j < 0:
+                    break
+                srt[dest] = srt[i]
+                dest -= 1
+                i -= 1
+                if i < base_a:
+                    break
+                if count_a < MIN_GALLOP and count_b < MIN_GALLOP:
+                    break
+            min_gallop += 1
+        self.min_gallop = max(min_gallop, 1)
+        srt[base_a:base_a+j+1] = tmp[:j+1]
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from array import array
+    from random import randrange, shuffle
+
+
+    class _Pair(tuple):
+        """Compares on the first item only, to observe stability"""
+
+        def __new__(cls, key, value):
+            return super().__new__(cls, (key, value))
+
+        def __lt__(self, other):
+            return self[0] < other[0]
+
+
+    class TestTimsort(unittest.TestCase):
+
+        def setUp(self):
+            self.ordered = [x for x in range(20)]
+            self.shuffled = [*self.ordered]
+            while self.ordered == self.shuffled:
+                shuffle(self.shuffled)
+
+        def test_timsort(self):
+            self.assertEqual(self.ordered, timsort(self.shuffled))
+            self.assertNotEqual(self.ordered, self.shuffled)
+            self.assertEqual([], timsort([]))
+
+        def test_inplace(self):
+            data = array('i', self.shuffled)
+            self.assertIs(data, timsort(data, inplace=True))
+            self.assertEqual(self.ordered, list(data))
+
+            view = memoryview(array('i', self.shuffled))
+            timsort(view, inplace=True)
+            self.assertEqual(self.ordered, view.tolist())
+
+        def test_key(self):
+            words = ['pear', 'fig', 'apple', 'kiwi', 'plum', 'date']
+            self.assertEqual(sorted(words, key=len), timsort(words, key=len))
+            self.assertEqual(sorted(words, key=len, reverse=True),
+                             timsort(words, key=len, reverse=True))
+            self.assertEqual(self.ordered[::-1],
+                             timsort(self.shuffled, reverse=True))
+
+        def test_large(self):
+            for n in (63, 64, 65, 1000, 5000):
+                data = [randrange(n // 2) for _ in range(n)]
+                self.assertEqual(sorted(data), timsort(data))
+
+        def test_runs(self):
+            data = list(range(2000))
+            self.assertEqual(data, timsort(data))
+            self.assertEqual(data, timsort(data[::-1]))
+            pipe = [*range(1000), *range(1000, 0, -1)]
+            self.assertEqual(sorted(pipe), timsort(pipe))
+            blocks = [*range(500, 3000), *range(500), *range(3000, 3200)]
+            self.assertEqual(sorted(blocks), timsort(blocks))
+
+        def test_nearly_sorted(self):
+            data = list(range(5000))
+            for _ in range(50):
+                i, j = randrange(5000), randrange(5000)
+                data[i], data[j] = data[j], data[i]
+            self.assertEqual(sorted(data), timsort(data))
+
+        def test_stable(self):
+            pairs = [_Pair(randrange(10), i) for i in range(3000)]
+            self.assertEqual(sorted(pairs, key=lambda p: p[0]),
+                             [tuple(p) for p in timsort(pairs)])
+
+
+    unittest.main()